@@ -0,0 +1,119 @@
+# bench_import.py
+"""Benchmark waktu import dingin (cold start) modul praktikum 11-14.
+
+Setiap modul di-import di interpreter baru dengan `python -X importtime`.
+Waktu kumulatif semua import tingkat atas setelah interpreter siap
+dijumlahkan, lalu diambil median dari beberapa putaran dan dibandingkan
+dengan anggaran per modul. Import juga harus bebas efek samping: tidak
+mencetak apa pun ke stdout dan tidak memasang handler pada root logger.
+
+Contoh:
+    python bench_import.py
+    python bench_import.py --repeat 7 --scale 1.5
+Exit code 1 jika ada modul yang melewati anggaran atau punya efek samping.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MARKER = "--- mulai import ---"
+
+# Anggaran waktu import kumulatif (ms) per modul, sekitar 1.5x hasil ukur
+# di mesin pengembangan (1 vCPU). Sebagian besar waktu adalah stdlib yang
+# memang dipakai (logging, dataclasses, asyncio); sisanya harus tetap kecil.
+BUDGETS = {
+    "praktikum 11.refactor_solid": 50,
+    "praktikum 11.tugas_mandiri": 50,
+    "praktikum 12.refactor_solid": 65,
+    "praktikum 12.async_checkout": 100,
+    "praktikum 12.tugas_mandiri": 65,
+    "praktikum 13.repositories": 70,
+    "praktikum 13.services": 65,
+    "praktikum 13.search": 65,
+    "praktikum 13.tugas_mandiri": 80,
+    "praktikum 13.pos_server": 130,
+    "praktikum 14.diskon_services": 15,
+}
+
+# Dijalankan di interpreter baru. __import__ dipakai karena nama paket
+# (nama folder) mengandung spasi. Exit code 3 = ada handler di root logger;
+# logging tidak di-import di sini agar tidak ikut terhitung.
+PROBE = """
+import sys
+sys.stderr.write({marker!r} + "\\n")
+__import__({module!r})
+logging = sys.modules.get("logging")
+sys.exit(3 if logging and logging.getLogger().handlers else 0)
+"""
+
+
+class ImportProbeError(Exception):
+    """Import modul gagal atau menimbulkan efek samping."""
+
+
+def parse_importtime(stderr: str) -> float:
+    """Menjumlahkan waktu kumulatif (detik) import tingkat atas setelah MARKER."""
+    total_us = 0
+    _, _, lines = stderr.partition(MARKER)
+    for line in lines.splitlines():
+        # Format: "import time:  <self> | <kumulatif> | <indentasi><nama>"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  "):
+            continue  # hanya baris tingkat atas; anaknya sudah terhitung kumulatif
+        total_us += int(cumulative)
+    return total_us / 1e6
+
+
+def probe(module: str) -> float:
+    """Mengukur satu import dingin; melempar ImportProbeError jika ada efek samping."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(marker=MARKER, module=module)],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode == 3:
+        raise ImportProbeError("memasang handler pada root logger saat import")
+    if proc.returncode != 0:
+        raise ImportProbeError(proc.stderr.strip().splitlines()[-1])
+    if proc.stdout:
+        raise ImportProbeError(f"mencetak ke stdout saat import: {proc.stdout[:60]!r}")
+    return parse_importtime(proc.stderr)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="pengali anggaran, mis. 2.0 untuk mesin CI yang lambat")
+    parser.add_argument("--filter", default="", help="hanya ukur modul yang namanya mengandung teks ini")
+    args = parser.parse_args(argv)
+
+    failures = []
+    for module, budget_ms in BUDGETS.items():
+        if args.filter not in module:
+            continue
+        budget_ms *= args.scale
+        try:
+            samples = [probe(module) for _ in range(args.repeat)]
+        except ImportProbeError as e:
+            print(f"{module:<32} GAGAL: {e}")
+            failures.append(module)
+            continue
+        median_ms = statistics.median(samples) * 1e3
+        status = "ok" if median_ms <= budget_ms else "LEWAT ANGGARAN"
+        print(f"{module:<32} median {median_ms:7.1f} ms  (anggaran {budget_ms:5.0f} ms)  {status}")
+        if median_ms > budget_ms:
+            failures.append(module)
+
+    if failures:
+        print(f"{len(failures)} modul gagal memenuhi anggaran import")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+# run_benchmarks.py
+"""Benchmark harness untuk seluruh service praktikum 12-14.
+
+Setiap benchmark dijalankan berulang kali (gaya timeit/pyperf): satu
+putaran warmup, lalu `repeat` putaran berisi `number` pemanggilan. Hasil
+per operasi (min, median, mean) disimpan sebagai JSON dan dapat
+dibandingkan dengan baseline.
+
+Contoh:
+    python run_benchmarks.py --save-baseline baseline.json
+    python run_benchmarks.py --baseline baseline.json --threshold 0.15
+Exit code 1 jika ada benchmark yang median-nya melambat melebihi threshold.
+"""
+import argparse
+import importlib
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BENCHMARKS = {}
+
+
+def load_module(folder: str, name: str):
+    """Meng-import modul `name` dari paket folder praktikum (mis. "praktikum 13").
+
+    Folder induk praktikum ditambahkan ke sys.path; setiap folder adalah
+    paket sehingga import relatif di dalamnya tetap berjalan.
+    """
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    return importlib.import_module(f"{folder}.{name}")
+
+
+def benchmark(name: str, number: int = 1):
+    """Mendaftarkan factory benchmark. Factory mengembalikan fungsi tanpa argumen."""
+    def decorator(factory):
+        BENCHMARKS[name] = (factory, number)
+        return factory
+    return decorator
+
+
+# ==============================
+# DEFINISI BENCHMARK
+# ==============================
+def _diskon():
+    return load_module("praktikum 14", "diskon_services")
+
+
+def _pos(name: str):
+    return load_module("praktikum 13", name)
+
+
+def _registrasi():
+    return load_module("praktikum 12", "tugas_mandiri")
+
+
+def _checkout():
+    return load_module("praktikum 12", "refactor_solid")
+
+
+@benchmark("diskon.hitung_diskon", number=10_000)
+def bench_hitung_diskon():
+    calc = _diskon().DiskonCalculator()
+    return lambda: calc.hitung_diskon(999, 33)
+
+
+def _cart_add_item(lines: int):
+    models, services = _pos("models"), _pos("services")
+    products = [models.Product(f"P{i:06d}", f"Produk {i}", 1000 + i) for i in range(lines)]
+
+    def run():
+        cart = services.ShoppingCart()
+        for product in products:
+            cart.add_item(product, 2)
+    return run
+
+
+def _cart_total_price(lines: int):
+    models, services = _pos("models"), _pos("services")
+    cart = services.ShoppingCart()
+    cart.add_items((models.Product(f"P{i:06d}", f"Produk {i}", 1000 + i), 1) for i in range(lines))
+    return lambda: cart.total_price
+
+
+for _lines in (10, 100, 1_000, 10_000, 100_000):
+    benchmark(f"cart.add_item[{_lines}]", number=max(1, 10_000 // _lines))(
+        lambda lines=_lines: _cart_add_item(lines))
+    benchmark(f"cart.total_price[{_lines}]", number=10_000)(
+        lambda lines=_lines: _cart_total_price(lines))
+
+
+def _cart_pricing(lines: int):
+    models, pricing = _pos("models"), _pos("pricing")
+    items = [models.CartItem(models.Product(f"P{i:06d}", f"Produk {i}", 1000 + i), 1 + i % 50)
+             for i in range(lines)]
+    pipeline = pricing.PricingPipeline({f"P{i:06d}": 10 for i in range(0, lines, 3)}, cart_discount=5)
+    return lambda: pipeline.price(items)
+
+
+for _lines in (100, 10_000):
+    benchmark(f"pricing.price[{_lines}]", number=max(1, 10_000 // _lines))(
+        lambda lines=_lines: _cart_pricing(lines))
+
+
+@benchmark("repository.get_by_id[memory]", number=10_000)
+def bench_repo_memory():
+    repo = _pos("repositories").ProductRepository()
+    return lambda: repo.get_by_id("P002")
+
+
+@benchmark("repository.get_by_id[sqlite]", number=10_000)
+def bench_repo_sqlite():
+    models, repositories = _pos("models"), _pos("repositories")
+    repo = repositories.SqliteProductRepository()
+    repo.add_many(models.Product(f"P{i:06d}", f"Produk {i}", i) for i in range(100_000))
+    return lambda: repo.get_by_id("P054321")
+
+
+@benchmark("repository.get_by_id[cached]", number=10_000)
+def bench_repo_cached():
+    repositories = _pos("repositories")
+    repo = repositories.CachedVersionedRepository(repositories.ProductRepository())
+    return lambda: repo.get_by_id("P002")
+
+
+def _registration_validate(rule_count: int):
+    mod = _registrasi()
+    base = [mod.SksLimitRule(), mod.JadwalBentrokRule()]
+    rules = (base + [mod.PrerequisiteRule(f"CS{100 + i}") for i in range(rule_count)])[:rule_count]
+    service = mod.RegistrationService(rules)
+    reg = mod.RegistrationData("S001", "Ani", 18, [f"CS{100 + i}" for i in range(60)],
+                               ["Mon-9", "Tue-10", "Wed-13"])
+    return lambda: service.validate(reg)
+
+
+for _rules in (1, 5, 10, 50):
+    benchmark(f"registration.validate[{_rules} rules]", number=1_000)(
+        lambda rules=_rules: _registration_validate(rules))
+
+
+@benchmark("registration.prerequisite_graph", number=10_000)
+def bench_prerequisite_graph():
+    mod, prasyarat = _registrasi(), load_module("praktikum 12", "prasyarat")
+    rng = random.Random(12)
+    courses = [f"C{i:03d}" for i in range(500)]
+    kurikulum = prasyarat.PrerequisiteGraph(
+        {c: rng.sample(courses[:i], min(i, rng.randint(0, 3))) for i, c in enumerate(courses)})
+    rule = mod.PrerequisiteGraphRule(kurikulum)
+    reg = mod.RegistrationData("S001", "Ani", 18, courses[:300], ["Mon-9"], rng.sample(courses[:300], 5))
+    return lambda: rule.check(reg)
+
+
+@benchmark("checkout.run_checkout", number=10_000)
+def bench_run_checkout():
+    mod = _checkout()
+    service = mod.CheckoutService(mod.CreditCardProcessor(), mod.EmailNotifier())
+
+    def run():
+        service.run_checkout(mod.Order("Andi", 500000))
+    return run
+
+
+# ==============================
+# RUNNER
+# ==============================
+def run_benchmarks(names, repeat: int):
+    results = {}
+    for name in names:
+        factory, number = BENCHMARKS[name]
+        func = factory()
+        for _ in range(number):  # warmup
+            func()
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            samples.append((time.perf_counter() - start) / number)
+        results[name] = {
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "mean": statistics.fmean(samples),
+            "repeat": repeat,
+            "number": number,
+        }
+        print(f"{name:<38} median {results[name]['median'] * 1e6:12.3f} us")
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Mengembalikan daftar (nama, rasio) benchmark yang melambat > threshold."""
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get("benchmarks", {}).get(name)
+        if not old:
+            continue
+        ratio = result["median"] / old["median"]
+        status = "REGRESI" if ratio > 1 + threshold else "ok"
+        print(f"{name:<38} {ratio:6.2f}x baseline  {status}")
+        if ratio > 1 + threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", default="", help="hanya jalankan benchmark yang namanya mengandung teks ini")
+    parser.add_argument("--output", help="simpan hasil JSON ke file ini")
+    parser.add_argument("--baseline", help="bandingkan dengan file baseline JSON")
+    parser.add_argument("--save-baseline", help="simpan hasil sebagai baseline baru")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="batas perlambatan median relatif (default 0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    # Ukur seperti di produksi: log INFO tidak ditulis
+    logging.disable(logging.WARNING)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    results = run_benchmarks(names, args.repeat)
+    document = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            Path(path).write_text(json.dumps(document, indent=2, sort_keys=True), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} benchmark melambat lebih dari {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
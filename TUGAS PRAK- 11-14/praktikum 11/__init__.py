@@ -0,0 +1,5 @@
+"""Praktikum 11: refactoring SOLID (checkout dan registrasi mata kuliah).
+
+Modul dapat di-import tanpa efek samping; demo dijalankan lewat
+`python -m praktikum11.refactor_solid` / `python -m praktikum11.tugas_mandiri`.
+"""
@@ -74,18 +74,6 @@ class CheckoutService:
 
 #  PROGRAM UTAMA (Pembuktian OCP)
 
-# Setup awal
-andi_order = Order("Andi", 500000)
-email_service = EmailNotifier()
-
-# 1. Implementasi 1 — Credit Card
-cc_processor = CreditCardProcessor()
-checkout_cc = CheckoutService(payment_processor=cc_processor, notifier=email_service)
-
-print("\n--- Skenario 1: Credit Card ---")
-checkout_cc.run_checkout(andi_order)
-
-
 # 2. Pembuktian OCP — Tambah QRIS tanpa mengubah kode lain
 class QrisProcessor(IPaymentProcessor):
     def process(self, order: Order) -> bool:
@@ -93,10 +81,26 @@ class QrisProcessor(IPaymentProcessor):
         return True
 
 
-budi_order = Order("Budi", 100000)
-qris_processor = QrisProcessor()
+def main():
+    # Setup awal
+    andi_order = Order("Andi", 500000)
+    email_service = EmailNotifier()
+
+    # 1. Implementasi 1 — Credit Card
+    cc_processor = CreditCardProcessor()
+    checkout_cc = CheckoutService(payment_processor=cc_processor, notifier=email_service)
+
+    print("\n--- Skenario 1: Credit Card ---")
+    checkout_cc.run_checkout(andi_order)
+
+    budi_order = Order("Budi", 100000)
+    qris_processor = QrisProcessor()
+
+    # inject implmentasi QRIS yang baru dibuat
+    checkout_qris = CheckoutService(payment_processor=qris_processor, notifier=email_service)
+    print("\n--- Skenario 2: Pembuktian OCP (QRIS) ---")
+    checkout_qris.run_checkout(budi_order)
+
 
-# inject implmentasi QRIS yang baru dibuat
-checkout_qris = CheckoutService(payment_processor=qris_processor, notifier=email_service)
-print("\n--- Skenario 2: Pembuktian OCP (QRIS) ---")
-checkout_qris.run_checkout(budi_order)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""Praktikum 12: logging, metrics, checkout async, dan validasi registrasi.
+
+Import modul tidak memasang handler logging; titik masuk program
+memanggil praktikum_common.log_facade.setup_logging(). Contoh: `python -m praktikum12.tugas_mandiri`.
+"""
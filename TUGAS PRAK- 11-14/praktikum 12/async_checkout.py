@@ -0,0 +1,237 @@
+import asyncio
+import logging
+import random
+import time
+from abc import ABC, abstractmethod
+
+from praktikum_common.log_facade import get_logger, setup_logging
+from .refactor_solid import Order, IPaymentProcessor, INotificationService
+
+LOGGER = get_logger("AsyncCheckoutService")
+
+
+# ==========================
+# ABSTRAKSI / KONTRAK ASYNC
+# ==========================
+class IAsyncPaymentProcessor(ABC):
+    """
+    Interface async untuk memproses pembayaran.
+    """
+
+    @abstractmethod
+    async def process(self, order: Order) -> bool:
+        """
+        Memproses pembayaran pesanan tanpa memblokir event loop.
+
+        Args:
+            order (Order): Data pesanan.
+
+        Returns:
+            bool: True jika pembayaran berhasil.
+        """
+        pass
+
+
+class IAsyncNotificationService(ABC):
+    """
+    Interface async untuk layanan notifikasi.
+    """
+
+    @abstractmethod
+    async def send(self, order: Order) -> None:
+        """
+        Mengirim notifikasi kepada pelanggan.
+
+        Args:
+            order (Order): Data pesanan.
+        """
+        pass
+
+
+# ====================================
+# ADAPTER DARI IMPLEMENTASI SINKRON
+# ====================================
+class SyncPaymentAdapter(IAsyncPaymentProcessor):
+    """
+    Menjalankan IPaymentProcessor sinkron di thread pool.
+    """
+
+    def __init__(self, processor: IPaymentProcessor):
+        self.processor = processor
+
+    async def process(self, order: Order) -> bool:
+        return await asyncio.to_thread(self.processor.process, order)
+
+
+class SyncNotifierAdapter(IAsyncNotificationService):
+    """
+    Menjalankan INotificationService sinkron di thread pool.
+    """
+
+    def __init__(self, notifier: INotificationService):
+        self.notifier = notifier
+
+    async def send(self, order: Order) -> None:
+        await asyncio.to_thread(self.notifier.send, order)
+
+
+# ================================
+# GATEWAY STUB (untuk uji throughput)
+# ================================
+class StubPaymentGateway(IAsyncPaymentProcessor):
+    """
+    Gateway pembayaran lokal dengan latensi yang bisa diatur.
+
+    Args:
+        latency (float): Latensi rata-rata dalam detik.
+        jitter (float): Variasi acak latensi dalam detik.
+        success_rate (float): Peluang pembayaran berhasil (0-1).
+    """
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.0,
+                 success_rate: float = 1.0, seed: int | None = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.success_rate = success_rate
+        self._rng = random.Random(seed)
+
+    async def process(self, order: Order) -> bool:
+        await asyncio.sleep(max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter)))
+        return self._rng.random() < self.success_rate
+
+
+class StubEmailGateway(IAsyncNotificationService):
+    """
+    Gateway email lokal dengan latensi yang bisa diatur.
+    """
+
+    def __init__(self, latency: float = 0.2):
+        self.latency = latency
+        self.sent = 0
+
+    async def send(self, order: Order) -> None:
+        await asyncio.sleep(self.latency)
+        self.sent += 1
+
+
+# ==============================
+# KOORDINATOR CHECKOUT ASYNC
+# ==============================
+class AsyncCheckoutService:
+    """
+    Versi asyncio dari CheckoutService.
+
+    Pembayaran ditunggu langsung, sedangkan notifikasi diserahkan ke
+    antrean latar belakang berukuran terbatas yang dikerjakan oleh
+    beberapa worker. Jika antrean penuh, run_checkout menunggu
+    (backpressure) alih-alih menumpuk tugas tanpa batas.
+    """
+
+    def __init__(
+        self,
+        payment_processor: IAsyncPaymentProcessor,
+        notifier: IAsyncNotificationService,
+        queue_size: int = 1000,
+        notification_workers: int = 8
+    ):
+        """
+        Inisialisasi AsyncCheckoutService.
+
+        Args:
+            payment_processor (IAsyncPaymentProcessor): Metode pembayaran.
+            notifier (IAsyncNotificationService): Layanan notifikasi.
+            queue_size (int): Kapasitas antrean notifikasi.
+            notification_workers (int): Jumlah worker pengirim notifikasi.
+        """
+        self.payment_processor = payment_processor
+        self.notifier = notifier
+        self.queue_size = queue_size
+        self.notification_workers = notification_workers
+        self._queue: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Menyalakan worker notifikasi."""
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._workers = [
+            asyncio.create_task(self._notification_worker())
+            for _ in range(self.notification_workers)
+        ]
+
+    async def stop(self) -> None:
+        """Menunggu antrean notifikasi kosong lalu mematikan worker."""
+        if self._queue is None:
+            return
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def _notification_worker(self) -> None:
+        while True:
+            order = await self._queue.get()
+            try:
+                await self.notifier.send(order)
+            except Exception:
+                LOGGER.exception("Gagal mengirim notifikasi untuk %s", order.customer_name)
+            finally:
+                self._queue.task_done()
+
+    async def run_checkout(self, order: Order) -> bool:
+        """
+        Menjalankan proses checkout pesanan.
+
+        Args:
+            order (Order): Data pesanan.
+
+        Returns:
+            bool: True jika checkout berhasil, False jika gagal.
+        """
+        if self._queue is None:
+            raise RuntimeError("AsyncCheckoutService belum di-start()")
+
+        payment_success = await self.payment_processor.process(order)
+
+        if payment_success:
+            order.status = "paid"
+            await self._queue.put(order)
+            return True
+        LOGGER.warning("Checkout gagal untuk %s", order.customer_name)
+        return False
+
+
+# ==================================
+# PROGRAM UTAMA (Uji throughput)
+# ==================================
+async def _ukur_throughput(jumlah_order: int, payment_latency: float, email_latency: float,
+                           notification_workers: int):
+    email = StubEmailGateway(latency=email_latency)
+    service = AsyncCheckoutService(StubPaymentGateway(latency=payment_latency, seed=12), email,
+                                   notification_workers=notification_workers)
+    orders = [Order(f"Pelanggan-{i}", 100000) for i in range(jumlah_order)]
+
+    mulai = time.perf_counter()
+    async with service:
+        hasil = await asyncio.gather(*(service.run_checkout(o) for o in orders))
+        selesai_checkout = time.perf_counter()
+    selesai_notif = time.perf_counter()
+
+    print(f"{sum(hasil)} checkout dalam {selesai_checkout - mulai:.2f}s "
+          f"({jumlah_order / (selesai_checkout - mulai):,.0f} checkout/detik), "
+          f"{email.sent} email terkirim setelah {selesai_notif - mulai:.2f}s")
+
+
+if __name__ == "__main__":
+    # non_blocking: I/O log tidak boleh menahan event loop
+    setup_logging(level=logging.INFO, fmt="%(levelname)s - %(message)s", non_blocking=True)
+    asyncio.run(_ukur_throughput(jumlah_order=5000, payment_latency=0.05, email_latency=0.2,
+                                 notification_workers=200))
@@ -0,0 +1,55 @@
+# bench_compile.py
+# Micro-benchmark: loop RegistrationService.validate vs validator hasil
+# compile_rules() pada 1 juta registrasi. Jalankan: python -m praktikum12.bench_compile
+import logging
+import random
+import time
+
+from .prasyarat import PrerequisiteGraph
+from .tugas_mandiri import (LOGGER, RegistrationData, RegistrationService, SksLimitRule,
+                           PrerequisiteGraphRule, JadwalBentrokRule, compile_rules)
+
+JUMLAH_REGISTRASI = 1_000_000
+
+
+def buat_registrasi(jumlah: int):
+    rng = random.Random(13)
+    template = [
+        RegistrationData(f"S{i:04d}", f"Mahasiswa {i}", rng.randint(12, 24),
+                         ["CS101", "CS102", "MA101"], ["Mon-9", "Tue-10", "Wed-13"], ["CS201"])
+        for i in range(1000)
+    ]
+    template[0].sks_requested = 30  # sebagian kecil gagal
+    return [template[i % len(template)] for i in range(jumlah)]
+
+
+def main():
+    # Seperti di produksi: INFO dimatikan
+    LOGGER.setLevel(logging.WARNING)
+    logging.disable(logging.WARNING)
+
+    regs = buat_registrasi(JUMLAH_REGISTRASI)
+    kurikulum = PrerequisiteGraph({"CS201": ["CS101", "MA101"], "CS301": ["CS201"]})
+    # Rule prasyarat sengaja dipasang dua kali: compile_rules membuang duplikatnya
+    rules = [SksLimitRule(), PrerequisiteGraphRule(kurikulum), PrerequisiteGraphRule(kurikulum),
+             JadwalBentrokRule()]
+    service = RegistrationService(rules)
+    fused = compile_rules(rules)
+
+    mulai = time.perf_counter()
+    for reg in regs:
+        service.validate(reg)
+    durasi_loop = time.perf_counter() - mulai
+
+    mulai = time.perf_counter()
+    for reg in regs:
+        fused(reg)
+    durasi_fused = time.perf_counter() - mulai
+
+    print(f"RegistrationService.validate: {durasi_loop:6.2f} s")
+    print(f"compile_rules (fused)       : {durasi_fused:6.2f} s "
+          f"({durasi_loop / durasi_fused:.1f}x, {len(fused.rules)} rule setelah dedup)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# bench_jadwal.py
+# Mengukur deteksi bentrok: mahasiswa dengan 10 slot, dan satu kampus
+# berisi 20k section (find_overlaps + OccupancyIndex per ruang/dosen).
+# Jalankan: python -m praktikum12.bench_jadwal
+import random
+import time
+import timeit
+
+from .jadwal import HARI, TimeSlot, OccupancyIndex, find_overlaps, has_overlap
+
+JUMLAH_SECTION = 20_000
+JUMLAH_RUANG = 800
+JUMLAH_DOSEN = 2_500
+
+
+def slot_acak(rng: random.Random) -> TimeSlot:
+    start = rng.randint(7 * 60, 18 * 60) // 30 * 30
+    return TimeSlot(rng.choice(HARI[:5]), start, start + rng.choice((60, 100, 150)))
+
+
+def main():
+    rng = random.Random(11)
+
+    mahasiswa = [[slot_acak(rng) for _ in range(10)] for _ in range(10_000)]
+    durasi = min(timeit.repeat(lambda: [has_overlap(s) for s in mahasiswa], number=1, repeat=5))
+    print(f"has_overlap, 10 slot     : {durasi * 1e6 / len(mahasiswa):8.2f} us/mahasiswa")
+    durasi = min(timeit.repeat(lambda: [find_overlaps(s) for s in mahasiswa], number=1, repeat=5))
+    print(f"find_overlaps, 10 slot   : {durasi * 1e6 / len(mahasiswa):8.2f} us/mahasiswa")
+
+    sections = [(f"SEC{i:05d}", f"R{rng.randrange(JUMLAH_RUANG):03d}",
+                 f"D{rng.randrange(JUMLAH_DOSEN):04d}", slot_acak(rng)) for i in range(JUMLAH_SECTION)]
+
+    mulai = time.perf_counter()
+    per_ruang = {}
+    for _, room, _, slot in sections:
+        per_ruang.setdefault(room, []).append(slot)
+    jumlah = sum(len(find_overlaps(slots)) for slots in per_ruang.values())
+    print(f"ruang double-booked, 20k : {time.perf_counter() - mulai:8.3f} s ({jumlah:,} pasangan)")
+
+    mulai = time.perf_counter()
+    ruang = OccupancyIndex((room, sec, slot) for sec, room, _, slot in sections)
+    dosen = OccupancyIndex((lect, sec, slot) for sec, _, lect, slot in sections)
+    print(f"bangun index ruang+dosen : {time.perf_counter() - mulai:8.3f} s")
+
+    queries = [(f"R{rng.randrange(JUMLAH_RUANG):03d}", slot_acak(rng)) for _ in range(100_000)]
+    durasi = min(timeit.repeat(lambda: [ruang.conflicts(r, s) for r, s in queries], number=1, repeat=3))
+    print(f"query okupansi ruang     : {durasi * 1e6 / len(queries):8.2f} us/query")
+    jadwal_mhs = mahasiswa[0]
+    durasi = min(timeit.repeat(lambda: dosen.conflicts_for("D0001", jadwal_mhs), number=1000, repeat=3))
+    print(f"10 slot vs okupansi dosen: {durasi * 1e3:8.2f} us/mahasiswa")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# bench_registrasi.py
+# Mengukur throughput RegistrationService.validate_many (registrasi/detik)
+# pada 1, 4, dan 8 worker. Jalankan: python -m praktikum12.bench_registrasi
+import random
+import time
+
+from .prasyarat import PrerequisiteGraph
+from .tugas_mandiri import (RegistrationData, RegistrationService, SksLimitRule,
+                           PrerequisiteGraphRule, JadwalBentrokRule)
+
+JUMLAH_REGISTRASI = 40_000
+HARI = ["Mon", "Tue", "Wed", "Thu", "Fri"]
+MATKUL = [f"CS{100 + i}" for i in range(40)]
+
+
+def buat_kurikulum() -> PrerequisiteGraph:
+    """Setiap mata kuliah punya 0-2 prasyarat langsung dari mata kuliah sebelumnya."""
+    rng = random.Random(40)
+    return PrerequisiteGraph({c: rng.sample(MATKUL[:i], min(i, rng.randint(0, 2)))
+                              for i, c in enumerate(MATKUL)})
+
+
+def buat_registrasi(jumlah: int):
+    """Generator registrasi acak (streaming, tidak disimpan dalam list)."""
+    rng = random.Random(12)
+    for i in range(jumlah):
+        yield RegistrationData(
+            student_id=f"S{i:06d}",
+            student_name=f"Mahasiswa {i}",
+            sks_requested=rng.randint(12, 26),
+            completed_courses=rng.sample(MATKUL, rng.randint(0, 20)),
+            schedule_slots=[f"{rng.choice(HARI)}-{rng.randint(7, 17)}" for _ in range(rng.randint(3, 8))],
+            requested_courses=rng.sample(MATKUL, rng.randint(1, 4)),
+        )
+
+
+def main():
+    rules = [SksLimitRule(), PrerequisiteGraphRule(buat_kurikulum()), JadwalBentrokRule()]
+    service = RegistrationService(rules)
+    for workers in (1, 4, 8):
+        mulai = time.perf_counter()
+        table = service.validate_many(buat_registrasi(JUMLAH_REGISTRASI), workers=workers)
+        durasi = time.perf_counter() - mulai
+        print(f"{workers} worker: {len(table) / durasi:10,.0f} registrasi/detik "
+              f"({table.failed_count()} gagal)")
+
+
+if __name__ == "__main__":
+    main()
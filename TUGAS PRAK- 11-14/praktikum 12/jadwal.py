@@ -0,0 +1,168 @@
+import heapq
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+# ==========================
+# MODEL SLOT WAKTU
+# ==========================
+HARI = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_INDEX_HARI = {hari: i for i, hari in enumerate(HARI)}
+MENIT_PER_HARI = 24 * 60
+DURASI_DEFAULT = 60  # "Mon-9" berarti satu jam mulai pukul 09.00
+
+
+@dataclass(frozen=True, slots=True)
+class TimeSlot:
+    """
+    Slot waktu kuliah dalam satu minggu.
+
+    Attributes:
+        day (str): Nama hari ("Mon" .. "Sun").
+        start (int): Menit mulai sejak 00.00 pada hari tersebut.
+        end (int): Menit selesai (eksklusif).
+    """
+    day: str
+    start: int
+    end: int
+
+    def __post_init__(self):
+        if self.day not in _INDEX_HARI:
+            raise ValueError(f"Hari tidak dikenal: {self.day}")
+        if not 0 <= self.start < self.end <= MENIT_PER_HARI:
+            raise ValueError(f"Rentang waktu tidak valid: {self.start}-{self.end}")
+
+    @property
+    def week_start(self) -> int:
+        """Menit mulai dihitung dari awal minggu."""
+        return _INDEX_HARI[self.day] * MENIT_PER_HARI + self.start
+
+    @property
+    def week_end(self) -> int:
+        return _INDEX_HARI[self.day] * MENIT_PER_HARI + self.end
+
+    def overlaps(self, other: "TimeSlot") -> bool:
+        return self.day == other.day and self.start < other.end and other.start < self.end
+
+    @classmethod
+    def parse(cls, text: str) -> "TimeSlot":
+        """
+        Membaca slot dari teks.
+
+        Format yang didukung: "Mon-9" (satu jam), "Mon-8-10" dan
+        "Mon-8:30-10:15".
+        Args:
+            text (str): Teks slot.
+        Returns:
+            TimeSlot: Slot hasil parsing.
+        """
+        parts = text.split("-")
+        if len(parts) == 2:
+            start = _parse_jam(parts[1])
+            return cls(parts[0], start, start + DURASI_DEFAULT)
+        if len(parts) == 3:
+            return cls(parts[0], _parse_jam(parts[1]), _parse_jam(parts[2]))
+        raise ValueError(f"Format slot tidak dikenal: {text}")
+
+
+def _parse_jam(text: str) -> int:
+    jam, _, menit = text.partition(":")
+    return int(jam) * 60 + (int(menit) if menit else 0)
+
+
+# ==========================
+# DETEKSI BENTROK (SWEEP)
+# ==========================
+def find_overlaps(slots: List[TimeSlot]) -> List[Tuple[int, int]]:
+    """
+    Mencari semua pasangan slot yang bentrok dengan sorted sweep.
+
+    Kompleksitas O(n log n + k) dengan k jumlah pasangan bentrok.
+    Args:
+        slots (List[TimeSlot]): Daftar slot.
+    Returns:
+        List[Tuple[int, int]]: Pasangan indeks (i, j) dengan i < j.
+    """
+    order = sorted(range(len(slots)), key=lambda i: slots[i].week_start)
+    active: List[Tuple[int, int]] = []  # heap (week_end, index)
+    pairs = []
+    for i in order:
+        start = slots[i].week_start
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for _, j in active:
+            pairs.append((j, i) if j < i else (i, j))
+        heapq.heappush(active, (slots[i].week_end, i))
+    pairs.sort()
+    return pairs
+
+
+def has_overlap(slots: List[TimeSlot]) -> bool:
+    """Versi cepat find_overlaps yang berhenti pada bentrok pertama."""
+    ranges = sorted((slot.week_start, slot.week_end) for slot in slots)
+    return any(ranges[i][0] < ranges[i - 1][1] for i in range(1, len(ranges)))
+
+
+# ==================================
+# INDEX OKUPANSI RUANG / DOSEN
+# ==================================
+class OccupancyIndex:
+    """
+    Index okupansi per resource (ruang atau dosen) yang dihitung sekali.
+
+    Setiap resource menyimpan section yang terurut berdasarkan waktu
+    mulai beserta prefix maksimum waktu selesai, sehingga query cukup
+    bisect lalu mundur selama masih mungkin bentrok.
+    """
+
+    def __init__(self, sections: Iterable[Tuple[Hashable, str, TimeSlot]]):
+        """
+        Args:
+            sections: Iterable (resource, section_id, slot), misalnya
+                ("R101", "IF-A", TimeSlot.parse("Mon-8-10")).
+        """
+        grouped: Dict[Hashable, List[Tuple[int, int, str]]] = {}
+        for resource, section_id, slot in sections:
+            grouped.setdefault(resource, []).append((slot.week_start, slot.week_end, section_id))
+
+        self._starts: Dict[Hashable, List[int]] = {}
+        self._entries: Dict[Hashable, List[Tuple[int, int, str]]] = {}
+        self._max_end: Dict[Hashable, List[int]] = {}
+        for resource, entries in grouped.items():
+            entries.sort()
+            max_end = []
+            current = 0
+            for _, end, _ in entries:
+                current = max(current, end)
+                max_end.append(current)
+            self._entries[resource] = entries
+            self._starts[resource] = [start for start, _, _ in entries]
+            self._max_end[resource] = max_end
+
+    def conflicts(self, resource: Hashable, slot: TimeSlot) -> List[str]:
+        """
+        Mencari section pada resource yang bentrok dengan slot.
+        Args:
+            resource (Hashable): Kode ruang atau dosen.
+            slot (TimeSlot): Slot yang diperiksa.
+        Returns:
+            List[str]: ID section yang bentrok.
+        """
+        starts = self._starts.get(resource)
+        if not starts:
+            return []
+        entries = self._entries[resource]
+        max_end = self._max_end[resource]
+        start, end = slot.week_start, slot.week_end
+        i = bisect_left(starts, end) - 1
+        found = []
+        while i >= 0 and max_end[i] > start:
+            if entries[i][1] > start:
+                found.append(entries[i][2])
+            i -= 1
+        found.reverse()
+        return found
+
+    def conflicts_for(self, resource: Hashable, slots: Iterable[TimeSlot]) -> List[Tuple[TimeSlot, str]]:
+        """Memeriksa banyak slot (misalnya jadwal mahasiswa) terhadap satu resource."""
+        return [(slot, section_id) for slot in slots for section_id in self.conflicts(resource, slot)]
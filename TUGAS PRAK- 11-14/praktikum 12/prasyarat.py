@@ -0,0 +1,103 @@
+from typing import Dict, Iterable, List, Mapping
+
+
+# ==================================
+# GRAF PRASYARAT TERKOMPILASI
+# ==================================
+class PrerequisiteGraph:
+    """
+    DAG prasyarat mata kuliah yang dikompilasi sekali saat startup.
+
+    Kode mata kuliah di-intern menjadi id integer, dan untuk setiap mata
+    kuliah dihitung bitset closure prasyarat transitifnya. Himpunan mata
+    kuliah yang sudah ditempuh juga disimpan sebagai bitset, sehingga
+    pengecekan seluruh rantai prasyarat cukup satu operasi AND.
+    """
+
+    def __init__(self, prerequisites: Mapping[str, Iterable[str]]):
+        """
+        Args:
+            prerequisites (Mapping[str, Iterable[str]]): Mata kuliah ->
+                daftar prasyarat langsung, misalnya {"CS201": ["CS101"]}.
+
+        Raises:
+            ValueError: Jika terdapat siklus prasyarat.
+        """
+        direct: Dict[str, List[str]] = {}
+        for course, reqs in prerequisites.items():
+            direct.setdefault(course, [])
+            for req in reqs:
+                direct[course].append(req)
+                direct.setdefault(req, [])
+
+        self._codes: List[str] = sorted(direct)
+        self._ids: Dict[str, int] = {code: i for i, code in enumerate(self._codes)}
+        self._closure: List[int] = [0] * len(self._codes)
+
+        # DFS iteratif dengan deteksi siklus (0 = belum, 1 = diproses, 2 = selesai)
+        state = [0] * len(self._codes)
+        for root in self._codes:
+            if state[self._ids[root]] == 2:
+                continue
+            state[self._ids[root]] = 1
+            stack = [(root, iter(direct[root]))]
+            while stack:
+                course, children = stack[-1]
+                for child in children:
+                    child_id = self._ids[child]
+                    if state[child_id] == 1:
+                        raise ValueError(f"Siklus prasyarat terdeteksi pada {child}")
+                    if state[child_id] == 0:
+                        state[child_id] = 1
+                        stack.append((child, iter(direct[child])))
+                        break
+                else:
+                    stack.pop()
+                    bits = 0
+                    for req in direct[course]:
+                        req_id = self._ids[req]
+                        bits |= (1 << req_id) | self._closure[req_id]
+                    self._closure[self._ids[course]] = bits
+                    state[self._ids[course]] = 2
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def to_bitset(self, courses: Iterable[str]) -> int:
+        """Mengubah daftar kode mata kuliah menjadi bitset (kode asing diabaikan)."""
+        ids = self._ids
+        bits = 0
+        for course in courses:
+            course_id = ids.get(course)
+            if course_id is not None:
+                bits |= 1 << course_id
+        return bits
+
+    def decode(self, bits: int) -> List[str]:
+        """Mengubah bitset kembali menjadi daftar kode mata kuliah."""
+        codes = []
+        while bits:
+            low = bits & -bits
+            codes.append(self._codes[low.bit_length() - 1])
+            bits ^= low
+        return codes
+
+    def closure_bits(self, courses: Iterable[str]) -> int:
+        """Gabungan closure prasyarat untuk beberapa mata kuliah."""
+        bits = 0
+        for course in courses:
+            course_id = self._ids.get(course)
+            if course_id is not None:
+                bits |= self._closure[course_id]
+        return bits
+
+    def missing(self, courses: Iterable[str], completed_bits: int) -> List[str]:
+        """
+        Mencari semua prasyarat (langsung maupun transitif) yang belum ditempuh.
+        Args:
+            courses (Iterable[str]): Mata kuliah yang ingin diambil.
+            completed_bits (int): Bitset mata kuliah yang sudah ditempuh.
+        Returns:
+            List[str]: Kode prasyarat yang kurang, terurut.
+        """
+        return self.decode(self.closure_bits(courses) & ~completed_bits)
@@ -1,15 +1,17 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 import logging
+import os
+import time
+
+from praktikum_common import metrics
+from praktikum_common.log_facade import get_logger, setup_logging
 
 # ====================
 # KONFIGURASI LOGGING
 # ====================
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s - %(message)s"
-)
-LOGGER = logging.getLogger("CheckoutService")
+# Handler dipasang oleh titik masuk program (setup_logging), bukan saat import
+LOGGER = get_logger("CheckoutService")
 
 
 # ============
@@ -128,7 +130,34 @@ class EmailNotifier(INotificationService):
         Args:
             order (Order): Data pesanan.
         """
-        LOGGER.info(f"Mengirim email ke {order.customer_name}")
+        LOGGER.info("Mengirim email ke %s", order.customer_name)
+
+
+class InstrumentedPaymentProcessor(IPaymentProcessor):
+    """
+    Decorator yang mencatat latensi dan hasil process() per jenis
+    payment processor. Hanya dipasang jika metrik aktif.
+    """
+
+    def __init__(self, inner: IPaymentProcessor,
+                 registry: metrics.MetricsRegistry = metrics.REGISTRY):
+        self.inner = inner
+        name = inner.__class__.__name__
+        self._latency = registry.histogram("payment_process_seconds", processor=name)
+        self._success = registry.counter("payment_process_total", processor=name, result="success")
+        self._failed = registry.counter("payment_process_total", processor=name, result="failed")
+
+    def process(self, order: Order) -> bool:
+        start = time.perf_counter()
+        try:
+            ok = self.inner.process(order)
+        except Exception:
+            self._failed.inc()
+            raise
+        finally:
+            self._latency.observe(time.perf_counter() - start)
+        (self._success if ok else self._failed).inc()
+        return ok
 
 
 # ========================
@@ -154,9 +183,12 @@ class CheckoutService:
             payment_processor (IPaymentProcessor): Metode pembayaran.
             notifier (INotificationService): Layanan notifikasi.
         """
+        if metrics.ENABLED:
+            payment_processor = InstrumentedPaymentProcessor(payment_processor)
         self.payment_processor = payment_processor
         self.notifier = notifier
 
+    @metrics.timed("checkout_run_seconds")
     def run_checkout(self, order: Order) -> bool:
         """
         Menjalankan proses checkout pesanan.
@@ -167,9 +199,8 @@ class CheckoutService:
         Returns:
             bool: True jika checkout berhasil, False jika gagal.
         """
-        LOGGER.info(
-            f"Memulai checkout untuk {order.customer_name} "
-            f"dengan total {order.total_price}")
+        LOGGER.info("Memulai checkout untuk %s dengan total %s",
+                    order.customer_name, order.total_price)
 
         payment_success = self.payment_processor.process(order)
 
@@ -187,9 +218,12 @@ class CheckoutService:
 # PROGRAM UTAMA
 # ==============
 if __name__ == "__main__":
+    setup_logging(level=logging.INFO, fmt="%(levelname)s - %(message)s")
     order = Order("Andi", 500000)
     payment = CreditCardProcessor()
     notifier = EmailNotifier()
 
     service = CheckoutService(payment, notifier)
     service.run_checkout(order)
+    if metrics.ENABLED:
+        metrics.REGISTRY.export(os.environ.get("POS_METRICS_FILE"))
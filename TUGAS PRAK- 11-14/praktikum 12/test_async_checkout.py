@@ -0,0 +1,82 @@
+# test_async_checkout.py
+import asyncio
+import logging
+import unittest
+from .async_checkout import (AsyncCheckoutService, IAsyncNotificationService, StubEmailGateway,
+                             StubPaymentGateway)
+from .refactor_solid import Order
+
+
+class GatedNotifier(IAsyncNotificationService):
+    """Notifikasi tertahan sampai gate dibuka; pelanggan 'GAGAL' selalu error."""
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.sent = []
+
+    async def send(self, order: Order) -> None:
+        await self.gate.wait()
+        if order.customer_name == "GAGAL":
+            raise RuntimeError("SMTP down")
+        self.sent.append(order.customer_name)
+
+
+async def settle():
+    """Memberi giliran ke semua task yang siap jalan."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestAsyncCheckoutService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    async def test_backpressure_antrean_penuh(self):
+        """Tes 1: Saat antrean penuh, run_checkout menunggu sampai ada slot kosong."""
+        notifier = GatedNotifier()
+        service = AsyncCheckoutService(StubPaymentGateway(latency=0), notifier,
+                                       queue_size=2, notification_workers=1)
+        async with service:
+            tasks = [asyncio.create_task(service.run_checkout(Order(f"C{i}", 1000))) for i in range(5)]
+            await settle()
+            # 1 order di worker + 2 di antrean; 2 sisanya tertahan di put()
+            self.assertEqual(sum(t.done() for t in tasks), 3)
+            self.assertEqual(service._queue.qsize(), 2)
+
+            notifier.gate.set()
+            self.assertEqual(await asyncio.gather(*tasks), [True] * 5)
+        self.assertEqual(sorted(notifier.sent), [f"C{i}" for i in range(5)])
+
+    async def test_stop_menunggu_antrean_kosong(self):
+        """Tes 2: stop() mengirim semua notifikasi yang tersisa lalu mematikan worker."""
+        email = StubEmailGateway(latency=0.01)
+        service = AsyncCheckoutService(StubPaymentGateway(latency=0), email,
+                                       queue_size=100, notification_workers=4)
+        async with service:
+            hasil = await asyncio.gather(*(service.run_checkout(Order(f"C{i}", 1000)) for i in range(20)))
+            workers = list(service._workers)
+            self.assertLess(email.sent, 20)
+        self.assertEqual(hasil, [True] * 20)
+        self.assertEqual(email.sent, 20)
+        self.assertTrue(all(w.done() for w in workers))
+        with self.assertRaises(RuntimeError):
+            await service.run_checkout(Order("Terlambat", 1000))
+        await service.stop()  # stop kedua tidak melakukan apa-apa
+
+    async def test_gagal_bayar_dan_notifikasi_error(self):
+        """Tes 3: Pembayaran gagal tidak diantrekan; notifikasi error tidak menghentikan worker."""
+        notifier = GatedNotifier()
+        notifier.gate.set()
+        service = AsyncCheckoutService(StubPaymentGateway(latency=0), notifier, notification_workers=1)
+        ditolak = AsyncCheckoutService(StubPaymentGateway(latency=0, success_rate=0), notifier)
+        async with service, ditolak:
+            order = Order("Ditolak", 1000)
+            self.assertFalse(await ditolak.run_checkout(order))
+            self.assertEqual(order.status, "open")
+            for name in ("A", "GAGAL", "B"):
+                self.assertTrue(await service.run_checkout(Order(name, 1000)))
+        self.assertEqual(notifier.sent, ["A", "B"])
+
+
+if __name__ == '__main__':
+    unittest.main()
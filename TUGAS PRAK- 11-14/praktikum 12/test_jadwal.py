@@ -0,0 +1,113 @@
+# test_jadwal.py
+import itertools
+import logging
+import random
+import unittest
+from .jadwal import HARI, OccupancyIndex, TimeSlot, find_overlaps, has_overlap
+from .tugas_mandiri import JadwalBentrokRule, RegistrationData, RegistrationService
+
+
+def slot_acak(rng: random.Random) -> TimeSlot:
+    start = rng.randint(7 * 60, 18 * 60) // 30 * 30
+    return TimeSlot(rng.choice(HARI[:3]), start, start + rng.choice((30, 60, 100, 150)))
+
+
+def registrasi(slots, student_id="S001"):
+    return RegistrationData(student_id, "Ani", 18, [], list(slots))
+
+
+class TestTimeSlot(unittest.TestCase):
+    def test_parse(self):
+        """Tes 1: Format 'Mon-9', 'Mon-8-10', dan 'Mon-8:30-10:15' dibaca sebagai rentang menit."""
+        self.assertEqual(TimeSlot.parse("Mon-9"), TimeSlot("Mon", 540, 600))
+        self.assertEqual(TimeSlot.parse("Tue-8-10"), TimeSlot("Tue", 480, 600))
+        self.assertEqual(TimeSlot.parse("Wed-8:30-10:15"), TimeSlot("Wed", 510, 615))
+        for text in ("Mon", "Mon-9-10-11", "Xyz-9", "Mon-sembilan", "Mon-10-8", "Mon-23-25", ""):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                TimeSlot.parse(text)
+
+    def test_bersinggungan_dan_beda_hari(self):
+        """Tes 2: Slot yang hanya bersinggungan atau beda hari tidak bentrok."""
+        senin_8_10 = TimeSlot.parse("Mon-8-10")
+        kasus = [
+            ("Mon-9", True),        # di dalam kelas dua jam
+            ("Mon-7:30-8:01", True),
+            ("Mon-10-11", False),   # mulai tepat saat kelas lain selesai
+            ("Mon-7-8", False),     # selesai tepat saat kelas lain mulai
+            ("Tue-8-10", False),    # jam sama, hari berbeda
+            ("Sun-8-10", False),
+        ]
+        for text, bentrok in kasus:
+            with self.subTest(text=text):
+                other = TimeSlot.parse(text)
+                self.assertEqual(senin_8_10.overlaps(other), bentrok)
+                self.assertEqual(has_overlap([senin_8_10, other]), bentrok)
+                self.assertEqual(find_overlaps([senin_8_10, other]), [(0, 1)] if bentrok else [])
+        # Akhir hari Senin bersinggungan dengan awal hari Selasa
+        self.assertFalse(has_overlap([TimeSlot("Mon", 1380, 1440), TimeSlot("Tue", 0, 60)]))
+
+
+class TestDeteksiBentrok(unittest.TestCase):
+    def test_find_overlaps_sama_dengan_brute_force(self):
+        """Tes 3: find_overlaps/has_overlap sama dengan membandingkan semua pasangan."""
+        rng = random.Random(11)
+        for _ in range(300):
+            slots = [slot_acak(rng) for _ in range(rng.randint(0, 12))]
+            expected = [(i, j) for i, j in itertools.combinations(range(len(slots)), 2)
+                        if slots[i].overlaps(slots[j])]
+            self.assertEqual(find_overlaps(slots), expected)
+            self.assertEqual(has_overlap(slots), bool(expected))
+
+    def test_occupancy_index_sama_dengan_brute_force(self):
+        """Tes 4: OccupancyIndex.conflicts menemukan semua section yang bentrok per resource."""
+        rng = random.Random(12)
+        sections = [(f"R{rng.randrange(5)}", f"SEC{i:03d}", slot_acak(rng)) for i in range(300)]
+        index = OccupancyIndex(sections)
+        for _ in range(500):
+            room, slot = f"R{rng.randrange(6)}", slot_acak(rng)
+            expected = sorted((s.week_start, s.week_end, sec) for r, sec, s in sections
+                              if r == room and s.overlaps(slot))
+            self.assertEqual(index.conflicts(room, slot), [sec for _, _, sec in expected])
+
+        index = OccupancyIndex([("R1", "A", TimeSlot.parse("Mon-8-10"))])
+        self.assertEqual(index.conflicts("R1", TimeSlot.parse("Mon-10-11")), [])
+        self.assertEqual(index.conflicts("R1", TimeSlot.parse("Tue-9")), [])
+        self.assertEqual(index.conflicts_for("R1", [TimeSlot.parse("Mon-9"), TimeSlot.parse("Mon-7")]),
+                         [(TimeSlot.parse("Mon-9"), "A")])
+
+
+class TestJadwalBentrokRule(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def test_slot_tidak_valid_menjadi_error_validasi(self):
+        """Tes 5: Slot yang tidak bisa dibaca tidak melempar exception dari rule."""
+        rule = JadwalBentrokRule()
+        reg = registrasi(["Mon-9", "Senin-9"])
+        self.assertEqual(rule.validate(reg), (False, "Slot jadwal tidak valid: Senin-9"))
+        self.assertFalse(rule.check(reg))
+        service = RegistrationService([rule])
+        self.assertEqual(service.validate(reg),
+                         (False, [("JadwalBentrokRule", "Slot jadwal tidak valid: Senin-9")]))
+        self.assertEqual(list(service.validate_many([reg])), [("S001", False, ("JADWAL_BENTROK",))])
+
+    def test_bentrok_rentang_dan_okupansi(self):
+        """Tes 6: Rule memakai rentang waktu dan jadwal terdaftar di OccupancyIndex."""
+        rule = JadwalBentrokRule()
+        self.assertEqual(rule.validate(registrasi(["Mon-9", "Mon-8-10"])),
+                         (False, "Jadwal bentrok: Mon-9 x Mon-8-10"))
+        self.assertEqual(rule.validate(registrasi(["Mon-10", "Mon-8-10", "Tue-8-10"])), (True, "OK"))
+
+        terdaftar = OccupancyIndex([("S001", "ASISTEN-LAB", TimeSlot.parse("Tue-13-15"))])
+        rule = JadwalBentrokRule(terdaftar)
+        reg = registrasi(["Mon-9", "Tue-14"])
+        self.assertEqual(rule.validate(reg), (False, "Jadwal bentrok: Tue-14 x ASISTEN-LAB"))
+        self.assertFalse(rule.check(reg))
+        self.assertTrue(rule.check(registrasi(["Mon-9", "Tue-14"], student_id="S002")))
+        self.assertTrue(rule.check(registrasi(["Tue-15"])))
+        self.assertNotEqual(rule.identity(), JadwalBentrokRule().identity())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# test_prasyarat.py
+import logging
+import random
+import unittest
+from .prasyarat import PrerequisiteGraph
+from .tugas_mandiri import PrerequisiteGraphRule, RegistrationData
+
+
+def closure_brute_force(direct: dict, course: str) -> set:
+    found, stack = set(), list(direct.get(course, ()))
+    while stack:
+        req = stack.pop()
+        if req not in found:
+            found.add(req)
+            stack.extend(direct.get(req, ()))
+    return found
+
+
+class TestPrerequisiteGraph(unittest.TestCase):
+    def setUp(self):
+        # CS401 -> CS301 -> CS201 -> CS101, dan CS401 -> MA201 -> MA101 (diamond lewat MA101)
+        self.graph = PrerequisiteGraph({
+            "CS201": ["CS101"],
+            "CS301": ["CS201", "MA101"],
+            "MA201": ["MA101"],
+            "CS401": ["CS301", "MA201"],
+        })
+
+    def test_closure_transitif(self):
+        """Tes 1: Closure memuat prasyarat langsung maupun transitif."""
+        self.assertEqual(len(self.graph), 6)
+        decode = self.graph.decode
+        self.assertEqual(decode(self.graph.closure_bits(["CS401"])),
+                         ["CS101", "CS201", "CS301", "MA101", "MA201"])
+        self.assertEqual(decode(self.graph.closure_bits(["CS201", "MA201"])), ["CS101", "MA101"])
+        self.assertEqual(self.graph.closure_bits(["CS101", "XX999"]), 0)
+        completed = self.graph.to_bitset(["CS101", "MA101", "XX999"])
+        self.assertEqual(self.graph.missing(["CS401"], completed), ["CS201", "CS301", "MA201"])
+
+    def test_closure_sama_dengan_brute_force(self):
+        """Tes 2: Closure bitset sama dengan DFS biasa pada DAG acak."""
+        rng = random.Random(12)
+        courses = [f"C{i:03d}" for i in range(200)]
+        direct = {c: rng.sample(courses[:i], min(i, rng.randint(0, 3))) for i, c in enumerate(courses)}
+        graph = PrerequisiteGraph(direct)
+        for course in rng.sample(courses, 50):
+            self.assertEqual(set(graph.decode(graph.closure_bits([course]))),
+                             closure_brute_force(direct, course))
+
+    def test_siklus_ditolak(self):
+        """Tes 3: Siklus prasyarat (termasuk ke diri sendiri) ditolak saat kompilasi."""
+        for prerequisites in ({"A": ["A"]},
+                              {"A": ["B"], "B": ["A"]},
+                              {"A": ["B"], "B": ["C"], "C": ["D"], "D": ["B"]}):
+            with self.subTest(prerequisites=prerequisites), self.assertRaises(ValueError):
+                PrerequisiteGraph(prerequisites)
+        PrerequisiteGraph({"A": ["B", "C"], "B": ["C"], "C": []})  # diamond bukan siklus
+
+
+class TestPrerequisiteGraphRule(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.graph = PrerequisiteGraph({"CS201": ["CS101"], "CS301": ["CS201", "MA101"]})
+
+    def test_semua_prasyarat_kurang_dilaporkan(self):
+        """Tes 4: Semua prasyarat yang kurang dilaporkan dalam satu pesan."""
+        rule = PrerequisiteGraphRule(self.graph)
+        reg = RegistrationData("S001", "Ani", 18, ["CS101"], [], ["CS301"])
+        self.assertEqual(rule.validate(reg), (False, "Missing prerequisite: CS201, MA101"))
+        self.assertFalse(rule.check(reg))
+        reg.completed_courses += ["CS201", "MA101"]
+        self.assertEqual(rule.validate(reg), (True, "OK"))
+        self.assertTrue(rule.check(reg))
+
+    def test_daftar_mata_kuliah_tetap(self):
+        """Tes 5: courses tetap dipakai sebagai pengganti requested_courses."""
+        rule = PrerequisiteGraphRule(self.graph, courses=["CS201"])
+        reg = RegistrationData("S001", "Ani", 18, [], [], ["CS301"])
+        self.assertEqual(rule.validate(reg), (False, "Missing prerequisite: CS101"))
+        self.assertEqual(rule.identity(), PrerequisiteGraphRule(self.graph, ["CS201"]).identity())
+        self.assertNotEqual(rule.identity(), PrerequisiteGraphRule(self.graph).identity())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+# test_registrasi.py
+import logging
+import random
+import threading
+import unittest
+from .prasyarat import PrerequisiteGraph
+from .tugas_mandiri import (LOGGER, IValidationRule, JadwalBentrokRule, PrerequisiteGraphRule,
+                            PrerequisiteRule, RegistrationData, RegistrationService, SksLimitRule,
+                            compile_rules)
+
+
+def registrasi(student_id="S001", sks=18, completed=("CS101",), slots=("Mon-9", "Tue-10"),
+               requested=()):
+    return RegistrationData(student_id, f"Mahasiswa {student_id}", sks, list(completed),
+                            list(slots), list(requested))
+
+
+class LoggingRule(IValidationRule):
+    """Rule tanpa check() sendiri: validate_many memakai validate() yang menulis log."""
+    code = "LOG"
+
+    def validate(self, reg):
+        LOGGER.info("rule %s", reg.student_id)
+        return reg.sks_requested <= 20, "OK"
+
+
+class TestValidateMany(unittest.TestCase):
+    def test_log_dibungkam_hanya_di_thread_pemanggil(self):
+        """Tes 1: validate_many membungkam log rule tanpa mengubah level LOGGER."""
+        service = RegistrationService([LoggingRule(), SksLimitRule()])
+        level = LOGGER.level
+        dari_thread_lain = []
+
+        class Ganggu(IValidationRule):
+            code = "GANGGU"
+
+            def check(self, reg):
+                # Thread lain yang menulis log selama validate_many berjalan
+                t = threading.Thread(target=LOGGER.warning, args=("thread lain %s", reg.student_id))
+                t.start()
+                t.join()
+                dari_thread_lain.append(reg.student_id)
+                return True
+
+            def validate(self, reg):
+                return True, "OK"
+
+        service.rules.append(Ganggu())
+        with self.assertLogs(LOGGER, logging.INFO) as logs:
+            table = service.validate_many((registrasi(f"S{i}", sks=18 + i) for i in range(4)),
+                                          chunk_size=3)
+        self.assertEqual(list(table), [("S0", True, ()), ("S1", True, ()), ("S2", True, ()),
+                                       ("S3", False, ("LOG",))])
+        self.assertEqual(LOGGER.level, level)
+        pesan = [r.getMessage() for r in logs.records]
+        self.assertEqual([m for m in pesan if m.startswith("rule")], [])
+        self.assertEqual([m for m in pesan if m.startswith("thread lain")],
+                         [f"thread lain S{i}" for i in range(4)])
+        self.assertIn("validate_many selesai: 4 registrasi, 1 gagal", pesan)
+
+        with self.assertLogs(LOGGER, logging.INFO) as logs:
+            service.validate(registrasi("S9"))
+        self.assertIn("rule S9", [r.getMessage() for r in logs.records])
+
+
+class TestCompileRules(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.matkul = [f"CS{100 + i}" for i in range(12)]
+        self.kurikulum = PrerequisiteGraph({c: self.matkul[max(0, i - 2):i]
+                                            for i, c in enumerate(self.matkul)})
+
+    def registrasi_acak(self, rng: random.Random) -> RegistrationData:
+        hari = ["Mon", "Tue", "Wed"]
+        slots = [f"{rng.choice(hari)}-{rng.randint(7, 12)}" for _ in range(rng.randint(0, 4))]
+        if rng.random() < 0.05:
+            slots.append("Rabu-9")  # format tidak valid
+        return RegistrationData(f"S{rng.randrange(10_000)}", "Mahasiswa", rng.randint(12, 28),
+                                rng.sample(self.matkul, rng.randint(0, 12)), slots,
+                                rng.sample(self.matkul, rng.randint(0, 3)))
+
+    def test_sama_dengan_registration_service(self):
+        """Tes 2: Validator hasil compile_rules sama dengan RegistrationService.validate."""
+        rng = random.Random(13)
+        rules = [JadwalBentrokRule(), PrerequisiteRule("CS100"), SksLimitRule(22),
+                 PrerequisiteGraphRule(self.kurikulum), LoggingRule(), SksLimitRule(20)]
+        for fail_fast in (False, True):
+            fused = compile_rules(rules, fail_fast=fail_fast)
+            service = RegistrationService(rules, fail_fast=fail_fast)
+            for _ in range(2_000):
+                reg = self.registrasi_acak(rng)
+                ok, errors = fused(reg)
+                self.assertEqual((ok, list(errors)), service.validate(reg))
+
+    def test_rule_setara_dideduplikasi(self):
+        """Tes 3: Rule pure yang setara dibuang; hasil sama dengan service atas rule sisanya."""
+        rng = random.Random(14)
+        rules = [SksLimitRule(), PrerequisiteGraphRule(self.kurikulum), SksLimitRule(),
+                 PrerequisiteGraphRule(self.kurikulum), SksLimitRule(20), JadwalBentrokRule(),
+                 JadwalBentrokRule(), LoggingRule(), LoggingRule()]
+        fused = compile_rules(rules)
+        self.assertEqual([type(r).__name__ for r in fused.rules],
+                         ["SksLimitRule", "SksLimitRule", "PrerequisiteGraphRule",
+                          "JadwalBentrokRule", "LoggingRule", "LoggingRule"])
+        service = RegistrationService(list(fused.rules))
+        for _ in range(500):
+            reg = self.registrasi_acak(rng)
+            ok, errors = fused(reg)
+            self.assertEqual((ok, list(errors)), service.validate(reg))
+        self.assertEqual(compile_rules([])(self.registrasi_acak(rng)), (True, ()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,16 +1,28 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Tuple
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Sequence, Tuple
 import logging
+import os
+import threading
+import time
+
+from praktikum_common import metrics
+from praktikum_common.log_facade import get_logger, setup_logging
+from .jadwal import OccupancyIndex, TimeSlot, find_overlaps, has_overlap
+from .prasyarat import PrerequisiteGraph
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
 
 # ====================
 # KONFIGURASI LOGGING
 # ====================
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s - %(message)s"
-)
-LOGGER = logging.getLogger("RegistrationService")
+# Handler dipasang oleh titik masuk program (setup_logging), bukan saat import
+LOGGER = get_logger("RegistrationService")
 
 # ===========
 # MODEL DATA
@@ -25,13 +37,16 @@ class RegistrationData:
         student_name (str): Nama mahasiswa.
         sks_requested (int): Jumlah SKS yang diajukan.
         completed_courses (List[str]): Daftar mata kuliah yang telah ditempuh.
-        schedule_slots (List[str]): Slot jadwal yang dipilih.
+        schedule_slots (List[str]): Slot jadwal yang dipilih, misalnya
+            'Mon-9' atau 'Mon-8-10' (boleh juga berupa TimeSlot).
+        requested_courses (List[str]): Mata kuliah yang ingin diambil.
     """
     student_id: str
     student_name: str
     sks_requested: int
     completed_courses: List[str]
     schedule_slots: List[str]
+    requested_courses: List[str] = field(default_factory=list)
 
 
 # ======================
@@ -62,7 +77,17 @@ class ValidatorManager:
 class IValidationRule(ABC):
     """
     Interface untuk aturan validasi registrasi.
+
+    Attributes:
+        cost (int): Perkiraan biaya eksekusi. Rule dengan cost kecil
+            dijalankan lebih dulu; rule tanpa hint dianggap mahal.
+        code (str): Kode error ringkas untuk tabel hasil validate_many.
+        pure (bool): True jika hasil rule hanya bergantung pada reg dan
+            konfigurasinya, sehingga rule yang setara boleh dideduplikasi.
     """
+    cost: int = 10
+    code: str = "RULE"
+    pure: bool = False
 
     @abstractmethod
     def validate(self, reg: RegistrationData) -> Tuple[bool, str]:
@@ -75,6 +100,22 @@ class IValidationRule(ABC):
         """
         pass
 
+    @property
+    def name(self) -> str:
+        """Nama rule yang dipakai di log dan daftar error."""
+        return self.__class__.__name__
+
+    def check(self, reg: RegistrationData) -> bool:
+        """
+        Versi cepat validate(): hanya status lulus/gagal, tanpa pesan
+        dan tanpa log. Rule sebaiknya meng-override method ini.
+        """
+        return self.validate(reg)[0]
+
+    def identity(self):
+        """Kunci kesetaraan untuk deduplikasi rule pure (None = tidak ada)."""
+        return None
+
 
 # ==================
 # IMPLEMENTASI RULE
@@ -83,14 +124,19 @@ class SksLimitRule(IValidationRule):
     """
     Aturan validasi batas maksimum SKS.
     """
+    cost = 1
+    code = "SKS_LIMIT"
+    pure = True
 
     def __init__(self, max_sks: int = 24):
         self.max_sks = max_sks
+    def check(self, reg: RegistrationData) -> bool:
+        return reg.sks_requested <= self.max_sks
+    def identity(self):
+        return (self.code, self.max_sks)
     def validate(self, reg: RegistrationData) -> Tuple[bool, str]:
         if reg.sks_requested > self.max_sks:
-            LOGGER.warning(
-                f"SKS melebihi batas: {reg.sks_requested} > {self.max_sks}"
-            )
+            LOGGER.warning("SKS melebihi batas: %d > %d", reg.sks_requested, self.max_sks)
             return False, "SKS melebihi batas"
         LOGGER.info("Validasi SKS berhasil")
         return True, "OK"
@@ -98,48 +144,222 @@ class SksLimitRule(IValidationRule):
 
 class PrerequisiteRule(IValidationRule):
     """
-    Aturan validasi prasyarat mata kuliah.
+    Aturan validasi prasyarat mata kuliah (satu mata kuliah, tanpa rantai).
+
+    Dipertahankan untuk kode lama; konfigurasi baru memakai
+    PrerequisiteGraphRule yang memeriksa seluruh rantai prasyarat.
     """
+    cost = 2
+    pure = True
 
     def __init__(self, required_course: str):
         self.required_course = required_course
+        self.code = f"PREREQ:{required_course}"
+    def check(self, reg: RegistrationData) -> bool:
+        return self.required_course in reg.completed_courses
+    def identity(self):
+        return (self.code,)
     def validate(self, reg: RegistrationData) -> Tuple[bool, str]:
         if self.required_course not in reg.completed_courses:
-            LOGGER.warning(
-                f"Prasyarat tidak terpenuhi: {self.required_course}"
-            )
+            LOGGER.warning("Prasyarat tidak terpenuhi: %s", self.required_course)
             return False, f"Missing prerequisite: {self.required_course}"
         LOGGER.info("Validasi prasyarat berhasil")
         return True, "OK"
 
 
+class PrerequisiteGraphRule(IValidationRule):
+    """
+    Aturan validasi prasyarat berbasis PrerequisiteGraph.
+
+    Memeriksa seluruh rantai prasyarat transitif untuk mata kuliah yang
+    diambil dengan satu operasi bitset, dan melaporkan semua prasyarat
+    yang kurang sekaligus.
+    """
+    cost = 2
+    code = "PREREQ"
+    pure = True
+
+    def __init__(self, graph: PrerequisiteGraph, courses: List[str] | None = None):
+        """
+        Args:
+            graph (PrerequisiteGraph): Graf prasyarat terkompilasi.
+            courses (List[str] | None): Mata kuliah yang diperiksa; jika None
+                memakai reg.requested_courses.
+        """
+        self.graph = graph
+        self.courses = courses
+        self._required_bits = graph.closure_bits(courses) if courses is not None else None
+
+    def _missing_bits(self, reg: RegistrationData) -> int:
+        required = self._required_bits
+        if required is None:
+            required = self.graph.closure_bits(reg.requested_courses)
+        if not required:
+            return 0
+        return required & ~self.graph.to_bitset(reg.completed_courses)
+
+    def check(self, reg: RegistrationData) -> bool:
+        return not self._missing_bits(reg)
+
+    def identity(self):
+        courses = tuple(self.courses) if self.courses is not None else None
+        return (self.code, id(self.graph), courses)
+
+    def validate(self, reg: RegistrationData) -> Tuple[bool, str]:
+        missing_bits = self._missing_bits(reg)
+        if missing_bits:
+            missing = self.graph.decode(missing_bits)
+            LOGGER.warning("Prasyarat tidak terpenuhi: %s", missing)
+            return False, f"Missing prerequisite: {', '.join(missing)}"
+        LOGGER.info("Validasi prasyarat berhasil")
+        return True, "OK"
+
+
 class JadwalBentrokRule(IValidationRule):
     """
     Aturan validasi bentrokan jadwal.
+
+    Slot dibaca sebagai rentang waktu (lihat jadwal.TimeSlot), sehingga
+    'Mon-9' dianggap bentrok dengan kelas dua jam 'Mon-8-10'. Slot yang
+    formatnya tidak valid dilaporkan sebagai error validasi.
     """
+    cost = 3
+    code = "JADWAL_BENTROK"
+    pure = True
+
+    def __init__(self, occupancy: OccupancyIndex | None = None):
+        """
+        Args:
+            occupancy (OccupancyIndex | None): Jadwal yang sudah tercatat per
+                mahasiswa (resource = student_id), misalnya kelas yang sudah
+                terdaftar atau jadwal asisten. Slot baru juga tidak boleh
+                bentrok dengan jadwal ini.
+        """
+        self.occupancy = occupancy
+    def check(self, reg: RegistrationData) -> bool:
+        try:
+            slots = [_parse_slot(slot) for slot in reg.schedule_slots]
+        except ValueError:
+            return False
+        if has_overlap(slots):
+            return False
+        return self.occupancy is None or not self.occupancy.conflicts_for(reg.student_id, slots)
+    def identity(self):
+        return (self.code, id(self.occupancy)) if self.occupancy is not None else (self.code,)
     def validate(self, reg: RegistrationData) -> Tuple[bool, str]:
-        if len(set(reg.schedule_slots)) < len(reg.schedule_slots):
-            LOGGER.warning("Jadwal bentrok terdeteksi")
-            return False, "Jadwal bentrok"
+        slots = []
+        for text in reg.schedule_slots:
+            try:
+                slots.append(_parse_slot(text))
+            except ValueError as error:
+                LOGGER.warning("Slot jadwal tidak valid: %s", error)
+                return False, f"Slot jadwal tidak valid: {text}"
+        if has_overlap(slots):
+            pairs = find_overlaps(slots)
+            detail = ", ".join(
+                f"{reg.schedule_slots[i]} x {reg.schedule_slots[j]}" for i, j in pairs
+            )
+            LOGGER.warning("Jadwal bentrok terdeteksi: %s", detail)
+            return False, f"Jadwal bentrok: {detail}"
+        if self.occupancy is not None:
+            conflicts = self.occupancy.conflicts_for(reg.student_id, slots)
+            if conflicts:
+                detail = ", ".join(f"{reg.schedule_slots[slots.index(slot)]} x {section_id}"
+                                   for slot, section_id in conflicts)
+                LOGGER.warning("Jadwal bentrok dengan jadwal terdaftar: %s", detail)
+                return False, f"Jadwal bentrok: {detail}"
         LOGGER.info("Validasi jadwal berhasil")
         return True, "OK"
 
 
+class InstrumentedRule(IValidationRule):
+    """
+    Decorator rule yang mencatat latensi dan jumlah gagal per rule.
+    Hanya dipasang oleh RegistrationService jika metrik aktif.
+    """
+
+    def __init__(self, inner: IValidationRule,
+                 registry: metrics.MetricsRegistry = metrics.REGISTRY):
+        self.inner = inner
+        self.cost = inner.cost
+        self.code = inner.code
+        self.pure = inner.pure
+        self._latency = registry.histogram("validation_rule_seconds", rule=inner.name)
+        self._failed = registry.counter("validation_rule_failed_total", rule=inner.name)
+
+    @property
+    def name(self) -> str:
+        return self.inner.name
+
+    def validate(self, reg: RegistrationData) -> Tuple[bool, str]:
+        start = time.perf_counter()
+        result = self.inner.validate(reg)
+        self._latency.observe(time.perf_counter() - start)
+        if not result[0]:
+            self._failed.inc()
+        return result
+
+    def check(self, reg: RegistrationData) -> bool:
+        start = time.perf_counter()
+        ok = self.inner.check(reg)
+        self._latency.observe(time.perf_counter() - start)
+        if not ok:
+            self._failed.inc()
+        return ok
+
+    def identity(self):
+        return self.inner.identity()
+
+
+@lru_cache(maxsize=4096)
+def _parse_slot_text(text: str) -> TimeSlot:
+    return TimeSlot.parse(text)
+
+
+def _parse_slot(slot) -> TimeSlot:
+    return slot if isinstance(slot, TimeSlot) else _parse_slot_text(slot)
+
+
 # =====================
 # REGISTRATION SERVICE
 # =====================
 class RegistrationService:
     """
     Service untuk mengoordinasikan proses validasi registrasi mahasiswa.
+
+    Rule diurutkan berdasarkan cost sehingga rule murah berjalan lebih dulu.
+    Mode "parallel" menjalankan rule secara bersamaan di thread pool
+    (cocok untuk rule yang mengakses sumber lambat), dan fail_fast
+    menghentikan validasi setelah error pertama.
     """
+    SEQUENTIAL = "sequential"
+    PARALLEL = "parallel"
 
-    def __init__(self, rules: List[IValidationRule]):
+    def __init__(self, rules: List[IValidationRule], mode: str = SEQUENTIAL,
+                 fail_fast: bool = False, max_workers: int | None = None):
         """
         Inisialisasi RegistrationService.
         Args:
             rules (List[IValidationRule]): Daftar aturan validasi.
+            mode (str): SEQUENTIAL atau PARALLEL.
+            fail_fast (bool): Berhenti setelah rule pertama yang gagal.
+            max_workers (int | None): Ukuran thread pool untuk mode PARALLEL.
         """
-        self.rules = rules
+        if mode not in (self.SEQUENTIAL, self.PARALLEL):
+            raise ValueError(f"Mode tidak dikenal: {mode}")
+        if metrics.ENABLED:
+            rules = [InstrumentedRule(rule) for rule in rules]
+        self.rules = sorted(rules, key=lambda rule: rule.cost)
+        self.mode = mode
+        self.fail_fast = fail_fast
+        self.max_workers = max_workers
+        self._executor: "ThreadPoolExecutor | None" = None
+
+    def close(self) -> None:
+        """Mematikan thread pool (jika ada)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
 
     def validate(self, reg: RegistrationData) -> Tuple[bool, List[Tuple[str, str]]]:
         """
@@ -149,13 +369,11 @@ class RegistrationService:
         Returns:
             Tuple[bool, List[Tuple[str, str]]]: Status validasi dan daftar error.
         """
-        LOGGER.info(f"Memulai validasi untuk mahasiswa {reg.student_name}")
-        errors = []
-        for rule in self.rules:
-            ok, msg = rule.validate(reg)
-            LOGGER.info(f"Menjalankan {rule.__class__.__name__} -> {ok}")
-            if not ok:
-                errors.append((rule.__class__.__name__, msg))
+        LOGGER.info("Memulai validasi untuk mahasiswa %s", reg.student_name)
+        if self.mode == self.PARALLEL and len(self.rules) > 1:
+            errors = self._validate_parallel(reg)
+        else:
+            errors = self._validate_sequential(reg)
         if errors:
             LOGGER.warning("Validasi registrasi GAGAL")
         else:
@@ -163,11 +381,243 @@ class RegistrationService:
 
         return (len(errors) == 0), errors
 
+    def _validate_sequential(self, reg: RegistrationData) -> List[Tuple[str, str]]:
+        errors = []
+        log_rules = LOGGER.isEnabledFor(logging.INFO)
+        for rule in self.rules:
+            ok, msg = rule.validate(reg)
+            if log_rules:
+                LOGGER.info("Menjalankan %s -> %s", rule.name, ok)
+            if not ok:
+                errors.append((rule.name, msg))
+                if self.fail_fast:
+                    break
+        return errors
+
+    def _validate_parallel(self, reg: RegistrationData) -> List[Tuple[str, str]]:
+        # concurrent.futures cukup berat; hanya dimuat jika parallel=True dipakai
+        from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="rule")
+        futures = {self._executor.submit(self._run_rule, rule, reg): index
+                   for index, rule in enumerate(self.rules)}
+
+        if self.fail_fast:
+            # _run_rule melempar _RuleFailed sehingga wait() bisa berhenti
+            # pada kegagalan pertama; rule yang belum mulai dibatalkan.
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+        else:
+            done, _ = wait(futures)
+
+        results = []
+        for future in done:
+            error = future.exception()
+            if isinstance(error, _RuleFailed):
+                results.append((futures[future], error.args[0]))
+            elif error is not None:
+                raise error
+        results.sort()
+        errors = [entry for _, entry in results]
+        return errors[:1] if self.fail_fast else errors
+
+    def validate_many(self, registrations: Iterable[RegistrationData],
+                      workers: int = 1, chunk_size: int = 2000) -> "ValidationTable":
+        """
+        Memvalidasi banyak registrasi sekaligus (misalnya satu periode KRS).
+
+        Registrasi dibaca secara streaming dari iterator, dipotong per
+        chunk, lalu dibagi ke process pool. Log per mahasiswa tidak
+        ditulis; hanya satu ringkasan di akhir.
+        Args:
+            registrations (Iterable[RegistrationData]): Sumber registrasi.
+            workers (int): Jumlah proses; 1 berarti dijalankan di proses ini.
+            chunk_size (int): Jumlah registrasi per tugas.
+        Returns:
+            ValidationTable: Tabel student_id, lulus/gagal, dan kode error.
+        """
+        table = ValidationTable()
+        chunks = _chunked(registrations, chunk_size)
+        if workers <= 1:
+            with _QUIET.scope():
+                for chunk in chunks:
+                    table.extend(_validate_chunk(self.rules, self.fail_fast, chunk))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers, initializer=_silence_worker) as pool:
+                # Jendela terbatas agar iterator tidak dibaca habis ke memori
+                in_flight = deque()
+                for chunk in chunks:
+                    in_flight.append(pool.submit(_validate_chunk, self.rules, self.fail_fast, chunk))
+                    if len(in_flight) >= workers * 2:
+                        table.extend(in_flight.popleft().result())
+                while in_flight:
+                    table.extend(in_flight.popleft().result())
+        LOGGER.info("validate_many selesai: %d registrasi, %d gagal", len(table), table.failed_count())
+        return table
+
+    @staticmethod
+    def _run_rule(rule: IValidationRule, reg: RegistrationData) -> None:
+        ok, msg = rule.validate(reg)
+        LOGGER.info("Menjalankan %s -> %s", rule.name, ok)
+        if not ok:
+            raise _RuleFailed((rule.name, msg))
+
+
+class _RuleFailed(Exception):
+    """Penanda internal untuk rule yang gagal pada mode paralel."""
+
+
+# =====================
+# RULE COMPILER
+# =====================
+def compile_rules(rules: List[IValidationRule], fail_fast: bool = False
+                  ) -> Callable[[RegistrationData], Tuple[bool, Sequence[Tuple[str, str]]]]:
+    """
+    Menggabungkan daftar rule menjadi satu validator.
+
+    Rule diurutkan berdasarkan cost dan rule pure yang setara dibuang.
+    Jalur lulus hanya memanggil check() setiap rule lalu mengembalikan
+    tuple konstan, jadi tidak ada tuple hasil, list error, maupun string
+    pesan yang dibuat. Pesan error baru disusun lewat validate() ketika
+    ada rule yang gagal.
+    Args:
+        rules (List[IValidationRule]): Daftar aturan validasi.
+        fail_fast (bool): Berhenti setelah error pertama pada jalur gagal.
+    Returns:
+        Callable: fungsi reg -> (ok, errors) dengan semantik yang sama
+            seperti RegistrationService.validate atas rule hasil dedup
+            (tersedia di atribut `rules`).
+    """
+    unique: List[IValidationRule] = []
+    seen = set()
+    for rule in sorted(rules, key=lambda rule: rule.cost):
+        key = rule.identity() if rule.pure else None
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(rule)
+
+    checks = tuple(rule.check for rule in unique)
+    passed = (True, _NO_ERRORS)
+
+    def slow_path(reg: RegistrationData) -> Tuple[bool, List[Tuple[str, str]]]:
+        errors = []
+        for rule in unique:
+            ok, msg = rule.validate(reg)
+            if not ok:
+                errors.append((rule.name, msg))
+                if fail_fast:
+                    break
+        return False, errors
+
+    def fused_validator(reg: RegistrationData) -> Tuple[bool, Sequence[Tuple[str, str]]]:
+        for check in checks:
+            if not check(reg):
+                return slow_path(reg)
+        return passed
+
+    fused_validator.rules = tuple(unique)
+    return fused_validator
+
+
+@dataclass
+class ValidationTable:
+    """
+    Hasil validasi massal dalam bentuk kolom yang ringkas.
+
+    Attributes:
+        student_ids (List[str]): ID mahasiswa sesuai urutan input.
+        passed (bytearray): 1 jika lulus, 0 jika gagal.
+        error_codes (List[Tuple[str, ...]]): Kode error per mahasiswa.
+    """
+    student_ids: List[str] = field(default_factory=list)
+    passed: bytearray = field(default_factory=bytearray)
+    error_codes: List[Tuple[str, ...]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.student_ids)
+
+    def __iter__(self) -> Iterator[Tuple[str, bool, Tuple[str, ...]]]:
+        for student_id, ok, codes in zip(self.student_ids, self.passed, self.error_codes):
+            yield student_id, bool(ok), codes
+
+    def extend(self, rows: List[Tuple[str, bool, Tuple[str, ...]]]) -> None:
+        for student_id, ok, codes in rows:
+            self.student_ids.append(student_id)
+            self.passed.append(ok)
+            self.error_codes.append(codes)
+
+    def failed_count(self) -> int:
+        return len(self.passed) - sum(self.passed)
+
+
+_NO_ERRORS: Tuple[str, ...] = ()
+
+
+def _validate_chunk(rules: List[IValidationRule], fail_fast: bool,
+                    chunk: List[RegistrationData]) -> List[Tuple[str, bool, Tuple[str, ...]]]:
+    rows = []
+    for reg in chunk:
+        codes = []
+        for rule in rules:
+            if not rule.check(reg):
+                codes.append(rule.code)
+                if fail_fast:
+                    break
+        rows.append((reg.student_id, not codes, tuple(codes) if codes else _NO_ERRORS))
+    return rows
+
+
+def _chunked(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _silence_worker() -> None:
+    """Initializer process pool: log per-rule tidak perlu di worker."""
+    LOGGER.setLevel(logging.ERROR)
+
+
+class _QuietFilter(logging.Filter):
+    """
+    Filter LOGGER yang membuang log di bawah ERROR hanya dari thread yang
+    sedang berada di dalam scope(). Level LOGGER tidak pernah diubah,
+    sehingga pemanggil lain (thread lain, mode paralel) tetap mendapat
+    log seperti biasa.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._local = threading.local()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.ERROR or not getattr(self._local, "depth", 0)
+
+    @contextmanager
+    def scope(self):
+        local = self._local
+        local.depth = getattr(local, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            local.depth -= 1
+
+
+_QUIET = _QuietFilter()
+LOGGER.addFilter(_QUIET)
+
 
 # Program utama untuk pengujian sederhana
 if __name__ == '__main__':
+    setup_logging(level=logging.INFO, fmt="%(levelname)s - %(message)s")
     # contoh pengujian sederhana
-    rules = [SksLimitRule(), PrerequisiteRule('CS101'), JadwalBentrokRule()]
+    kurikulum = PrerequisiteGraph({'CS201': ['CS101'], 'CS301': ['CS201']})
+    rules = [SksLimitRule(), PrerequisiteGraphRule(kurikulum), JadwalBentrokRule()]
     service = RegistrationService(rules)
 
     reg = RegistrationData(
@@ -175,7 +625,10 @@ if __name__ == '__main__':
         student_name='Ani',
         sks_requested=18,
         completed_courses=['CS101'],
-        schedule_slots=['Mon-9', 'Tue-10']
+        schedule_slots=['Mon-9', 'Tue-10'],
+        requested_courses=['CS201']
     )
 
     service.validate(reg)
+    if metrics.ENABLED:
+        metrics.REGISTRY.export(os.environ.get("POS_METRICS_FILE"))
@@ -0,0 +1,5 @@
+"""Praktikum 13: aplikasi kasir (POS) beserta repository, pembayaran, dan index.
+
+Modul saling meng-import secara relatif; dependensi berat (sqlite3)
+baru dimuat saat dipakai. Contoh: `python -m praktikum13.tugas_mandiri`.
+"""
@@ -0,0 +1,92 @@
+# bench_catalog.py
+# Lookup get_by_id dari beberapa thread pembaca selama satu penulis terus
+# melakukan repricing massal: snapshot copy-on-write (ProductRepository)
+# dibandingkan dict bersama yang dijaga satu lock. Juga waktu publikasi
+# satu versi baru.
+# Jalankan: python -m praktikum13.bench_catalog [--products 200000] [--reprice 20000]
+import argparse
+import logging
+import random
+import threading
+import time
+
+from .models import Product
+from .repositories import ProductRepository
+
+
+class LockedRepository:
+    """Pembanding: dict bersama; repricing memegang lock selama perubahan."""
+    def __init__(self, products):
+        self._products = {p.id: p for p in products}
+        self._lock = threading.Lock()
+
+    def get_by_id(self, product_id):
+        with self._lock:
+            return self._products.get(product_id)
+
+    def reprice(self, prices):
+        with self._lock:
+            for product_id, price in prices.items():
+                self._products[product_id].price = price
+
+
+def jalankan(repo, ids: list[str], batches: list[dict], readers: int, durasi: float):
+    berhenti = threading.Event()
+    lookups = [0] * readers
+    publish = []
+
+    def reader(idx: int):
+        rng = random.Random(idx)
+        sample = rng.choices(ids, k=1000)
+        get = repo.get_by_id
+        n = 0
+        while not berhenti.is_set():
+            for product_id in sample:
+                get(product_id)
+            n += len(sample)
+        lookups[idx] = n
+
+    def writer():
+        i = 0
+        while not berhenti.is_set():
+            start = time.perf_counter()
+            repo.reprice(batches[i % len(batches)])
+            publish.append(time.perf_counter() - start)
+            i += 1
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for t in threads:
+        t.start()
+    time.sleep(durasi)
+    berhenti.set()
+    for t in threads:
+        t.join()
+    return sum(lookups) / durasi, sorted(publish)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=200_000)
+    parser.add_argument("--reprice", type=int, default=20_000, help="produk per repricing")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    rng = random.Random(25)
+    products = [Product(f"P{i:07d}", f"Produk {i}", rng.randint(1, 5000) * 500) for i in range(args.products)]
+    ids = [p.id for p in products]
+    batches = [{pid: rng.randint(1, 5000) * 500 for pid in rng.sample(ids, args.reprice)} for _ in range(4)]
+
+    print(f"{args.products:,} produk, repricing {args.reprice:,} produk per versi, {args.readers} pembaca")
+    for label, repo in (("lock bersama", LockedRepository(products)),
+                        ("snapshot COW", ProductRepository(products))):
+        rate, publish = jalankan(repo, ids, batches, args.readers, args.seconds)
+        p50 = publish[len(publish) // 2] * 1e3
+        print(f"{label:>13}: {rate:>12,.0f} lookup/detik, repricing p50 {p50:6.1f} ms ({len(publish)} versi)")
+
+
+if __name__ == "__main__":
+    main()
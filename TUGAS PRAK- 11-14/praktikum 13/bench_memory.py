@@ -0,0 +1,54 @@
+# bench_memory.py
+# Mengukur byte per produk: dataclass biasa (sebelum), dataclass slots,
+# dan ProductTable kolumnar. Versi objek disimpan dalam dict id -> produk
+# seperti shard CatalogSnapshot di ProductRepository agar sebanding dengan index tabel.
+# Jalankan: python -m praktikum13.bench_memory
+import gc
+import tracemalloc
+from dataclasses import dataclass
+
+from .models import Product, ProductTable
+
+JUMLAH_PRODUK = 200_000
+
+
+@dataclass
+class ProductDict:
+    """Product versi lama (punya __dict__ per instance)."""
+    id: str
+    name: str
+    price: float
+
+
+def siapkan_data(jumlah: int):
+    # string dibuat lebih dulu agar yang diukur hanya wadahnya; harga
+    # dibuat saat pengukuran karena objek float ikut terhitung per produk
+    return [(f"P{i:07d}", f"Produk {i}", i * 100) for i in range(jumlah)]
+
+
+def ukur(label: str, buat):
+    gc.collect()
+    tracemalloc.start()
+    hasil = buat()
+    terpakai, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>22}: {terpakai / JUMLAH_PRODUK:7.1f} byte/produk")
+    return hasil
+
+
+def main():
+    data = siapkan_data(JUMLAH_PRODUK)
+    ukur("dataclass (__dict__)", lambda: {i: ProductDict(i, n, float(p)) for i, n, p in data})
+    ukur("dataclass (slots)", lambda: {i: Product(i, n, float(p)) for i, n, p in data})
+    ukur("ProductTable", lambda: _isi_tabel(data))
+
+
+def _isi_tabel(data):
+    table = ProductTable()
+    for i, n, p in data:
+        table.add(i, n, float(p))
+    return table
+
+
+if __name__ == "__main__":
+    main()
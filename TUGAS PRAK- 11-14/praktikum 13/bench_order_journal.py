@@ -0,0 +1,70 @@
+# bench_order_journal.py
+# Checkout/detik dengan journal order durable: fsync per order dibandingkan
+# group commit, untuk beberapa jumlah kasir (thread) bersamaan. Juga waktu
+# pemulihan saat start dengan dan tanpa snapshot.
+# Jalankan: python -m praktikum13.bench_order_journal [--orders 2000] [--dir /path/disk]
+import argparse
+import logging
+import tempfile
+import threading
+import time
+
+from .order_journal import OrderJournal, OrderRecord
+
+ORDER = OrderRecord(lines=(("P001", 1, 15000000.0), ("P002", 2, 250000.0), ("P003", 1, 750000.0)),
+                    total=16250000.0)
+
+
+def throughput(directory: str, tills: int, orders: int, group_commit: bool) -> tuple[float, int]:
+    journal = OrderJournal(directory, group_commit=group_commit, snapshot_every=10 ** 9)
+    per_till = orders // tills
+
+    def till():
+        for _ in range(per_till):
+            journal.append(OrderRecord(ORDER.lines, ORDER.total, time.time()))
+
+    pool = [threading.Thread(target=till) for _ in range(tills)]
+    start = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - start
+    journal.close()
+    return per_till * tills / elapsed, journal.fsyncs
+
+
+def recovery(directory: str, orders: int, snapshot_every: int) -> float:
+    journal = OrderJournal(directory, group_commit=False, snapshot_every=snapshot_every)
+    for _ in range(orders):
+        journal.append(OrderRecord(ORDER.lines, ORDER.total))
+    journal.close()
+    start = time.perf_counter()
+    OrderJournal(directory).close()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=2000, help="order per skenario")
+    parser.add_argument("--dir", help="direktori induk journal (default: direktori sementara)")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{args.orders} order per skenario")
+    for tills in (1, 8, 64):
+        for group_commit in (False, True):
+            with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+                rate, fsyncs = throughput(tmp, tills, args.orders, group_commit)
+            label = "group commit" if group_commit else "fsync/order"
+            print(f"{tills:>3} kasir | {label:<12}: {rate:>9,.0f} order/detik ({fsyncs:,} fsync)")
+
+    for snapshot_every in (10 ** 9, 1_000):
+        with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+            elapsed = recovery(tmp, 20_000, snapshot_every)
+        label = "tanpa snapshot" if snapshot_every == 10 ** 9 else f"snapshot/{snapshot_every}"
+        print(f"pemulihan 20.000 order, {label:<15}: {elapsed * 1e3:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
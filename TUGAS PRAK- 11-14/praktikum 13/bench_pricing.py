@@ -0,0 +1,66 @@
+# bench_pricing.py
+# Waktu menghitung harga satu keranjang B2B (default 10k baris): pipeline
+# kolom (PricingPipeline) dibandingkan perhitungan bertahap yang menelusuri
+# CartItem ulang di setiap tahap (diskon baris, diskon keranjang, PPN).
+# Jalankan: python -m praktikum13.bench_pricing [--lines 10000] [--repeat 20]
+import argparse
+import logging
+import random
+import statistics
+import time
+
+from .models import CartItem, Product
+from .pricing import PPN_PERSEN, PricingPipeline
+
+
+def buat_keranjang(lines: int, seed: int = 23):
+    rng = random.Random(seed)
+    items = [CartItem(Product(f"SKU{i:06d}", f"Barang {i}", rng.randint(100, 2_000_000) / 100),
+                      rng.randint(1, 500)) for i in range(lines)]
+    discounts = {item.product.id: rng.choice((5, 10, 15, 25)) for item in items if rng.random() < 0.3}
+    return items, discounts
+
+
+def bertahap(items, discounts: dict, cart_pct: int) -> list[tuple]:
+    """Cara lama: tiap tahap menelusuri keranjang lagi, float per baris."""
+    nets = [item.subtotal * (1 - discounts.get(item.product.id, 0) / 100) for item in items]
+    total = sum(nets)
+    after_cart = [net - net / total * total * cart_pct / 100 for net in nets]
+    return [(item.product.id, round(dpp, 2), round(dpp * PPN_PERSEN / 100, 2))
+            for item, dpp in zip(items, after_cart)]
+
+
+def ukur(func, repeat: int) -> list[float]:
+    func()  # warmup
+    waktu = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        waktu.append(time.perf_counter() - start)
+    return waktu
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    items, discounts = buat_keranjang(args.lines)
+    pipeline = PricingPipeline(discounts, cart_discount=3, cart_discount_min=1_000_000)
+    print(f"Keranjang {len(items):,} baris, {len(discounts):,} diskon baris, diskon keranjang 3%, PPN {PPN_PERSEN}%")
+    kandidat = (
+        ("bertahap (float)", lambda: bertahap(items, discounts, 3)),
+        ("pipeline kolom", lambda: pipeline.price(items)),
+        ("pipeline + rincian", lambda: list(pipeline.price(items))),
+    )
+    for label, func in kandidat:
+        w = ukur(func, args.repeat)
+        median = statistics.median(w)
+        print(f"{label:>20}: median {median * 1e3:8.2f} ms, min {min(w) * 1e3:8.2f} ms, "
+              f"{len(items) / median:>12,.0f} baris/detik")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# bench_search.py
+# Latensi ProductSearchIndex pada katalog sintetis (default 2 juta produk):
+# kueri "kata lengkap + awalan kata berikutnya" seperti kasir yang sedang
+# mengetik, dan kueri satu awalan pendek, diurutkan menurut relevansi/harga.
+# Setiap set kueri dijalankan dua kali: dingin (cache hasil kosong) dan hangat.
+# Jalankan: python -m praktikum13.bench_search [--products 2000000] [--queries 2000]
+import argparse
+import itertools
+import random
+import statistics
+import resource
+import time
+
+from .models import Product
+from .search import ORDER_PRICE, ORDER_RELEVANCE, ProductSearchIndex
+
+SUKU_KATA = ["ka", "ri", "mo", "su", "la", "pe", "to", "na", "gi", "ba", "de", "ro",
+             "ma", "li", "ku", "sa", "te", "no", "pi", "ga", "bu", "ne", "da", "wi"]
+UKURAN = ["250ml", "500ml", "1l", "100g", "500g", "1kg", "s", "m", "l", "xl"]
+
+
+def buat_kosakata(rng: random.Random, jumlah: int) -> list[str]:
+    kata = set()
+    while len(kata) < jumlah:
+        kata.add("".join(rng.choice(SUKU_KATA) for _ in range(rng.randint(2, 4))))
+    return sorted(kata)
+
+
+def buat_katalog(jumlah: int, seed: int = 21):
+    rng = random.Random(seed)
+    merek = buat_kosakata(rng, 3_000)
+    kata = buat_kosakata(rng, 40_000)
+    # Distribusi kata mirip Zipf: sedikit kata sangat umum, banyak kata jarang
+    kumulatif = list(itertools.accumulate(1 / (i + 1) for i in range(len(kata))))
+    for i in range(jumlah):
+        nama = [rng.choice(merek).title()]
+        nama += [w.title() for w in rng.choices(kata, cum_weights=kumulatif, k=rng.randint(2, 3))]
+        nama.append(rng.choice(UKURAN))
+        yield Product(id=f"P{i:07d}", name=" ".join(nama), price=rng.randint(1, 5000) * 500)
+
+
+def ukur(index: ProductSearchIndex, queries: list[str], order_by: str) -> list[float]:
+    waktu = []
+    for q in queries:
+        start = time.perf_counter()
+        index.search(q, k=10, order_by=order_by)
+        waktu.append(time.perf_counter() - start)
+    return sorted(waktu)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--products", type=int, default=2_000_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    rss_awal = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    index = ProductSearchIndex()
+    names = []
+    for i, p in enumerate(buat_katalog(args.products)):
+        index.add(p)
+        if i % 100 == 0:
+            names.append(p.name)
+    build = time.perf_counter() - start
+    memory = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_awal) * 1024
+    print(f"{len(index):,} produk, {index.vocabulary:,} token, index dibangun {build:.1f}s, "
+          f"~{memory / len(index):.0f} byte/produk (RSS)")
+
+    rng = random.Random(7)
+    ketik = []
+    for _ in range(args.queries):
+        words = rng.choice(names).lower().split()
+        ketik.append(f"{words[0]} {words[1][:3]}")
+    awalan = [rng.choice(names).split()[1][:3] for _ in range(args.queries)]
+    # Kueri unik supaya tahap dingin benar-benar tidak terbantu cache
+    ketik, awalan = list(dict.fromkeys(ketik)), list(dict.fromkeys(awalan))
+
+    for label, queries in (("merek + awalan", ketik), ("satu awalan", awalan)):
+        for order_by in (ORDER_RELEVANCE, ORDER_PRICE):
+            index.clear_cache()
+            for tahap in ("dingin", "hangat"):
+                w = ukur(index, queries, order_by)
+                print(f"{label:>15} | {order_by:<9} | {tahap}: p50 {statistics.median(w) * 1e3:7.3f} ms, "
+                      f"p99 {w[int(len(w) * 0.99) - 1] * 1e3:7.3f} ms")
+
+    start = time.perf_counter()
+    for i in range(10_000):
+        index.reprice(f"P{i:07d}", 1000)
+    print(f"reprice: {(time.perf_counter() - start) / 10_000 * 1e6:.2f} us/produk")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# bench_wallet.py
+# Throughput reserve+commit WalletLedger di bawah kontensi: banyak thread
+# mendebit sedikit akun (hot) atau banyak akun (tersebar), dengan satu
+# lock global (shards=1) dibandingkan sharded lock, dengan/tanpa journal.
+# Jalankan: python -m praktikum13.bench_wallet [--threads 32] [--ops 2000] [--fsync]
+import argparse
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from .wallet import WalletLedger
+
+
+def jalankan(threads: int, ops: int, accounts: int, shards: int, journal: str | None, sync: bool) -> float:
+    ledger = WalletLedger(journal_path=journal, shards=shards, sync=sync)
+    customers = [f"C{i}" for i in range(accounts)]
+    for c in customers:
+        ledger.open_account(c, initial=10 ** 12)
+    start_gate = threading.Barrier(threads + 1)
+
+    def worker(idx: int):
+        start_gate.wait()
+        for i in range(ops):
+            with ledger.reservation(customers[(idx * 7919 + i) % accounts], 1_000):
+                pass
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    start_gate.wait()
+    start = time.perf_counter()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - start
+    ledger.close()
+    return threads * ops / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--ops", type=int, default=2000, help="debit per thread")
+    parser.add_argument("--fsync", action="store_true", help="ikut ukur journal dengan fsync per record")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    journals = [("tanpa journal", False, False), ("journal flush", True, False)]
+    if args.fsync:
+        journals.append(("journal fsync", True, True))
+
+    print(f"{args.threads} thread x {args.ops} debit (reserve+commit)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, pakai_journal, sync in journals:
+            for accounts in (8, 10_000):
+                for shards in (1, 64):
+                    path = os.path.join(tmp, f"{label}-{accounts}-{shards}.journal") if pakai_journal else None
+                    rate = jalankan(args.threads, args.ops, accounts, shards, path, sync)
+                    print(f"{label:>14} | {accounts:>6} akun | shards={shards:<3}: {rate:>10,.0f} debit/detik")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# fake_gateway.py
+"""Gateway pembayaran palsu untuk pengujian GatewayClient.
+
+Server TCP lokal yang bisa menyuntikkan latensi dan fault:
+- error_rate : balas "ERR" tanpa menagih (kegagalan sementara).
+- drop_rate  : tagihan DIPROSES lalu koneksi diputus tanpa balasan,
+               mensimulasikan timeout yang rawan double charge.
+- decline_over : nominal di atas batas ini ditolak (DECLINED).
+Idempotency key yang sama selalu menghasilkan balasan yang sama.
+"""
+import random
+import socketserver
+import threading
+import time
+import uuid
+
+
+class FakeGateway(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, drop_rate: float = 0.0,
+                 decline_over: float = float("inf"), seed: int | None = None):
+        super().__init__(("127.0.0.1", 0), _GatewayHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.decline_over = decline_over
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.results: dict[str, str] = {}   # idempotency_key -> balasan
+        self.charges = 0                    # jumlah tagihan yang benar-benar dibuat
+        self.connections = 0
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self) -> "FakeGateway":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def handle_charge(self, key: str, amount: float) -> str | None:
+        """Mengembalikan balasan, atau None untuk memutus koneksi."""
+        if self.latency:
+            time.sleep(self.latency)
+        with self.lock:
+            roll = self.rng.random()
+            if key in self.results:
+                return self.results[key]
+            if roll < self.error_rate:
+                return "ERR gateway sibuk"
+            reply = "DECLINED" if amount > self.decline_over else f"OK {uuid.uuid4().hex[:12]}"
+            self.results[key] = reply
+            if reply.startswith("OK"):
+                self.charges += 1
+            if roll < self.error_rate + self.drop_rate:
+                return None
+            return reply
+
+
+class _GatewayHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        with self.server.lock:
+            self.server.connections += 1
+        for line in self.rfile:
+            parts = line.decode().split()
+            if len(parts) != 3 or parts[0] != "CHARGE":
+                self.wfile.write(b"ERR perintah tidak valid\n")
+                continue
+            reply = self.server.handle_charge(parts[1], float(parts[2]))
+            if reply is None:
+                return  # putus tanpa balasan
+            self.wfile.write(reply.encode() + b"\n")
@@ -0,0 +1,280 @@
+# gateway.py
+"""Lapisan klien gateway pembayaran di bawah IPaymentProcessor.
+
+Isi modul:
+- ConnectionPool   : koneksi TCP persisten dengan ukuran maksimum.
+- RetryBudget      : membatasi jumlah retry relatif terhadap jumlah request.
+- CircuitBreaker   : memutus panggilan sementara jika gateway terus gagal.
+- GatewayClient    : charge() dengan idempotency key dan exponential backoff.
+- GatewayPayment   : implementasi IPaymentProcessor di atas GatewayClient.
+
+Protokol gateway berbasis baris:
+    CHARGE <idempotency_key> <amount>  ->  OK <txn_id> | DECLINED | ERR <pesan>
+"""
+import random
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+
+from praktikum_common.log_facade import get_logger, Rupiah
+from .services import IPaymentProcessor
+
+LOGGER = get_logger('GATEWAY')
+
+
+class GatewayError(Exception):
+    """Kegagalan sementara (timeout, koneksi putus, ERR dari gateway)."""
+
+
+class CircuitOpenError(GatewayError):
+    """Circuit breaker sedang terbuka; request tidak dikirim."""
+
+
+# --- POOL KONEKSI ---
+class ConnectionPool:
+    """Pool koneksi TCP persisten ke gateway (maksimum max_size koneksi)."""
+    def __init__(self, host: str, port: int, max_size: int = 10,
+                 connect_timeout: float = 2.0, read_timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._idle: deque = deque()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def acquire(self, timeout: float | None = None):
+        """Mengambil koneksi idle atau membuat yang baru (menunggu jika pool penuh)."""
+        if not self._slots.acquire(timeout=timeout):
+            raise GatewayError("Pool koneksi penuh")
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        try:
+            sock = socket.create_connection((self.host, self.port), timeout=self.connect_timeout)
+        except OSError as e:
+            self._slots.release()
+            raise GatewayError(f"Gagal terhubung ke gateway: {e}") from e
+        sock.settimeout(self.read_timeout)
+        with self._lock:
+            self.created += 1
+        return _Connection(sock)
+
+    def release(self, conn: "_Connection", broken: bool = False):
+        """Mengembalikan koneksi ke pool; koneksi rusak langsung ditutup."""
+        if broken:
+            conn.close()
+        else:
+            with self._lock:
+                self._idle.append(conn)
+        self._slots.release()
+
+    def close(self):
+        with self._lock:
+            while self._idle:
+                self._idle.pop().close()
+
+
+class _Connection:
+    __slots__ = ("sock", "file")
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.file = sock.makefile("rb")
+
+    def request(self, line: str) -> str:
+        try:
+            self.sock.sendall(line.encode() + b"\n")
+            reply = self.file.readline()
+        except (OSError, socket.timeout) as e:
+            raise GatewayError(f"I/O gateway gagal: {e}") from e
+        if not reply:
+            raise GatewayError("Koneksi ditutup oleh gateway")
+        return reply.decode().strip()
+
+    def close(self):
+        try:
+            self.file.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+
+# --- RETRY BUDGET ---
+class RetryBudget:
+    """Retry hanya diizinkan selama jumlahnya <= ratio * request + min_retries
+    dalam jendela waktu `window` detik, supaya retry tidak memperparah
+    gateway yang sedang bermasalah."""
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0,
+                 clock=time.monotonic):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._clock = clock
+        self._requests: deque = deque()
+        self._retries: deque = deque()
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float):
+        for events in (self._requests, self._retries):
+            while events and events[0] <= now - self.window:
+                events.popleft()
+
+    def record_request(self):
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            self._requests.append(now)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            if len(self._retries) >= self.ratio * len(self._requests) + self.min_retries:
+                return False
+            self._retries.append(now)
+            return True
+
+
+# --- CIRCUIT BREAKER ---
+class CircuitBreaker:
+    """CLOSED -> OPEN setelah failure_threshold kegagalan beruntun; setelah
+    reset_timeout berubah ke HALF_OPEN dan satu request percobaan menentukan
+    apakah kembali CLOSED atau OPEN lagi."""
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 5.0,
+                 clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    LOGGER.warning("Circuit breaker gateway OPEN setelah %d kegagalan", self._failures)
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+
+# --- KLIEN GATEWAY ---
+class GatewayClient:
+    """Mengirim charge ke gateway dengan pool, retry + backoff, dan breaker.
+
+    Idempotency key yang sama dipakai di setiap retry, sehingga gateway
+    tidak menagih dua kali walaupun balasan pertama hilang (timeout).
+    """
+    def __init__(self, pool: ConnectionPool, max_attempts: int = 4,
+                 base_delay: float = 0.05, max_delay: float = 1.0,
+                 budget: RetryBudget | None = None, breaker: CircuitBreaker | None = None,
+                 sleep=time.sleep):
+        self.pool = pool
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget or RetryBudget()
+        self.breaker = breaker or CircuitBreaker()
+        self._sleep = sleep
+
+    def charge(self, amount: float, idempotency_key: str) -> bool:
+        """
+        Returns:
+            bool: True jika disetujui, False jika ditolak (DECLINED).
+
+        Raises:
+            GatewayError: Jika semua percobaan gagal, budget retry habis,
+                atau circuit breaker terbuka.
+        """
+        self.budget.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            if not self.breaker.allow():
+                raise CircuitOpenError("Gateway sedang tidak tersedia (circuit open)")
+            try:
+                reply = self._send(f"CHARGE {idempotency_key} {amount:.2f}")
+            except GatewayError as e:
+                self.breaker.record_failure()
+                if attempt >= self.max_attempts or not self.budget.try_spend():
+                    raise
+                delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+                LOGGER.warning("Charge %s gagal (%s), retry ke-%d dalam %.3fs",
+                               idempotency_key, e, attempt, delay)
+                self._sleep(random.uniform(0, delay))  # full jitter
+                continue
+            self.breaker.record_success()
+            return reply.startswith("OK")
+
+    def _send(self, line: str) -> str:
+        conn = self.pool.acquire(timeout=self.pool.read_timeout)
+        try:
+            reply = conn.request(line)
+        except GatewayError:
+            self.pool.release(conn, broken=True)
+            raise
+        self.pool.release(conn)
+        if reply.startswith("ERR"):
+            raise GatewayError(reply)
+        return reply
+
+
+# --- IMPLEMENTASI IPaymentProcessor ---
+class GatewayPayment(IPaymentProcessor):
+    """Pembayaran lewat gateway jaringan (kartu debit/kredit, e-wallet)."""
+    def __init__(self, client: GatewayClient):
+        self.client = client
+
+    def process(self, amount: float, idempotency_key: str | None = None) -> bool:
+        """Menagih `amount` sekali per idempotency_key.
+
+        idempotency_key sebaiknya id order/transaksi dari pemanggil, supaya
+        pemanggil yang mengulang process() setelah balasan hilang tidak
+        menagih dua kali. Tanpa key, dibuat key acak yang hanya melindungi
+        retry internal GatewayClient.
+        """
+        key = idempotency_key or uuid.uuid4().hex
+        try:
+            ok = self.client.charge(amount, key)
+        except GatewayError as e:
+            LOGGER.error("Pembayaran %s gagal: %s", Rupiah(amount), e)
+            return False
+        LOGGER.info("Gateway %s untuk %s", "menyetujui" if ok else "menolak", Rupiah(amount))
+        return ok
@@ -1,15 +1,16 @@
 # models.py
+from array import array
 from dataclasses import dataclass
-from typing import List
+from typing import Iterable, Iterator, List
 
-@dataclass
+@dataclass(slots=True)
 class Product:
     """Struktur data untuk Produk."""
     id: str
     name: str
     price: float
 
-@dataclass
+@dataclass(slots=True)
 class CartItem:
     """Struktur data untuk item dalam keranjang."""
     product: Product
@@ -18,4 +19,85 @@ class CartItem:
     @property
     def subtotal(self) -> float:
         """Menghitung subtotal untuk item ini."""
-        return self.product.price * self.quantity
\ No newline at end of file
+        return self.product.price * self.quantity
+
+
+class ProductView:
+    """View ringan ke satu baris ProductTable (bisa dipakai seperti Product)."""
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "ProductTable", row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def id(self) -> str:
+        return self._table._ids[self._row]
+
+    @property
+    def name(self) -> str:
+        return self._table._names[self._row]
+
+    @property
+    def price(self) -> float:
+        return self._table._prices[self._row]
+
+    def to_product(self) -> Product:
+        return Product(id=self.id, name=self.name, price=self.price)
+
+    def __repr__(self):
+        return f"ProductView(id={self.id!r}, name={self.name!r}, price={self.price!r})"
+
+
+class ProductTable:
+    """Penyimpanan produk secara kolumnar.
+
+    id dan name disimpan dalam list, harga dalam array('d') yang kontigu,
+    sehingga tidak ada objek Product per baris sampai diminta.
+    """
+    def __init__(self, products: Iterable[Product] = ()):
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._prices = array('d')
+        self._index: dict[str, int] = {}
+        for p in products:
+            self.add(p.id, p.name, p.price)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, product_id: str, name: str, price: float):
+        """Menambah produk baru, atau memperbarui jika id sudah ada."""
+        row = self._index.get(product_id)
+        if row is not None:
+            self._names[row] = name
+            self._prices[row] = price
+            return
+        self._index[product_id] = len(self._ids)
+        self._ids.append(product_id)
+        self._names.append(name)
+        self._prices.append(price)
+
+    def get(self, product_id: str) -> ProductView | None:
+        row = self._index.get(product_id)
+        return ProductView(self, row) if row is not None else None
+
+    def set_price(self, product_id: str, price: float):
+        self._prices[self._index[product_id]] = price
+
+    # --- Akses per baris (untuk index yang menyimpan nomor baris) ---
+    def row_of(self, product_id: str) -> int | None:
+        """Nomor baris produk, atau None jika id tidak dikenal."""
+        return self._index.get(product_id)
+
+    @property
+    def prices(self) -> array:
+        """Kolom harga per baris. Hanya untuk dibaca; ubah lewat set_price()."""
+        return self._prices
+
+    def product_at(self, row: int) -> Product:
+        return Product(id=self._ids[row], name=self._names[row], price=self._prices[row])
+
+    def __iter__(self) -> Iterator[ProductView]:
+        for row in range(len(self._ids)):
+            yield ProductView(self, row)
@@ -0,0 +1,259 @@
+# order_journal.py
+"""Journal write-ahead biner untuk order yang selesai checkout.
+
+- Setiap order ditulis sebagai record biner ber-CRC ke segmen WAL.
+- Group commit: banyak checkout yang datang bersamaan ditulis lalu di-fsync
+  SEKALI oleh thread flusher, sehingga fsync tidak membatasi checkout/detik.
+  append() baru kembali setelah record-nya benar-benar durable.
+- Snapshot berkala: ringkasan state (jumlah order, omzet, unit terjual per
+  produk) ditulis atomik, segmen lama dihapus, sehingga replay saat start
+  hanya membaca record setelah snapshot terakhir.
+
+Format record:  <panjang u32><crc32 u32><payload>
+Payload      :  seq u64, timestamp f64, total_sen i64, jumlah_baris u16,
+                lalu per baris: len(id) u8, id, quantity u32, harga_sen i64
+"""
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+
+from praktikum_common.log_facade import get_logger
+from praktikum_common.money import ke_sen
+
+LOGGER = get_logger('ORDER_JOURNAL')
+
+_HEADER = struct.Struct("<II")
+_ORDER = struct.Struct("<QdqH")
+_LINE = struct.Struct("<Iq")
+
+SNAPSHOT_FILE = "orders.snapshot"
+
+
+@dataclass(slots=True)
+class OrderRecord:
+    """Satu order yang sudah dibayar."""
+    lines: tuple  # ((product_id, quantity, harga_satuan), ...)
+    total: float
+    timestamp: float = 0.0
+    seq: int = 0
+
+    @classmethod
+    def from_cart(cls, cart, total: float | None = None) -> "OrderRecord":
+        """total: jumlah yang ditagih (setelah diskon/PPN); default total keranjang."""
+        lines = tuple((item.product.id, item.quantity, item.product.price) for item in cart.get_items())
+        total = cart.total_price if total is None else total
+        return cls(lines=lines, total=total, timestamp=time.time())
+
+    def encode(self) -> bytes:
+        parts = [_ORDER.pack(self.seq, self.timestamp, ke_sen(self.total), len(self.lines))]
+        for product_id, quantity, price in self.lines:
+            raw = product_id.encode()
+            parts.append(bytes((len(raw),)) + raw + _LINE.pack(quantity, ke_sen(price)))
+        payload = b"".join(parts)
+        return _HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+    @classmethod
+    def decode(cls, payload: bytes) -> "OrderRecord":
+        seq, timestamp, total_sen, count = _ORDER.unpack_from(payload)
+        offset = _ORDER.size
+        lines = []
+        for _ in range(count):
+            size = payload[offset]
+            product_id = payload[offset + 1:offset + 1 + size].decode()
+            offset += 1 + size
+            quantity, price_sen = _LINE.unpack_from(payload, offset)
+            offset += _LINE.size
+            lines.append((product_id, quantity, price_sen / 100))
+        return cls(lines=tuple(lines), total=total_sen / 100, timestamp=timestamp, seq=seq)
+
+
+@dataclass(slots=True)
+class OrderStats:
+    """State yang dipulihkan dari snapshot + replay journal."""
+    last_seq: int = 0
+    orders: int = 0
+    revenue_sen: int = 0
+    units_sold: dict = field(default_factory=dict)
+
+    def apply(self, record: OrderRecord):
+        self.last_seq = record.seq
+        self.orders += 1
+        self.revenue_sen += ke_sen(record.total)
+        for product_id, quantity, _ in record.lines:
+            self.units_sold[product_id] = self.units_sold.get(product_id, 0) + quantity
+
+
+def read_segment(path: str) -> tuple[list[OrderRecord], int]:
+    """Membaca record utuh dari satu segmen dan offset akhir yang valid;
+    berhenti pada record terpotong atau CRC salah (tulisan terakhir sebelum crash)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    records = []
+    offset = 0
+    while offset + _HEADER.size <= len(data):
+        size, crc = _HEADER.unpack_from(data, offset)
+        payload = data[offset + _HEADER.size:offset + _HEADER.size + size]
+        if len(payload) < size or zlib.crc32(payload) != crc:
+            break
+        records.append(OrderRecord.decode(payload))
+        offset += _HEADER.size + size
+    return records, offset
+
+
+class OrderJournal:
+    """Journal order durable dengan group commit dan snapshot berkala.
+
+    group_commit=False menulis dan fsync setiap order sendiri-sendiri
+    (dipakai sebagai pembanding di bench_order_journal.py).
+    """
+    def __init__(self, directory: str, group_commit: bool = True,
+                 snapshot_every: int = 10_000, max_batch: int = 1024):
+        self.directory = directory
+        self.group_commit = group_commit
+        self.snapshot_every = snapshot_every
+        self.max_batch = max_batch
+        os.makedirs(directory, exist_ok=True)
+
+        self.stats = self._recover()
+        self._next_seq = self.stats.last_seq + 1
+        self._since_snapshot = 0
+        self._file = self._open_segment(self._next_seq)
+
+        lock = threading.Lock()
+        self._work = threading.Condition(lock)   # flusher menunggu order baru
+        self._done = threading.Condition(lock)   # checkout menunggu durable
+        self._pending: list[OrderRecord] = []
+        self._durable_seq = self.stats.last_seq
+        self._error: BaseException | None = None
+        self._closed = False
+        self.fsyncs = 0
+        self._flusher = None
+        if group_commit:
+            self._flusher = threading.Thread(target=self._flush_loop, name="order-journal", daemon=True)
+            self._flusher.start()
+
+    # --- Pemulihan ---
+    def _segments(self) -> list[tuple[int, str]]:
+        names = (n for n in os.listdir(self.directory) if n.startswith("orders-") and n.endswith(".wal"))
+        return sorted((int(n[7:-4]), os.path.join(self.directory, n)) for n in names)
+
+    def _recover(self) -> OrderStats:
+        stats = OrderStats()
+        snapshot = os.path.join(self.directory, SNAPSHOT_FILE)
+        if os.path.exists(snapshot):
+            with open(snapshot, encoding="utf-8") as f:
+                stats = OrderStats(**json.load(f))
+        replayed = 0
+        for _, path in self._segments():
+            records, valid_end = read_segment(path)
+            for record in records:
+                if record.seq > stats.last_seq:
+                    stats.apply(record)
+                    replayed += 1
+            if valid_end < os.path.getsize(path):
+                # Buang ekor rusak agar segmen bisa dilanjutkan dengan aman
+                LOGGER.warning("Ekor rusak di %s dipotong pada offset %d.", path, valid_end)
+                os.truncate(path, valid_end)
+        LOGGER.info("Journal order dipulihkan: snapshot s/d #%d, %d record di-replay.",
+                    stats.last_seq - replayed, replayed)
+        return stats
+
+    def _open_segment(self, first_seq: int):
+        path = os.path.join(self.directory, f"orders-{first_seq:012d}.wal")
+        return open(path, "ab")
+
+    # --- Penulisan ---
+    def append(self, record: OrderRecord) -> int:
+        """Menulis order dan menunggu sampai durable. Mengembalikan nomor urut."""
+        with self._work:
+            if self._closed:
+                raise RuntimeError("Journal order sudah ditutup")
+            record.seq = seq = self._next_seq
+            self._next_seq += 1
+            if not self.group_commit:
+                self._write_batch([record])
+                self._durable_seq = seq
+                return seq
+            self._pending.append(record)
+            self._work.notify()
+            while self._durable_seq < seq and self._error is None:
+                self._done.wait()
+            if self._error is not None:
+                raise OSError("Journal order gagal ditulis") from self._error
+        return seq
+
+    def _flush_loop(self):
+        while True:
+            with self._work:
+                while not self._pending and not self._closed:
+                    self._work.wait()
+                if not self._pending:
+                    return
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+            # Tulis + fsync di luar lock: checkout baru tetap bisa antre
+            try:
+                self._write_batch(batch)
+            except BaseException as e:
+                LOGGER.exception("Gagal menulis journal order.")
+                with self._done:
+                    self._error = e
+                    self._done.notify_all()
+                return
+            with self._done:
+                self._durable_seq = batch[-1].seq
+                self._done.notify_all()
+
+    def _write_batch(self, batch: list[OrderRecord]):
+        self._file.write(b"".join(record.encode() for record in batch))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.fsyncs += 1
+        for record in batch:
+            self.stats.apply(record)
+        self._since_snapshot += len(batch)
+        if self._since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    # --- Snapshot ---
+    def snapshot(self):
+        """Menulis state atomik lalu memulai segmen baru dan menghapus segmen lama.
+
+        Hanya dipanggil dari jalur penulis (flusher atau append sinkron)."""
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"last_seq": self.stats.last_seq, "orders": self.stats.orders,
+                       "revenue_sen": self.stats.revenue_sen, "units_sold": self.stats.units_sold}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        self._fsync_directory()
+
+        self._file.close()
+        self._file = self._open_segment(self.stats.last_seq + 1)
+        for first_seq, segment in self._segments():
+            if first_seq <= self.stats.last_seq:
+                os.remove(segment)
+        self._since_snapshot = 0
+        LOGGER.info("Snapshot journal order dibuat s/d #%d.", self.stats.last_seq)
+
+    def _fsync_directory(self):
+        if hasattr(os, "O_DIRECTORY"):
+            fd = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def close(self):
+        with self._work:
+            self._closed = True
+            self._work.notify()
+        if self._flusher is not None:
+            self._flusher.join()
+        self._file.close()
@@ -0,0 +1,70 @@
+# pos_loadgen.py
+"""Load generator untuk pos_server.py: mensimulasikan banyak kasir sekaligus.
+
+Setiap till membuka satu koneksi, memindai sejumlah produk, lalu checkout,
+berulang beberapa kali. Di akhir ditampilkan throughput dan latensi.
+
+Contoh:
+    python -m praktikum13.pos_server &
+    python -m praktikum13.pos_loadgen --tills 500 --baskets 5 --scans 10
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+PRODUCT_IDS = ["P001", "P002", "P003"]
+
+
+async def till(till_id: int, args, latencies: list, errors: list):
+    rng = random.Random(till_id)
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+
+    async def request(line: str) -> str:
+        start = time.perf_counter()
+        writer.write(line.encode() + b"\n")
+        await writer.drain()
+        reply = (await reader.readline()).decode().strip()
+        latencies.append(time.perf_counter() - start)
+        if not reply.startswith("OK"):
+            errors.append(reply)
+        return reply
+
+    for _ in range(args.baskets):
+        for _ in range(args.scans):
+            await request(f"ADD {rng.choice(PRODUCT_IDS)} {rng.randint(1, 3)}")
+        await request("CHECKOUT")
+    await request("QUIT")
+    writer.close()
+    await writer.wait_closed()
+
+
+async def main(args):
+    latencies: list[float] = []
+    errors: list[str] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(till(i, args, latencies, errors) for i in range(args.tills)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    checkouts = args.tills * args.baskets
+    print(f"{args.tills} till, {len(latencies):,} request dalam {elapsed:.2f}s")
+    print(f"  throughput : {len(latencies) / elapsed:,.0f} request/detik, {checkouts / elapsed:,.0f} checkout/detik")
+    print(f"  latensi    : p50 {statistics.median(latencies) * 1e3:.2f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1e3:.2f} ms")
+    print(f"  error      : {len(errors)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="path Unix socket server")
+    parser.add_argument("--tills", type=int, default=500)
+    parser.add_argument("--baskets", type=int, default=5, help="checkout per till")
+    parser.add_argument("--scans", type=int, default=10, help="scan per keranjang")
+    asyncio.run(main(parser.parse_args()))
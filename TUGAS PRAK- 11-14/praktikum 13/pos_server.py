@@ -0,0 +1,143 @@
+# pos_server.py
+"""Front end POS berbasis asyncio: banyak terminal kasir dalam satu proses.
+
+Setiap koneksi TCP/Unix socket adalah satu sesi kasir dengan PosApp dan
+keranjang sendiri, sedangkan repository (beserta cache-nya) dan payment
+processor dipakai bersama oleh semua sesi.
+
+Protokol berbasis baris (UTF-8), satu perintah per baris:
+    ADD <product_id> [jumlah]  -> OK <product_id> <total> | ERR <pesan>
+    SCAN <id>[:jumlah] ...     -> OK <total>              | ERR <pesan>
+                                  (ID yang ditemukan tetap masuk keranjang)
+    TOTAL                      -> OK <total>
+    CHECKOUT                   -> OK PAID <total>         | ERR <pesan>
+    QUIT                       -> OK BYE (koneksi ditutup)
+
+Checkout bisa menunggu fsync journal, retry gateway, atau lock wallet,
+jadi dijalankan di thread pool (asyncio.to_thread) agar terminal lain
+tetap dilayani. Perintah satu sesi tetap berurutan: baris berikutnya
+baru dibaca setelah balasan perintah sebelumnya dikirim.
+"""
+import argparse
+import asyncio
+import logging
+
+from praktikum_common.log_facade import get_logger, setup_logging
+from .repositories import IProductRepository, ProductRepository, CachedVersionedRepository
+from .services import IPaymentProcessor, CashPayment
+from .tugas_mandiri import PosApp
+
+LOGGER = get_logger('POS_SERVER')
+
+
+class PosServer:
+    """Melayani banyak sesi PosApp secara bersamaan di satu event loop."""
+    def __init__(self, repository: IProductRepository, payment_processor: IPaymentProcessor):
+        # Dependency bersama untuk semua sesi (DI)
+        self.repository = repository
+        self.payment_processor = payment_processor
+        self.active_sessions = 0
+        self.completed_checkouts = 0
+
+    async def handle_session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Satu koneksi = satu terminal kasir dengan keranjang sendiri."""
+        app = PosApp(repository=self.repository, payment_processor=self.payment_processor)
+        self.active_sessions += 1
+        try:
+            while line := await reader.readline():
+                reply = await self.execute(app, line.decode("utf-8", "replace").split())
+                writer.write(reply.encode("utf-8") + b"\n")
+                await writer.drain()
+                if reply == "OK BYE":
+                    break
+        except ConnectionError:
+            LOGGER.warning("Koneksi terminal terputus.")
+        finally:
+            self.active_sessions -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def execute(self, app: PosApp, parts: list[str]) -> str:
+        """Menjalankan satu perintah untuk sesi `app` dan mengembalikan balasan.
+
+        Pemanggil wajib menunggu balasan sebelum mengirim perintah berikutnya
+        untuk sesi yang sama (handle_session melakukannya).
+        """
+        if not parts:
+            return "ERR perintah kosong"
+        command = parts[0].upper()
+        if command == "ADD" and len(parts) in (2, 3):
+            try:
+                quantity = int(parts[2]) if len(parts) == 3 else 1
+                product = app.add_item(parts[1], quantity)
+            except ValueError:
+                return "ERR jumlah tidak valid"
+            if product is None:
+                return f"ERR produk {parts[1]} tidak ditemukan"
+            return f"OK {product.id} {app.cart.total_price:.2f}"
+        if command == "SCAN" and len(parts) > 1:
+            try:
+                lines = [_scan_line(token) for token in parts[1:]]
+            except ValueError:
+                return "ERR jumlah tidak valid"
+            missing = app.add_scanned(lines)
+            if missing:
+                return f"ERR produk tidak ditemukan: {' '.join(missing)}"
+            return f"OK {app.cart.total_price:.2f}"
+        if command == "TOTAL":
+            return f"OK {app.cart.total_price:.2f}"
+        if command == "CHECKOUT":
+            total = app.cart.total_price
+            if not await asyncio.to_thread(app.checkout):
+                return "ERR checkout gagal"
+            self.completed_checkouts += 1
+            return f"OK PAID {total:.2f}"
+        if command == "QUIT":
+            return "OK BYE"
+        return f"ERR perintah tidak dikenal: {parts[0]}"
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765,
+                    unix_path: str | None = None) -> asyncio.AbstractServer:
+        """Membuka server TCP (atau Unix socket jika unix_path diisi)."""
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_session, path=unix_path)
+        else:
+            server = await asyncio.start_server(self.handle_session, host, port, backlog=1024)
+        LOGGER.warning("POS server siap di %s", unix_path or f"{host}:{port}")
+        return server
+
+
+def _scan_line(token: str) -> tuple[str, int]:
+    """'P001:3' -> ('P001', 3); tanpa ':' berarti satu unit."""
+    product_id, _, quantity = token.partition(":")
+    quantity = int(quantity) if quantity else 1
+    if quantity <= 0:
+        raise ValueError(f"Jumlah harus positif: {token}")
+    return product_id, quantity
+
+
+async def _main(args):
+    # Cache per versi katalog; keranjang setiap sesi membaca lewat cache versi saat dibuat
+    repo = CachedVersionedRepository(ProductRepository(), max_size=10_000, ttl=300)
+    pos_server = PosServer(repository=repo, payment_processor=CashPayment())
+    server = await pos_server.serve(args.host, args.port, args.unix)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="POS server asyncio untuk banyak terminal")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="path Unix socket (menggantikan TCP)")
+    args = parser.parse_args()
+
+    # Log per item di-nonaktifkan; hanya peringatan yang ditulis, di luar thread event loop
+    setup_logging(level=logging.WARNING, non_blocking=True)
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
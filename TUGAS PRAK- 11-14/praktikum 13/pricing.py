@@ -0,0 +1,167 @@
+# pricing.py
+"""Pipeline harga keranjang: diskon baris -> diskon keranjang -> PPN -> pembulatan.
+
+- Semua nominal dihitung dalam sen (int), jadi tidak ada galat float dan
+  setiap tahap membulatkan half-up secara eksplisit.
+- Keranjang hanya dibaca sekali menjadi kolom (array('q')); setiap tahap
+  bekerja atas kolom dengan map() di level C, bukan menelusuri CartItem
+  ulang per tahap.
+- Diskon keranjang dan PPN dihitung dari total lalu dialokasikan ke baris
+  secara proporsional dengan pembulatan kumulatif, sehingga jumlah rincian
+  per baris selalu sama persis dengan totalnya.
+- Pembulatan akhir (mis. ke Rp1 atau Rp100 untuk tunai) hanya diterapkan
+  pada total keranjang dan dicatat terpisah sebagai `rounding`.
+"""
+from array import array
+from dataclasses import dataclass
+from itertools import accumulate, islice, repeat
+from operator import add, attrgetter, floordiv, mul, sub
+from typing import Iterable, Iterator, Mapping
+
+from praktikum_common.log_facade import get_logger
+from praktikum_common.money import bagi_bulat, ke_sen
+from .models import CartItem
+
+LOGGER = get_logger('PRICING')
+
+PPN_PERSEN = 10  # PPN 10% dihitung dari harga setelah semua diskon (DPP)
+
+
+def _alokasi_tarif(bobot: array, persen: int, jumlah: int) -> array:
+    """Membagi `jumlah` (= persen% dari total bobot, dibulatkan half-up) ke setiap baris.
+
+    Batas kumulatif bagi_bulat(kumulatif_bobot * persen, 100) dihitung dulu,
+    lalu bagian baris = selisih batas berurutan. Batas terakhir sama dengan
+    `jumlah` dengan sendirinya, batas tidak pernah turun (tidak ada bagian
+    negatif), dan baris berbobot 0 tidak mendapat bagian.
+    """
+    if jumlah == 0:
+        return array('q', [0]) * len(bobot)
+    # (x + 50) // 100 = bagi_bulat(x, 100) untuk x >= 0, tetapi tetap di level C
+    batas = [0]
+    batas += map(floordiv, map(add, map(mul, accumulate(bobot), repeat(persen)), repeat(50)),
+                 repeat(100))
+    return array('q', map(sub, islice(batas, 1, None), batas))
+
+
+def _cek_persen(nama: str, persen: int) -> int:
+    if not 0 <= persen <= 100:
+        raise ValueError(f"{nama} harus di antara 0 dan 100: {persen}")
+    return persen
+
+
+@dataclass(slots=True)
+class PricedLine:
+    """Rincian harga satu baris keranjang (semua nominal dalam sen)."""
+    product_id: str
+    quantity: int
+    gross: int
+    line_discount: int
+    cart_discount: int
+    ppn: int
+    total: int
+
+
+class PriceBreakdown:
+    """Hasil pipeline harga secara kolumnar (semua nominal dalam sen).
+
+    Setiap kolom punya satu nilai per baris keranjang; PricedLine hanya
+    dibentuk saat baris diminta.
+    """
+    __slots__ = ("product_ids", "quantities", "gross", "line_discount", "cart_discount",
+                 "ppn", "line_total", "rounding")
+
+    def __init__(self, product_ids: list[str], quantities: array, gross: array, line_discount: array,
+                 cart_discount: array, ppn: array, line_total: array, rounding: int):
+        self.product_ids = product_ids
+        self.quantities = quantities
+        self.gross = gross
+        self.line_discount = line_discount
+        self.cart_discount = cart_discount
+        self.ppn = ppn
+        self.line_total = line_total
+        self.rounding = rounding
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+    def line(self, row: int) -> PricedLine:
+        return PricedLine(self.product_ids[row], self.quantities[row], self.gross[row],
+                          self.line_discount[row], self.cart_discount[row], self.ppn[row],
+                          self.line_total[row])
+
+    def __iter__(self) -> Iterator[PricedLine]:
+        return map(self.line, range(len(self.product_ids)))
+
+    @property
+    def total_sen(self) -> int:
+        """Total yang ditagih setelah pembulatan akhir."""
+        return sum(self.line_total) + self.rounding
+
+    @property
+    def total(self) -> float:
+        """Total yang ditagih dalam rupiah."""
+        return self.total_sen / 100
+
+
+class PricingPipeline:
+    """Menghitung harga akhir keranjang dalam satu lintasan kolom.
+
+    Args:
+        line_discounts: Persentase diskon (0-100) per product_id.
+        cart_discount: Persentase diskon keranjang dari total setelah diskon baris.
+        cart_discount_min: Total minimal (rupiah) agar diskon keranjang berlaku.
+        ppn_persen: Tarif PPN dari DPP (harga setelah semua diskon).
+        pembulatan: Satuan pembulatan total akhir dalam rupiah (0.01 = tanpa pembulatan).
+    """
+    def __init__(self, line_discounts: Mapping[str, int] | None = None, cart_discount: int = 0,
+                 cart_discount_min: float = 0, ppn_persen: int = PPN_PERSEN, pembulatan: float = 1):
+        self.line_discounts = {product_id: _cek_persen(f"Diskon {product_id}", persen)
+                               for product_id, persen in (line_discounts or {}).items()}
+        self.cart_discount = _cek_persen("Diskon keranjang", cart_discount)
+        self.cart_discount_min = ke_sen(cart_discount_min)
+        self.ppn_persen = _cek_persen("PPN", ppn_persen)
+        self.pembulatan = ke_sen(pembulatan)
+        if self.pembulatan <= 0:
+            raise ValueError(f"Satuan pembulatan harus positif: {pembulatan}")
+
+    def price(self, items: Iterable[CartItem]) -> PriceBreakdown:
+        items = items if isinstance(items, list) else list(items)
+        n = len(items)
+
+        # Satu-satunya pembacaan keranjang: CartItem -> kolom
+        products = list(map(attrgetter("product"), items))
+        product_ids = list(map(attrgetter("id"), products))
+        quantities = array('q', map(attrgetter("quantity"), items))
+        units = list(map(ke_sen, map(attrgetter("price"), products)))
+        gross = array('q', map(mul, units, quantities))
+
+        # 1. Diskon baris: gross * persen / 100, half-up
+        if self.line_discounts:
+            persen = map(self.line_discounts.get, product_ids, repeat(0))
+            line_discount = array('q', map(floordiv, map(add, map(mul, gross, persen), repeat(50)),
+                                           repeat(100)))
+            net = array('q', map(sub, gross, line_discount))
+        else:
+            line_discount = array('q', [0]) * n
+            net = gross
+        total_net = sum(net)
+
+        # 2. Diskon keranjang dari total, dialokasikan sebanding harga net baris
+        cart_total = 0
+        if self.cart_discount and total_net >= self.cart_discount_min:
+            cart_total = bagi_bulat(total_net * self.cart_discount, 100)
+        cart_discount = _alokasi_tarif(net, self.cart_discount, cart_total)
+        dpp = array('q', map(sub, net, cart_discount)) if cart_total else net
+        total_dpp = total_net - cart_total
+
+        # 3. PPN dari total DPP, dialokasikan sebanding DPP baris
+        ppn = _alokasi_tarif(dpp, self.ppn_persen, bagi_bulat(total_dpp * self.ppn_persen, 100))
+        line_total = array('q', map(add, dpp, ppn))
+
+        # 4. Pembulatan akhir hanya pada total
+        total = total_dpp + sum(ppn)
+        rounding = bagi_bulat(total, self.pembulatan) * self.pembulatan - total
+        LOGGER.debug("Harga %d baris: DPP %d sen, total %d sen", n, total_dpp, total + rounding)
+        return PriceBreakdown(product_ids, quantities, gross, line_discount, cart_discount,
+                              ppn, line_total, rounding)
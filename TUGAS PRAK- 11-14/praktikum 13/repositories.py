@@ -1,24 +1,547 @@
 # repositories.py
 import logging
-from models import Product 
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import chain
+from typing import Callable, Iterable, Iterator, Mapping
+from praktikum_common.log_facade import get_logger
+from .models import Product
 
-LOGGER = logging.getLogger('REPOSITORY')
+LOGGER = get_logger('REPOSITORY')
 
-class ProductRepository:
-    """Mengambil data produk (simulasi database)."""
-    def __init__(self):
-        # Data hardcoded untuk simulasi: Laptop, Mouse, Keyboard
-        self._products = {
-            "P001": Product(id="P001", name="Laptop Gaming", price=15000000),
-            "P002": Product(id="P002", name="Mouse Wireless", price=250000),
-            "P003": Product(id="P003", name="Keyboard Mech", price=800000),
-        }
-        LOGGER.info("ProductRepository initialized with 3 products.")
+# --- INTERFACE REPOSITORY (DIP) ---
+class IProductRepository(ABC):
+    """Kontrak untuk semua sumber data produk."""
+    @abstractmethod
+    def get_all(self) -> Iterator[Product]:
+        pass
 
-    def get_all(self) -> list[Product]:
-        """Mengambil semua produk yang tersedia."""
-        return list(self._products.values())
+    @abstractmethod
+    def get_by_id(self, product_id: str) -> Product | None:
+        pass
+
+    def get_many(self, product_ids: Iterable[str]) -> dict[str, Product]:
+        """Mengambil banyak produk sekaligus; ID yang tidak ada dilewati.
+
+        Implementasi default memanggil get_by_id satu per satu; backend
+        yang mendukung lookup massal sebaiknya meng-override method ini.
+        """
+        found = {}
+        for product_id in product_ids:
+            product = self.get_by_id(product_id)
+            if product is not None:
+                found[product_id] = product
+        return found
+
+
+class IVersionedRepository(IProductRepository):
+    """Repository yang bisa memberikan snapshot katalog yang tidak berubah."""
+    @abstractmethod
+    def snapshot(self) -> "CatalogSnapshot":
+        pass
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """Nomor versi katalog terbaru; naik setiap kali versi baru dipublikasikan."""
+
+
+# --- SNAPSHOT KATALOG BERVERSI (copy-on-write) ---
+class CatalogSnapshot(IProductRepository):
+    """Satu versi katalog yang tidak berubah lagi setelah dipublikasikan.
+
+    Produk dibagi ke beberapa shard dict menurut hash id. Versi berikutnya
+    hanya menyalin shard yang disentuh; shard lain dan objek Product yang
+    tidak berubah dipakai bersama antar versi. Product di dalam snapshot
+    tidak boleh diubah langsung, gunakan ProductRepository.update().
+    """
+    SHARDS = 64  # pangkat dua
+
+    def __init__(self, version: int, shards: tuple, size: int):
+        self.version = version
+        self._shards = shards
+        self._size = size
+
+    @classmethod
+    def from_products(cls, products: Iterable[Product], version: int = 0) -> "CatalogSnapshot":
+        shards = tuple({} for _ in range(cls.SHARDS))
+        for p in products:
+            shards[hash(p.id) & (cls.SHARDS - 1)][p.id] = p
+        return cls(version, shards, sum(map(len, shards)))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def get_all(self) -> Iterator[Product]:
+        return chain.from_iterable(shard.values() for shard in self._shards)
+
+    def get_by_id(self, product_id: str) -> Product | None:
+        return self._shards[hash(product_id) & (self.SHARDS - 1)].get(product_id)
+
+    def get_many(self, product_ids: Iterable[str]) -> dict[str, Product]:
+        shards, mask = self._shards, self.SHARDS - 1
+        found = {}
+        for product_id in product_ids:
+            product = shards[hash(product_id) & mask].get(product_id)
+            if product is not None:
+                found[product_id] = product
+        return found
+
+    def changes_since(self, old: "CatalogSnapshot") -> tuple[list[Product], list[str]]:
+        """Produk yang ditambah/diganti dan id yang dihapus sejak snapshot `old`.
+
+        Shard yang dipakai bersama (tidak disalin oleh update) dilewati,
+        jadi biayanya sebanding dengan shard yang berubah, bukan katalog.
+        """
+        changed, removed = [], []
+        for shard, old_shard in zip(self._shards, old._shards):
+            if shard is old_shard:
+                continue
+            changed += [p for product_id, p in shard.items() if old_shard.get(product_id) is not p]
+            removed += [product_id for product_id in old_shard if product_id not in shard]
+        return changed, removed
+
+
+class CatalogUpdate:
+    """Perubahan yang disiapkan di samping snapshot `base`.
+
+    Tidak terlihat oleh pembaca sampai build() dipublikasikan. Shard
+    disalin saat pertama kali diubah (copy-on-write).
+    """
+    def __init__(self, base: CatalogSnapshot):
+        self.base = base
+        self._shards = list(base._shards)
+        self._copied: set[int] = set()
+        self._size = len(base)
+        self.changed = 0
+
+    def _shard(self, product_id: str) -> dict:
+        index = hash(product_id) & (CatalogSnapshot.SHARDS - 1)
+        if index not in self._copied:
+            self._shards[index] = dict(self._shards[index])
+            self._copied.add(index)
+        return self._shards[index]
+
+    def get_by_id(self, product_id: str) -> Product | None:
+        return self._shards[hash(product_id) & (CatalogSnapshot.SHARDS - 1)].get(product_id)
+
+    def put(self, product: Product):
+        """Menambah produk baru atau mengganti produk dengan id yang sama."""
+        shard = self._shard(product.id)
+        if product.id not in shard:
+            self._size += 1
+        shard[product.id] = product
+        self.changed += 1
+
+    def set_price(self, product_id: str, price: float):
+        old = self.get_by_id(product_id)
+        if old is None:
+            raise KeyError(product_id)
+        # Objek baru: Product lama tetap utuh untuk snapshot/keranjang yang memakainya
+        self.put(Product(id=old.id, name=old.name, price=price))
+
+    def set_prices(self, prices: Mapping[str, float]):
+        """Versi massal set_price(): loop dibuat sesempit mungkin untuk repricing besar."""
+        shards, copied, mask = self._shards, self._copied, CatalogSnapshot.SHARDS - 1
+        for product_id, price in prices.items():
+            index = hash(product_id) & mask
+            shard = shards[index]
+            if index not in copied:
+                shard = shards[index] = dict(shard)
+                copied.add(index)
+            old = shard[product_id]
+            shard[product_id] = Product(old.id, old.name, price)
+        self.changed += len(prices)
+
+    def remove(self, product_id: str):
+        if self.get_by_id(product_id) is not None:
+            del self._shard(product_id)[product_id]
+            self._size -= 1
+            self.changed += 1
+
+    def build(self) -> CatalogSnapshot:
+        return CatalogSnapshot(self.base.version + 1, tuple(self._shards), self._size)
+
+
+class ProductRepository(IVersionedRepository):
+    """Mengambil data produk (simulasi database).
+
+    Katalog disimpan sebagai CatalogSnapshot. Pembaca tidak pernah
+    mengunci: mereka membaca referensi snapshot saat ini. Penulis
+    menyiapkan versi berikutnya lewat update() lalu mempublikasikannya
+    dengan satu penggantian referensi.
+    """
+    def __init__(self, products: Iterable[Product] | None = None):
+        if products is None:
+            # Data hardcoded untuk simulasi: Laptop, Mouse, Keyboard
+            products = [
+                Product(id="P001", name="Laptop Gaming", price=15000000),
+                Product(id="P002", name="Mouse Wireless", price=250000),
+                Product(id="P003", name="Keyboard Mech", price=800000),
+            ]
+        self._catalog = CatalogSnapshot.from_products(products)
+        self._write_lock = threading.Lock()
+        self._listeners: list[Callable[[CatalogSnapshot, CatalogSnapshot], None]] = []
+        LOGGER.info("ProductRepository initialized with %d products.", len(self._catalog))
+
+    def snapshot(self) -> CatalogSnapshot:
+        """Versi katalog terbaru; tetap konsisten walau ada publikasi berikutnya."""
+        return self._catalog
+
+    @property
+    def version(self) -> int:
+        return self._catalog.version
+
+    def get_all(self) -> Iterator[Product]:
+        """Mengambil semua produk yang tersedia (streaming, dari satu snapshot)."""
+        return self._catalog.get_all()
 
     def get_by_id(self, product_id: str) -> Product | None:
         """Mencari produk berdasarkan ID."""
-        return self._products.get(product_id)
\ No newline at end of file
+        return self._catalog.get_by_id(product_id)
+
+    def get_many(self, product_ids: Iterable[str]) -> dict[str, Product]:
+        return self._catalog.get_many(product_ids)
+
+    def subscribe(self, listener: Callable[[CatalogSnapshot, CatalogSnapshot], None]):
+        """Mendaftarkan listener(old, new) yang dipanggil setelah setiap publikasi.
+
+        Listener dipanggil berurutan di thread penulis (masih di dalam lock
+        penulis), jadi urutan versi yang diterimanya selalu sama dengan
+        urutan publikasi. Exception dari listener dicatat, tidak dilempar.
+        """
+        self._listeners.append(listener)
+
+    @contextmanager
+    def update(self) -> Iterator[CatalogUpdate]:
+        """Membuka perubahan katalog; dipublikasikan atomik saat blok selesai.
+
+        Penulis diserialkan satu per satu. Jika blok melempar exception,
+        perubahan dibuang dan pembaca tidak pernah melihatnya.
+        """
+        with self._write_lock:
+            edit = CatalogUpdate(self._catalog)
+            yield edit
+            if edit.changed:
+                self._catalog = edit.build()
+                LOGGER.info("Katalog versi %d dipublikasikan (%d perubahan).",
+                            self._catalog.version, edit.changed)
+                for listener in self._listeners:
+                    try:
+                        listener(edit.base, self._catalog)
+                    except Exception:
+                        LOGGER.exception("Listener katalog gagal untuk versi %d.", self._catalog.version)
+
+    def reprice(self, prices: Mapping[str, float]) -> CatalogSnapshot:
+        """Mengubah banyak harga sekaligus sebagai satu versi baru."""
+        with self.update() as edit:
+            edit.set_prices(prices)
+        return self._catalog
+
+
+# --- REPOSITORY SQLITE (Katalog besar, lazy loading) ---
+class SqliteProductRepository(IProductRepository):
+    """Repository produk di atas SQLite lokal.
+
+    Data tidak dimuat saat inisialisasi; objek Product baru dibuat ketika
+    diminta. Tabel memakai primary key pada id serta index pada name
+    (untuk pencarian prefix) dan price (untuk rentang harga).
+    """
+    PAGE_SIZE = 500
+    MAX_PARAMS = 900  # di bawah batas parameter SQLite versi lama (999)
+
+    def __init__(self, path: str = ":memory:"):
+        import sqlite3  # di-import saat dipakai agar import modul tetap ringan
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS products (
+                id    TEXT PRIMARY KEY,
+                name  TEXT NOT NULL,
+                price REAL NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_products_name ON products(name);
+            CREATE INDEX IF NOT EXISTS idx_products_price ON products(price);
+        """)
+        LOGGER.info("SqliteProductRepository opened at %s.", path)
+
+    def close(self):
+        self._conn.close()
+
+    def add_many(self, products: Iterable[Product]):
+        """Menyimpan (insert/replace) banyak produk dalam satu transaksi."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO products (id, name, price) VALUES (?, ?, ?)",
+                ((p.id, p.name, p.price) for p in products),
+            )
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def get_by_id(self, product_id: str) -> Product | None:
+        """Mencari produk berdasarkan ID (lookup primary key)."""
+        row = self._conn.execute(
+            "SELECT id, name, price FROM products WHERE id = ?", (product_id,)
+        ).fetchone()
+        return Product(*row) if row else None
+
+    def get_many(self, product_ids: Iterable[str]) -> dict[str, Product]:
+        """Mengambil banyak produk dengan query IN per potongan ID."""
+        ids = list(dict.fromkeys(product_ids))
+        found = {}
+        for start in range(0, len(ids), self.MAX_PARAMS):
+            chunk = ids[start:start + self.MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT id, name, price FROM products WHERE id IN ({placeholders})", chunk
+            ).fetchall()
+            for row in rows:
+                found[row[0]] = Product(*row)
+        return found
+
+    def get_page(self, after_id: str = "", limit: int = PAGE_SIZE) -> list[Product]:
+        """Mengambil satu halaman produk terurut id (keyset pagination)."""
+        rows = self._conn.execute(
+            "SELECT id, name, price FROM products WHERE id > ? ORDER BY id LIMIT ?",
+            (after_id, limit),
+        ).fetchall()
+        return [Product(*row) for row in rows]
+
+    def get_all(self) -> Iterator[Product]:
+        """Streaming seluruh produk per halaman, tanpa memuat semuanya sekaligus."""
+        after_id = ""
+        while True:
+            page = self.get_page(after_id, self.PAGE_SIZE)
+            yield from page
+            if len(page) < self.PAGE_SIZE:
+                return
+            after_id = page[-1].id
+
+    def find_by_name_prefix(self, prefix: str, limit: int = 50) -> list[Product]:
+        """Mencari produk yang namanya diawali prefix (range scan pada index name)."""
+        if not prefix:
+            return []
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        rows = self._conn.execute(
+            "SELECT id, name, price FROM products WHERE name >= ? AND name < ? "
+            "ORDER BY name LIMIT ?",
+            (prefix, upper, limit),
+        ).fetchall()
+        return [Product(*row) for row in rows]
+
+    def find_by_price_range(self, min_price: float, max_price: float,
+                            limit: int = 50) -> list[Product]:
+        """Mencari produk dengan min_price <= price <= max_price (index price)."""
+        rows = self._conn.execute(
+            "SELECT id, name, price FROM products WHERE price BETWEEN ? AND ? "
+            "ORDER BY price LIMIT ?",
+            (min_price, max_price, limit),
+        ).fetchall()
+        return [Product(*row) for row in rows]
+
+
+# --- CACHE READ-THROUGH (Decorator, implementasi interface yang sama) ---
+class CachedProductRepository(IProductRepository):
+    """Decorator LRU + TTL opsional di depan repository lain.
+
+    get_by_id dilayani dari cache jika ada; jika tidak, diteruskan ke
+    repository asli lalu disimpan. Panggil invalidate() saat harga produk
+    berubah agar pembaca berikutnya mendapat data terbaru.
+
+    Pengambilan ke repository asli terjadi di luar lock. Setiap
+    invalidate() menaikkan generasi; hasil pengambilan yang dimulai
+    sebelum invalidate() untuk id yang sama tidak disimpan ke cache.
+
+    Untuk repository berversi gunakan CachedVersionedRepository, yang
+    mengikuti versi katalog tanpa invalidate() manual.
+    """
+    def __init__(self, inner: IProductRepository, max_size: int = 10_000,
+                 ttl: float | None = None, clock=time.monotonic):
+        if max_size <= 0:
+            raise ValueError("max_size harus lebih dari 0")
+        self._inner = inner
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[Product, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        # Generasi invalidasi: hanya dicatat selama ada pengambilan yang berjalan
+        self._generation = 0
+        self._cleared_at = 0
+        self._invalidated: dict[str, int] = {}
+        self._inflight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_all(self) -> Iterator[Product]:
+        return self._inner.get_all()
+
+    def get_by_id(self, product_id: str) -> Product | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(product_id)
+            if entry is not None and (self._ttl is None or now < entry[1]):
+                self._entries.move_to_end(product_id)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            generation = self._begin_fetch()
+
+        product = None
+        try:
+            product = self._inner.get_by_id(product_id)
+        finally:
+            self._store((product,) if product is not None else (), now, generation)
+        return product
+
+    def get_many(self, product_ids: Iterable[str]) -> dict[str, Product]:
+        """Melayani yang ada di cache, sisanya diambil sekaligus dari repository asli."""
+        now = self._clock()
+        found = {}
+        missing = []
+        with self._lock:
+            for product_id in dict.fromkeys(product_ids):
+                entry = self._entries.get(product_id)
+                if entry is not None and (self._ttl is None or now < entry[1]):
+                    self._entries.move_to_end(product_id)
+                    self.hits += 1
+                    found[product_id] = entry[0]
+                else:
+                    self.misses += 1
+                    missing.append(product_id)
+            if not missing:
+                return found
+            generation = self._begin_fetch()
+
+        fetched = {}
+        try:
+            fetched = self._inner.get_many(missing)
+        finally:
+            self._store(fetched.values(), now, generation)
+        found.update(fetched)
+        return found
+
+    def _begin_fetch(self) -> int:
+        """Dipanggil dengan lock dipegang; setiap pemanggilan wajib diakhiri _store()."""
+        self._inflight += 1
+        return self._generation
+
+    def _store(self, products: Iterable[Product], now: float, generation: int):
+        expires = now + self._ttl if self._ttl is not None else 0.0
+        with self._lock:
+            self._inflight -= 1
+            if self._cleared_at <= generation:
+                invalidated = self._invalidated
+                for product in products:
+                    if invalidated.get(product.id, 0) > generation:
+                        continue  # di-invalidate selama diambil: data mungkin basi
+                    self._entries[product.id] = (product, expires)
+                    self._entries.move_to_end(product.id)
+            if not self._inflight:
+                self._invalidated.clear()
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, product_id: str):
+        """Menghapus satu produk dari cache (misalnya setelah perubahan harga)."""
+        with self._lock:
+            self._entries.pop(product_id, None)
+            if self._inflight:
+                self._generation += 1
+                self._invalidated[product_id] = self._generation
+
+    def invalidate_all(self):
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        """Dipanggil dengan lock dipegang; pengambilan yang sedang berjalan tidak disimpan."""
+        self._entries.clear()
+        if self._inflight:
+            self._generation += 1
+            self._cleared_at = self._generation
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot counter cache untuk dikumpulkan oleh monitoring."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+
+class CachedVersionedRepository(IVersionedRepository):
+    """Cache LRU + TTL opsional di depan repository berversi.
+
+    Setiap versi katalog mendapat CachedProductRepository sendiri di atas
+    CatalogSnapshot-nya. snapshot() mengembalikan cache versi terbaru dan
+    memakainya bersama sampai versi baru dipublikasikan, sehingga keranjang
+    yang dipatok ke snapshot() tetap membaca lewat cache. Isi snapshot tidak
+    pernah berubah, jadi cache versi lama tidak pernah basi dan tidak perlu
+    di-invalidate; cache itu dibuang bersama keranjang terakhir yang
+    memakainya.
+    """
+    def __init__(self, inner: IVersionedRepository, max_size: int = 10_000,
+                 ttl: float | None = None, clock=time.monotonic):
+        if max_size <= 0:
+            raise ValueError("max_size harus lebih dari 0")
+        self._inner = inner
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._current: tuple[int, CachedProductRepository] | None = None  # (versi, cache)
+        # Counter cache versi yang sudah diganti, agar stats() tidak mulai dari nol
+        self._retired = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @property
+    def version(self) -> int:
+        return self._inner.version
+
+    def snapshot(self) -> CachedProductRepository:
+        """Cache untuk versi katalog terbaru (lihat docstring kelas)."""
+        current = self._current
+        if current is not None and current[0] == self._inner.version:
+            return current[1]
+        with self._lock:
+            snapshot = self._inner.snapshot()
+            current = self._current
+            if current is None or current[0] < snapshot.version:
+                if current is not None:
+                    retired = current[1].stats()
+                    for name in self._retired:
+                        self._retired[name] += retired[name]
+                current = self._current = (snapshot.version, CachedProductRepository(
+                    snapshot, self._max_size, self._ttl, self._clock))
+            return current[1]
+
+    def get_all(self) -> Iterator[Product]:
+        return self.snapshot().get_all()
+
+    def get_by_id(self, product_id: str) -> Product | None:
+        return self.snapshot().get_by_id(product_id)
+
+    def get_many(self, product_ids: Iterable[str]) -> dict[str, Product]:
+        return self.snapshot().get_many(product_ids)
+
+    def stats(self) -> dict[str, int]:
+        """Counter gabungan semua versi; size hanya untuk cache versi terbaru.
+
+        Pembacaan keranjang yang masih dipatok ke versi lama setelah versi
+        itu diganti tidak ikut dihitung.
+        """
+        with self._lock:
+            if self._current is None:
+                stats = {"hits": 0, "misses": 0, "evictions": 0, "size": 0}
+            else:
+                stats = self._current[1].stats()
+            for name, value in self._retired.items():
+                stats[name] += value
+        return stats
@@ -0,0 +1,339 @@
+# search.py
+"""Index pencarian produk untuk kasir (pendamping ProductRepository).
+
+- Nama produk dipecah menjadi token (huruf kecil, alfanumerik).
+- Prefix trie atas kosakata token: setiap kata kueri diperlakukan sebagai
+  awalan ("lap gam" menemukan "Laptop Gaming"), dilengkapi lewat trie.
+- Inverted index: setiap token di ujung trie menyimpan posting list baris
+  produk dalam array('I') yang ringkas.
+- Data produk disimpan kolumnar di ProductTable; hasil hanya dibentuk
+  menjadi Product untuk top-k yang dikembalikan.
+- Setiap baris punya signature 64-bit (hash awalan 2-3 huruf tiap token)
+  di array('Q'), sehingga sebagian besar kandidat dibuang tanpa menyentuh
+  string namanya (akses string acak di katalog besar mahal karena cache miss).
+
+Perubahan bersifat inkremental: add() menambah/mengganti produk, reprice()
+hanya menulis ulang satu sel harga, remove() menandai baris sebagai
+terhapus. sync() menerapkan selisih dua versi katalog sekaligus, sehingga
+index bisa didaftarkan ke ProductRepository.subscribe(). Posting lama dari
+nama yang diganti tidak dibuang; baris selalu diverifikasi ulang terhadap
+nama terbarunya saat kueri.
+
+Awalan pendek ("ka") bisa cocok dengan ratusan token dan ratusan ribu
+baris. Untuk awalan sampai TOP_DEPTH huruf, index menyimpan TOP_K hasil
+teratas per urutan (_TopList) yang diperbarui setiap add/reprice/remove,
+sehingga kueri satu kata pendek hanya membaca satu daftar. Kueri lain
+memeringkat semua token hasil ekspansi (tanpa batas) supaya top-k tetap
+benar; hasilnya disimpan di cache LRU. Entri cache dicap dengan panjang
+posting dan versi token (dinaikkan saat reprice/rename/remove), jadi
+tidak pernah basi.
+"""
+import heapq
+import re
+from array import array
+from bisect import bisect_left, insort
+from collections import OrderedDict, deque
+from itertools import chain, compress, repeat
+from operator import add, and_, contains, mul, neg
+from typing import Iterable
+
+from praktikum_common.log_facade import get_logger
+from .models import Product, ProductTable
+
+LOGGER = get_logger('SEARCH')
+
+ORDER_RELEVANCE = "relevance"
+ORDER_PRICE = "price"
+
+_TOKEN = re.compile(r"\w+")
+_END = ""  # kunci penanda ujung token di node trie (karakter tidak pernah kosong)
+
+TOP_K = 32      # hasil teratas yang disimpan per awalan pendek
+TOP_DEPTH = 3   # awalan sepanjang ini ke bawah punya _TopList sendiri
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def _prefix_bit(word: str) -> int:
+    return 1 << (hash(word[:3]) & 63)
+
+
+def signature(tokens: Iterable[str]) -> int:
+    sig = 0
+    for token in tokens:
+        sig |= _prefix_bit(token[:2]) | _prefix_bit(token)
+    return sig
+
+
+def _short_prefixes(key: str) -> set[str]:
+    return {token[:i] for token in key.split() for i in range(1, min(len(token), TOP_DEPTH) + 1)}
+
+
+def _relevance_rank(key: str, price: float, row: int, word: str) -> tuple:
+    # Sama dengan peringkat _top_k untuk kueri satu kata
+    score = 2 * key.startswith(" " + word) + (" " + word + " " in key)
+    return -score, len(key), price, row
+
+
+class _TopList:
+    """Peringkat teratas (terurut) baris yang cocok dengan satu awalan.
+
+    Daftar selalu berisi len(ranks) peringkat teratas yang sebenarnya.
+    exhaustive=True berarti semua baris yang cocok ada di daftar; jika
+    tidak, baris yang keluar dari daftar tidak bisa digantikan sehingga
+    daftar bisa memendek sampai diisi ulang oleh search().
+    """
+    __slots__ = ("ranks", "exhaustive")
+
+    def __init__(self):
+        self.ranks: list[tuple] = []
+        self.exhaustive = True
+
+    def update(self, old: tuple | None, new: tuple | None):
+        ranks = self.ranks
+        if old is not None and ranks and old <= ranks[-1]:
+            i = bisect_left(ranks, old)
+            if i < len(ranks) and ranks[i] == old:
+                del ranks[i]
+        if new is not None and (self.exhaustive or (ranks and new < ranks[-1])):
+            insort(ranks, new)
+            if len(ranks) > TOP_K:
+                ranks.pop()
+                self.exhaustive = False
+
+    def rows(self, k: int) -> list[int] | None:
+        """k baris teratas, atau None jika daftar tidak lagi cukup panjang."""
+        if k <= len(self.ranks) or self.exhaustive:
+            return [rank[-1] for rank in self.ranks[:k]]
+        return None
+
+
+class ProductSearchIndex:
+    """Prefix trie + inverted token index di atas katalog produk."""
+    def __init__(self, products: Iterable[Product] = (), cache_size: int = 4096):
+        self.cache_size = cache_size
+        self.table = ProductTable()
+        # " tok1 tok2 ... " per baris; "" = produk dihapus
+        self._keys: list[str] = []
+        self._sigs = array('Q')
+        self._trie: dict = {}
+        self._removed = 0
+        self._versions: dict[str, int] = {}                 # token -> versi
+        self._completions: dict[str, list] = {}             # awalan -> [(token, posting)]
+        self._results: OrderedDict = OrderedDict()          # kueri -> (cap, rows)
+        self._tops: dict[str, tuple[_TopList, _TopList]] = {}  # awalan pendek -> (relevansi, harga)
+        self.vocabulary = 0
+        for p in products:
+            self.add(p)
+
+    def __len__(self) -> int:
+        return len(self._keys) - self._removed
+
+    # --- Pembaruan inkremental ---
+    def add(self, product: Product):
+        """Menambah produk baru atau memperbarui nama/harga produk yang sudah ada."""
+        tokens = tokenize(product.name)
+        key = " " + " ".join(tokens) + " "
+        row = self.table.row_of(product.id)
+        if row is None:
+            self.table.add(product.id, product.name, product.price)
+            row = len(self._keys)
+            self._keys.append(key)
+            self._sigs.append(signature(tokens))
+            old = ()
+            self._update_tops(row, "", 0.0, key, self.table.prices[row])
+        else:
+            old_key, old_price = self._keys[row], self.table.prices[row]
+            self.table.add(product.id, product.name, product.price)
+            if not old_key:
+                self._removed -= 1
+            old = old_key.split()
+            self._touch(old)
+            self._touch(tokens)
+            self._keys[row] = key
+            self._sigs[row] = signature(tokens)
+            self._update_tops(row, old_key, old_price, key, self.table.prices[row])
+        for token in set(tokens).difference(old):
+            self._posting(token).append(row)
+
+    def reprice(self, product_id: str, price: float):
+        row = self.table.row_of(product_id)
+        old_price = self.table.prices[row]
+        self.table.set_price(product_id, price)
+        key = self._keys[row]
+        self._touch(key.split())
+        self._update_tops(row, key, old_price, key, self.table.prices[row])
+
+    def remove(self, product_id: str):
+        row = self.table.row_of(product_id)
+        if row is not None and self._keys[row]:
+            key = self._keys[row]
+            self._touch(key.split())
+            self._keys[row] = ""
+            self._removed += 1
+            self._update_tops(row, key, self.table.prices[row], "", 0.0)
+
+    def sync(self, old, new):
+        """Menerapkan perubahan katalog old -> new (dua CatalogSnapshot).
+
+        Cocok sebagai listener ProductRepository.subscribe(): produk yang
+        hanya berubah harga cukup di-reprice, sisanya di-add atau di-remove.
+        """
+        changed, removed = new.changes_since(old)
+        for product in changed:
+            row = self.table.row_of(product.id)
+            if row is not None and self._keys[row] and self.table.product_at(row).name == product.name:
+                self.reprice(product.id, product.price)
+            else:
+                self.add(product)
+        for product_id in removed:
+            self.remove(product_id)
+
+    def clear_cache(self):
+        self._results.clear()
+
+    def _touch(self, tokens: Iterable[str]):
+        versions = self._versions
+        for token in tokens:
+            versions[token] = versions.get(token, 0) + 1
+
+    def _update_tops(self, row: int, old_key: str, old_price: float, new_key: str, new_price: float):
+        """Memindahkan peringkat satu baris di _TopList setiap awalan pendeknya."""
+        old = _short_prefixes(old_key)
+        new = old if new_key == old_key else _short_prefixes(new_key)
+        tops = self._tops
+        for prefix in old | new:
+            pair = tops.get(prefix)
+            if pair is None:
+                pair = tops[prefix] = (_TopList(), _TopList())
+            was, now = prefix in old, prefix in new
+            pair[0].update(_relevance_rank(old_key, old_price, row, prefix) if was else None,
+                           _relevance_rank(new_key, new_price, row, prefix) if now else None)
+            pair[1].update((old_price, row) if was else None, (new_price, row) if now else None)
+
+    def _posting(self, token: str) -> array:
+        node = self._trie
+        for ch in token:
+            node = node.setdefault(ch, {})
+        posting = node.get(_END)
+        if posting is None:
+            posting = node[_END] = array('I')
+            self.vocabulary += 1
+            # Token baru mengubah hasil complete() untuk semua awalannya
+            for i in range(len(token) + 1):
+                self._completions.pop(token[:i], None)
+        return posting
+
+    # --- Kueri ---
+    def complete(self, prefix: str) -> list[tuple[str, array]]:
+        """Token yang diawali `prefix` (terpendek dulu) beserta posting-nya."""
+        found = self._completions.get(prefix)
+        if found is None:
+            found = self._completions[prefix] = self._complete(prefix)
+        return found
+
+    def _complete(self, prefix: str) -> list[tuple[str, array]]:
+        node = self._trie
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return []
+        found = []
+        queue = deque([(prefix, node)])
+        while queue:
+            text, node = queue.popleft()
+            for ch, child in node.items():
+                if ch == _END:
+                    found.append((text, child))
+                else:
+                    queue.append((text + ch, child))
+        return found
+
+    def search(self, query: str, k: int = 10, order_by: str = ORDER_RELEVANCE) -> list[Product]:
+        """Top-k produk yang namanya memuat semua kata kueri (sebagai awalan kata).
+
+        order_by=ORDER_RELEVANCE: kata persis > awalan kata, lalu nama yang
+        diawali kueri, nama lebih pendek, dan harga termurah.
+        order_by=ORDER_PRICE: termurah lebih dulu.
+        """
+        words = tokenize(query)
+        if not words or k <= 0:
+            return []
+        if order_by not in (ORDER_RELEVANCE, ORDER_PRICE):
+            raise ValueError(f"order_by tidak dikenal: {order_by}")
+
+        # Satu awalan pendek: cukup baca _TopList-nya
+        top = None
+        if len(words) == 1 and k <= TOP_K and words[0] in self._tops:
+            top = self._tops[words[0]][order_by == ORDER_PRICE]
+            rows = top.rows(k)
+            if rows is not None:
+                return list(map(self.table.product_at, rows))
+
+        # Mulai dari kata kueri dengan posting paling sedikit
+        best = None
+        for word in words:
+            group = self.complete(word)
+            size = sum(len(posting) for _, posting in group)
+            if size == 0:
+                return []
+            if best is None or size < best[0]:
+                best = (size, word, group)
+        size, word, group = best
+
+        # Panjang posting dan versi token hanya bisa naik: cap sama = hasil sama
+        versions = self._versions
+        stamp = (word, size, sum(versions.get(token, 0) for token, _ in group))
+        cache_key = (tuple(words), k, order_by)
+        cached = self._results.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            self._results.move_to_end(cache_key)
+            rows = cached[1]
+        else:
+            if top is not None:
+                # _TopList sudah terlalu pendek: isi ulang dengan TOP_K hasil penuh
+                rows = self._top_k(words, word, [posting for _, posting in group], TOP_K, order_by)
+                self._refill(top, rows, word, order_by)
+                rows = rows[:k]
+            else:
+                rows = self._top_k(words, word, [posting for _, posting in group], k, order_by)
+            self._results[cache_key] = (stamp, rows)
+            if len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        return list(map(self.table.product_at, rows))
+
+    def _refill(self, top: _TopList, rows: list[int], word: str, order_by: str):
+        prices = self.table.prices
+        if order_by == ORDER_PRICE:
+            top.ranks = [(prices[row], row) for row in rows]
+        else:
+            top.ranks = [_relevance_rank(self._keys[row], prices[row], row, word) for row in rows]
+        top.exhaustive = len(rows) < TOP_K
+
+    def _top_k(self, words: list[str], driver: str, postings: list[array], k: int, order_by: str) -> list[int]:
+        # Loop terpanas: penyaringan dengan compress/map agar tetap di level C.
+        # Signature dulu untuk kata selain penggerak, lalu cek string pada sisa
+        # kandidat (kata penggerak terakhir, sekadar membuang posting basi).
+        get_key = self._keys.__getitem__
+        rows = list(chain.from_iterable(postings)) if len(postings) > 1 else postings[0]
+        for word in words:
+            if word != driver and len(word) >= 2:
+                rows = list(compress(rows, map(and_, map(self._sigs.__getitem__, rows),
+                                               repeat(_prefix_bit(word)))))
+        for word in sorted(words, key=lambda w: w == driver):
+            rows = list(compress(rows, map(contains, map(get_key, rows), repeat(" " + word))))
+        rows = dict.fromkeys(rows)  # baris bisa muncul di beberapa posting satu awalan
+
+        prices = self.table.prices
+        if order_by == ORDER_PRICE:
+            # Harga sama diurutkan menurut baris, sama seperti _TopList
+            return [r[-1] for r in heapq.nsmallest(k, zip(map(prices.__getitem__, rows), rows))]
+        # Kata persis > awalan kata, lalu nama diawali kueri, nama pendek, harga
+        keys = list(map(get_key, rows))
+        score = list(map(mul, map(str.startswith, keys, repeat(" " + " ".join(words))), repeat(2)))
+        for word in words:
+            score = list(map(add, score, map(contains, keys, repeat(" " + word + " "))))
+        ranked = zip(map(neg, score), map(len, keys), map(prices.__getitem__, rows), rows)
+        return [r[-1] for r in heapq.nsmallest(k, ranked)]
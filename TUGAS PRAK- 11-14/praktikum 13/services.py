@@ -1,10 +1,14 @@
 # services.py
 from abc import ABC, abstractmethod
 import logging
-from models import Product, CartItem 
-from typing import List
+import time
+from praktikum_common import metrics
+from praktikum_common.log_facade import get_logger, Rupiah
+from .models import Product, CartItem
+from .wallet import WalletLedger, InsufficientFundsError
+from typing import Iterable, List, Tuple
 
-LOGGER = logging.getLogger('SERVICES')
+LOGGER = get_logger('SERVICES')
 
 # --- INTERFACE PEMBAYARAN (Diperlukan untuk DIP/OCP) ---
 class IPaymentProcessor(ABC):
@@ -13,58 +17,234 @@ class IPaymentProcessor(ABC):
     def process(self, amount: float) -> bool:
         pass
 
+# --- DECORATOR INSTRUMENTASI PEMBAYARAN (hanya dipasang jika metrik aktif) ---
+class InstrumentedPaymentProcessor(IPaymentProcessor):
+    """Mencatat latensi dan hasil process() per jenis payment processor."""
+    def __init__(self, inner: IPaymentProcessor, registry: metrics.MetricsRegistry = metrics.REGISTRY):
+        self.inner = inner
+        name = inner.__class__.__name__
+        self._latency = registry.histogram("payment_process_seconds", processor=name)
+        self._success = registry.counter("payment_process_total", processor=name, result="success")
+        self._failed = registry.counter("payment_process_total", processor=name, result="failed")
+
+    def process(self, amount: float, **kwargs) -> bool:
+        # kwargs (mis. idempotency_key) diteruskan apa adanya ke processor asli
+        start = time.perf_counter()
+        try:
+            ok = self.inner.process(amount, **kwargs)
+        except Exception:
+            self._failed.inc()
+            raise
+        finally:
+            self._latency.observe(time.perf_counter() - start)
+        (self._success if ok else self._failed).inc()
+        return ok
+
+# --- PEMBAYARAN DUA FASE (reserve -> commit/release) ---
+class ITwoPhasePayment(IPaymentProcessor):
+    """Kontrak pembayaran yang menahan dana dulu dan baru memotongnya
+    setelah checkout selesai. process() = reserve + commit."""
+    @abstractmethod
+    def reserve(self, amount: float):
+        """Menahan dana; mengembalikan token reservasi atau None jika ditolak."""
+
+    @abstractmethod
+    def commit(self, token):
+        pass
+
+    @abstractmethod
+    def release(self, token):
+        pass
+
+    def process(self, amount: float) -> bool:
+        token = self.reserve(amount)
+        if token is None:
+            return False
+        self.commit(token)
+        return True
+
+class InstrumentedTwoPhasePayment(InstrumentedPaymentProcessor, ITwoPhasePayment):
+    """Instrumentasi untuk processor dua fase.
+
+    Latensi diukur pada reserve() (tahap otorisasi). Reservasi yang ditolak
+    dihitung 'failed', commit() dihitung 'success', dan release() dihitung
+    'released' sehingga dana yang dikembalikan tidak terlihat sebagai pembayaran.
+    """
+    def __init__(self, inner: ITwoPhasePayment, registry: metrics.MetricsRegistry = metrics.REGISTRY):
+        super().__init__(inner, registry)
+        self._released = registry.counter("payment_process_total",
+                                          processor=inner.__class__.__name__, result="released")
+
+    def reserve(self, amount: float):
+        start = time.perf_counter()
+        try:
+            token = self.inner.reserve(amount)
+        except Exception:
+            self._failed.inc()
+            raise
+        finally:
+            self._latency.observe(time.perf_counter() - start)
+        if token is None:
+            self._failed.inc()
+        return token
+
+    def commit(self, token):
+        self.inner.commit(token)
+        self._success.inc()
+
+    def release(self, token):
+        self.inner.release(token)
+        self._released.inc()
+
+
+def instrument(payment_processor: IPaymentProcessor,
+               registry: metrics.MetricsRegistry = metrics.REGISTRY) -> IPaymentProcessor:
+    """Membungkus processor dengan decorator instrumentasi yang sesuai jenisnya."""
+    if isinstance(payment_processor, ITwoPhasePayment):
+        return InstrumentedTwoPhasePayment(payment_processor, registry)
+    return InstrumentedPaymentProcessor(payment_processor, registry)
+
 # --- IMPLEMENTASI PEMBAYARAN TUNAI ---
 class CashPayment(IPaymentProcessor):
     """Logika pembayaran tunai."""
     def process(self, amount: float) -> bool:
-        LOGGER.info(f"Menerima TUNAI sejumlah: Rp{amount:,.0f}")
+        LOGGER.info("Menerima TUNAI sejumlah: %s", Rupiah(amount))
         return True
 
 # --- IMPLEMENTASI PEMBAYARAN DEBIT BARU (Pembuktian OCP) ---
 class DebitCardPayment(IPaymentProcessor):
     """Implementasi pembayaran menggunakan kartu debit."""
     def process(self, amount: float) -> bool:
-        LOGGER.info(f"Memproses pembayaran DEBIT sejumlah: Rp{amount:,.0f}")
+        LOGGER.info("Memproses pembayaran DEBIT sejumlah: %s", Rupiah(amount))
         # Simulasi berhasil
         return True   
 
 
 # --- SERVICE KERANJANG BELANJA (Logika Inti Bisnis & SRP) ---
 class ShoppingCart:
-    """Mengelola item, kuantitas, dan total harga pesanan (SRP)."""
+    """Mengelola item, kuantitas, dan total harga pesanan (SRP).
+
+    Total disimpan sebagai running total yang diperbarui O(1) setiap kali
+    isi keranjang berubah, jadi membaca total_price tidak bergantung pada
+    jumlah item. Harga satuan yang sudah dihitung dicatat per item; jika
+    harga produk berubah di tengah sesi, panggil reprice(). Menambahkan
+    objek Product baru untuk id yang sudah ada (mis. dari versi katalog
+    lain) mengganti produk baris tersebut dan menghitung ulang harganya.
+    """
     def __init__(self):
         self._items: dict[str, CartItem] = {}
+        self._unit_prices: dict[str, float] = {}
+        self._total = 0.0
 
     def add_item(self, product: Product, quantity: int = 1):
-        if product.id in self._items:
-            self._items[product.id].quantity += quantity
+        item = self._items.get(product.id)
+        if item is not None:
+            self._replace_product(item, product)
+            item.quantity += quantity
         else:
             self._items[product.id] = CartItem(product=product, quantity=quantity)
-            LOGGER.info(f"Added {quantity}x {product.name} to cart.")
+            self._unit_prices[product.id] = product.price
+            LOGGER.info("Added %dx %s to cart.", quantity, product.name)
+        self._total += product.price * quantity
+
+    def add_items(self, lines: Iterable[Tuple[Product, int]]):
+        """Menambahkan banyak baris sekaligus (batch scan / pesanan online).
+
+        SKU yang sama digabung dalam satu lintasan dan hanya satu log
+        ringkasan yang ditulis untuk seluruh batch.
+        """
+        merged: dict[str, list] = {}
+        for product, quantity in lines:
+            entry = merged.get(product.id)
+            if entry is None:
+                merged[product.id] = [product, quantity]
+            else:
+                entry[0] = product
+                entry[1] += quantity
+
+        new_lines = 0
+        units = 0
+        for product_id, (product, quantity) in merged.items():
+            item = self._items.get(product_id)
+            if item is None:
+                self._items[product_id] = CartItem(product=product, quantity=quantity)
+                self._unit_prices[product_id] = product.price
+                new_lines += 1
+            else:
+                self._replace_product(item, product)
+                item.quantity += quantity
+            self._total += product.price * quantity
+            units += quantity
+        LOGGER.info("Added %d units over %d SKUs (%d new) to cart.", units, len(merged), new_lines)
+
+    def remove_item(self, product_id: str):
+        """Menghapus satu baris produk dari keranjang."""
+        item = self._items.pop(product_id, None)
+        if item is None:
+            return
+        self._total -= self._unit_prices.pop(product_id) * item.quantity
+        if not self._items:
+            self._total = 0.0  # buang sisa pembulatan float
+
+    def set_quantity(self, product_id: str, quantity: int):
+        """Mengubah kuantitas item; kuantitas <= 0 menghapus item."""
+        if quantity <= 0:
+            self.remove_item(product_id)
+            return
+        item = self._items[product_id]
+        self.reprice(product_id)
+        self._total += item.product.price * (quantity - item.quantity)
+        item.quantity = quantity
+
+    def _replace_product(self, item: CartItem, product: Product):
+        """Baris memakai objek produk yang baru masuk; total disesuaikan ke harganya."""
+        item.product = product
+        self.reprice(product.id)
+
+    def reprice(self, product_id: str):
+        """Menyesuaikan running total jika harga produk telah berubah."""
+        item = self._items[product_id]
+        old_price = self._unit_prices[product_id]
+        if item.product.price != old_price:
+            self._total += (item.product.price - old_price) * item.quantity
+            self._unit_prices[product_id] = item.product.price
 
     def get_items(self) -> list[CartItem]:
         """Mengembalikan daftar item di keranjang."""
         return list(self._items.values())
 
     @property
+    @metrics.timed("cart_total_price_seconds")
     def total_price(self) -> float:
-        """Menghitung total harga seluruh item di keranjang."""
+        """Total harga seluruh item di keranjang (O(1))."""
+        return self._total
+
+    def recompute_total(self) -> float:
+        """Menghitung ulang total dari seluruh subtotal (untuk verifikasi)."""
         return sum(item.subtotal for item in self._items.values())
-    
-class EWalletPayment(IPaymentProcessor):
+
+class EWalletPayment(ITwoPhasePayment):
     """
     Implementasi pembayaran menggunakan E-Wallet.
     Digunakan sebagai inovasi metode pembayaran pada Praktikum 13.
+    Saldo diambil dari WalletLedger milik pelanggan `customer_id`.
     """
-    def process(self, amount: float) -> bool:
-        print("Payment: Memproses pembayaran via E-Wallet.")
+    def __init__(self, ledger: WalletLedger, customer_id: str):
+        self.ledger = ledger
+        self.customer_id = customer_id
 
-        # Simulasi saldo e-wallet
-        wallet_balance = 1_000_000
+    def reserve(self, amount: float) -> int | None:
+        LOGGER.info("Payment: Memproses pembayaran via E-Wallet.")
+        try:
+            rid = self.ledger.reserve(self.customer_id, amount)
+        except InsufficientFundsError:
+            LOGGER.warning("Payment: Saldo E-Wallet tidak mencukupi.")
+            return None
+        LOGGER.info("Payment: Saldo E-Wallet mencukupi, dana %s ditahan.", Rupiah(amount))
+        return rid
 
-        if wallet_balance >= amount:
-            print("Payment: Saldo E-Wallet mencukupi.")
-            return True
-        else:
-            print("Payment: Saldo E-Wallet tidak mencukupi.")
-            return False
+    def commit(self, token: int):
+        self.ledger.commit(token)
+
+    def release(self, token: int):
+        self.ledger.release(token)
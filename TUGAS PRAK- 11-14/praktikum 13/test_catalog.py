@@ -0,0 +1,137 @@
+# test_catalog.py
+import logging
+import threading
+import unittest
+from .models import Product
+from .repositories import CachedVersionedRepository, CatalogSnapshot, ProductRepository
+from .search import ORDER_PRICE, ProductSearchIndex
+from .services import CashPayment
+from .tugas_mandiri import PosApp
+
+
+class TestCatalogSnapshot(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.repo = ProductRepository()
+
+    def test_snapshot_tidak_berubah(self):
+        """Tes 1: Repricing membuat versi baru; snapshot lama tetap melihat harga lama."""
+        lama = self.repo.snapshot()
+        baru = self.repo.reprice({"P001": 14_000_000})
+        self.assertEqual((lama.version, baru.version), (0, 1))
+        self.assertEqual(lama.get_by_id("P001").price, 15_000_000)
+        self.assertEqual(self.repo.get_by_id("P001").price, 14_000_000)
+        self.assertIs(lama.get_by_id("P002"), baru.get_by_id("P002"))
+        shared = sum(a is b for a, b in zip(lama._shards, baru._shards))
+        self.assertEqual(shared, CatalogSnapshot.SHARDS - 1)
+
+    def test_update_dibatalkan_dan_struktur(self):
+        """Tes 2: Perubahan di blok update() yang gagal tidak pernah dipublikasikan."""
+        with self.assertRaises(KeyError):
+            with self.repo.update() as edit:
+                edit.set_price("P001", 1)
+                edit.set_price("P999", 1)
+        self.assertEqual(self.repo.version, 0)
+        self.assertEqual(self.repo.get_by_id("P001").price, 15_000_000)
+
+        with self.repo.update() as edit:
+            edit.put(Product("P004", "Monitor", 2_000_000))
+            edit.remove("P002")
+            self.assertIsNone(self.repo.get_by_id("P004"))  # belum terlihat pembaca
+        self.assertEqual(sorted(p.id for p in self.repo.get_all()), ["P001", "P003", "P004"])
+        self.assertEqual(len(self.repo.snapshot()), 3)
+
+    def test_keranjang_dipatok_ke_versi(self):
+        """Tes 3: Keranjang memakai versi katalog saat dimulai sampai checkout."""
+        app = PosApp(self.repo, CashPayment())
+        app.add_item("P001")
+        self.repo.reprice({"P001": 10_000_000})
+        app.add_item("P001")
+        self.assertEqual(app.cart.total_price, 30_000_000)
+        self.assertEqual(app.cart.recompute_total(), 30_000_000)
+        self.assertTrue(app.checkout())
+        self.assertEqual(app.catalog.version, 1)
+        app.add_item("P001")
+        self.assertEqual(app.cart.total_price, 10_000_000)
+
+    def test_pembaca_bersamaan_selalu_konsisten(self):
+        """Tes 4: Selama repricing massal, pembaca selalu melihat satu versi utuh."""
+        repo = ProductRepository(Product(f"X{i:04d}", f"Barang {i}", 0) for i in range(2_000))
+        ids = [f"X{i:04d}" for i in range(2_000)]
+        selesai = threading.Event()
+        errors = []
+
+        def reader():
+            while not selesai.is_set():
+                snap = repo.snapshot()
+                prices = {p.price for p in snap.get_many(ids).values()}
+                if prices != {snap.version}:
+                    errors.append((snap.version, prices))
+
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        for t in readers:
+            t.start()
+        for version in range(1, 31):
+            repo.reprice(dict.fromkeys(ids, version))
+        selesai.set()
+        for t in readers:
+            t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(repo.version, 30)
+
+    def test_cache_mengikuti_versi(self):
+        """Tes 5: Lewat cache, keranjang tetap dipatok dan harga baru langsung terlihat."""
+        cached = CachedVersionedRepository(self.repo, ttl=300)
+        self.assertEqual(cached.get_by_id("P001").price, 15_000_000)
+        self.assertEqual(cached.get_many(["P002"])["P002"].price, 250_000)
+
+        app = PosApp(cached, CashPayment())
+        app.add_item("P001")
+        self.repo.reprice({"P001": 10_000_000, "P002": 200_000})
+        self.assertEqual(cached.version, 1)
+        self.assertEqual(cached.get_by_id("P001").price, 10_000_000)
+        self.assertEqual(cached.get_many(["P002"])["P002"].price, 200_000)
+        app.add_item("P001")
+        self.assertEqual(app.cart.total_price, 30_000_000)
+        self.assertTrue(app.checkout())
+        self.assertIs(app.catalog, cached.snapshot())
+
+    def test_keranjang_membaca_lewat_cache(self):
+        """Tes 5b: add_item/add_scanned PosApp dilayani dari cache versi yang dipatok."""
+        cached = CachedVersionedRepository(self.repo)
+        app = PosApp(cached, CashPayment())
+        app.add_item("P001")
+        app.add_item("P001")
+        app.add_scanned([("P001", 1), ("P002", 1)])
+        self.assertEqual(cached.stats(), {"hits": 2, "misses": 2, "evictions": 0, "size": 2})
+        self.repo.reprice({"P001": 10_000_000})
+        self.assertTrue(app.checkout())
+        app.add_item("P001")
+        self.assertEqual(app.cart.total_price, 10_000_000)
+        self.assertEqual(cached.stats(), {"hits": 2, "misses": 3, "evictions": 0, "size": 1})
+
+    def test_index_pencarian_mengikuti_publikasi(self):
+        """Tes 6: Index yang di-subscribe ikut berubah saat katalog dipublikasikan."""
+        index = ProductSearchIndex(self.repo.get_all())
+        self.repo.subscribe(index.sync)
+        self.repo.subscribe(lambda old, new: 1 / 0)  # listener rusak tidak menggagalkan publikasi
+
+        def ids(query):
+            return [p.id for p in index.search(query, order_by=ORDER_PRICE)]
+
+        self.assertEqual(ids("m"), ["P002", "P003"])
+        self.repo.reprice({"P003": 100_000})
+        self.assertEqual(ids("m"), ["P003", "P002"])
+        with self.repo.update() as edit:
+            edit.put(Product("P004", "Mouse Pad", 50_000))
+            edit.put(Product("P001", "Laptop Kantor", 9_000_000))
+            edit.remove("P002")
+        self.assertEqual(ids("m"), ["P004", "P003"])
+        self.assertEqual(ids("gaming"), [])
+        self.assertEqual(ids("kantor"), ["P001"])
+        self.assertEqual(self.repo.version, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
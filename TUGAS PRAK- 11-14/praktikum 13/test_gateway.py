@@ -0,0 +1,111 @@
+# test_gateway.py
+import logging
+import threading
+import unittest
+from praktikum_common import metrics
+from .fake_gateway import FakeGateway
+from .gateway import (CircuitBreaker, ConnectionPool, GatewayClient, GatewayError,
+                     GatewayPayment, RetryBudget)
+from .services import instrument
+
+
+class TestGatewayClient(unittest.TestCase):
+    def start_gateway(self, **kwargs) -> FakeGateway:
+        gateway = FakeGateway(seed=18, **kwargs).start()
+        self.addCleanup(gateway.stop)
+        return gateway
+
+    def make_client(self, gateway: FakeGateway, max_size: int = 4, **kwargs) -> GatewayClient:
+        pool = ConnectionPool("127.0.0.1", gateway.port, max_size=max_size, read_timeout=1.0)
+        self.addCleanup(pool.close)
+        return GatewayClient(pool, sleep=lambda _: None, **kwargs)
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    def test_koneksi_dipakai_ulang(self):
+        """Tes 1: Koneksi persisten dipakai ulang, tidak dibuat per transaksi."""
+        gateway = self.start_gateway()
+        payment = GatewayPayment(self.make_client(gateway))
+        for _ in range(50):
+            self.assertTrue(payment.process(10000))
+        self.assertEqual(gateway.charges, 50)
+        self.assertEqual(gateway.connections, 1)
+
+    def test_retry_tidak_double_charge(self):
+        """Tes 2: Koneksi putus setelah charge diproses tidak menyebabkan tagihan ganda."""
+        gateway = self.start_gateway(drop_rate=0.3, error_rate=0.2)
+        client = self.make_client(gateway, max_attempts=20, budget=RetryBudget(min_retries=10_000))
+        for i in range(100):
+            self.assertTrue(client.charge(5000, f"trx-{i}"))
+        self.assertEqual(gateway.charges, 100)
+
+    def test_declined_tidak_di_retry(self):
+        """Tes 3: DECLINED adalah jawaban final, bukan error sementara."""
+        gateway = self.start_gateway(decline_over=1_000_000)
+        payment = GatewayPayment(self.make_client(gateway))
+        self.assertFalse(payment.process(15_000_000))
+        self.assertEqual(len(gateway.results), 1)
+
+    def test_circuit_breaker_terbuka(self):
+        """Tes 4: Setelah gagal beruntun breaker terbuka dan request tidak dikirim."""
+        now = [0.0]
+        gateway = self.start_gateway(error_rate=1.0)
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=5, clock=lambda: now[0])
+        client = self.make_client(gateway, max_attempts=3, breaker=breaker)
+        with self.assertRaises(GatewayError):
+            client.charge(1000, "a")
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        sent = len(gateway.results)
+        self.assertFalse(GatewayPayment(client).process(1000))
+        self.assertEqual(len(gateway.results), sent)
+
+        gateway.error_rate = 0.0
+        now[0] = 10.0
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(client.charge(1000, "b"))
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+    def test_retry_budget_habis(self):
+        """Tes 5: Retry berhenti ketika budget habis."""
+        gateway = self.start_gateway(error_rate=1.0)
+        budget = RetryBudget(ratio=0.0, min_retries=2)
+        client = self.make_client(gateway, max_attempts=10, budget=budget,
+                                  breaker=CircuitBreaker(failure_threshold=100))
+        with self.assertRaises(GatewayError):
+            client.charge(1000, "a")
+        with self.assertRaises(GatewayError):
+            client.charge(1000, "b")
+        # 2 retry pertama terpakai pada charge "a"; "b" hanya dicoba sekali
+        self.assertEqual(gateway.connections, 1)
+
+    def test_ukuran_pool_maksimum(self):
+        """Tes 6: Banyak thread bersamaan tidak membuka lebih dari max_size koneksi."""
+        gateway = self.start_gateway(latency=0.01)
+        client = self.make_client(gateway, max_size=3)
+        threads = [threading.Thread(target=client.charge, args=(1000, f"t-{i}")) for i in range(12)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(gateway.charges, 12)
+        self.assertLessEqual(client.pool.created, 3)
+
+    def test_key_dari_pemanggil_mencegah_double_charge(self):
+        """Tes 7: Pemanggil yang mengulang dengan key sama setelah balasan hilang tidak ditagih lagi."""
+        gateway = self.start_gateway(drop_rate=1.0)
+        payment = GatewayPayment(self.make_client(gateway, max_attempts=1))
+        self.assertFalse(payment.process(25_000, idempotency_key="order-42"))
+        self.assertEqual(gateway.charges, 1)  # gateway sudah menagih, balasannya yang hilang
+
+        gateway.drop_rate = 0.0
+        instrumented = instrument(payment, metrics.MetricsRegistry())  # key ikut diteruskan
+        self.assertTrue(instrumented.process(25_000, idempotency_key="order-42"))
+        self.assertEqual(gateway.charges, 1)
+        self.assertTrue(payment.process(25_000, idempotency_key="order-43"))
+        self.assertEqual(gateway.charges, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
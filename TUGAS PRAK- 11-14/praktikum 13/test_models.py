@@ -0,0 +1,50 @@
+# test_models.py
+import unittest
+from .models import Product, ProductTable, ProductView
+
+
+class TestProductTable(unittest.TestCase):
+    def setUp(self):
+        self.table = ProductTable([
+            Product("P001", "Laptop Gaming", 15000000),
+            Product("P002", "Mouse Wireless", 250000),
+        ])
+
+    def test_append_dan_lookup(self):
+        """Tes 1: add() menambah baris baru; get() mengembalikan view ke baris itu."""
+        self.table.add("P003", "Keyboard Mech", 800000)
+        self.assertEqual(len(self.table), 3)
+        view = self.table.get("P003")
+        self.assertIsInstance(view, ProductView)
+        self.assertEqual((view.id, view.name, view.price), ("P003", "Keyboard Mech", 800000.0))
+        self.assertEqual(view.to_product(), Product("P003", "Keyboard Mech", 800000.0))
+        self.assertIsNone(self.table.get("P999"))
+        self.assertEqual([v.id for v in self.table], ["P001", "P002", "P003"])
+
+    def test_add_id_sama_memperbarui(self):
+        """Tes 2: add() dengan id yang sudah ada memperbarui baris, bukan menambah."""
+        self.table.add("P002", "Mouse Gaming", 300000)
+        self.assertEqual(len(self.table), 2)
+        self.assertEqual(self.table.get("P002").to_product(), Product("P002", "Mouse Gaming", 300000.0))
+
+    def test_update_harga_terlihat_di_view(self):
+        """Tes 3: set_price() langsung terlihat oleh view yang sudah ada."""
+        view = self.table.get("P001")
+        self.table.set_price("P001", 14000000)
+        self.assertEqual(view.price, 14000000.0)
+        self.assertEqual(repr(view), "ProductView(id='P001', name='Laptop Gaming', price=14000000.0)")
+        with self.assertRaises(KeyError):
+            self.table.set_price("P999", 1)
+
+    def test_akses_per_baris(self):
+        """Tes 4: row_of/product_at/prices membaca baris tanpa menyentuh atribut privat."""
+        row = self.table.row_of("P002")
+        self.assertEqual(row, 1)
+        self.assertIsNone(self.table.row_of("P999"))
+        self.assertEqual(self.table.product_at(row), Product("P002", "Mouse Wireless", 250000.0))
+        self.table.set_price("P002", 275000)
+        self.assertEqual(self.table.prices[row], 275000.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
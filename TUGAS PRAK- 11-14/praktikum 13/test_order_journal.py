@@ -0,0 +1,129 @@
+# test_order_journal.py
+import logging
+import os
+import tempfile
+import threading
+import unittest
+from .order_journal import OrderJournal, OrderRecord
+from .repositories import ProductRepository
+from .services import CashPayment, EWalletPayment
+from .tugas_mandiri import PosApp
+from .wallet import WalletLedger
+
+
+def buat_order(i: int) -> OrderRecord:
+    return OrderRecord(lines=(("P001", 1, 15000000.0), (f"S{i:03d}", i % 5 + 1, 2500.5)),
+                       total=15000000.0 + (i % 5 + 1) * 2500.5, timestamp=1.5 * i)
+
+
+class TestOrderJournal(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+
+    def test_encode_decode(self):
+        """Tes 1: Record biner kembali utuh setelah encode/decode."""
+        record = buat_order(7)
+        record.seq = 42
+        encoded = record.encode()
+        self.assertEqual(OrderRecord.decode(encoded[8:]), record)
+
+    def test_group_commit_paralel(self):
+        """Tes 2: Checkout paralel semuanya durable dengan fsync lebih sedikit dari order."""
+        journal = OrderJournal(self.dir)
+        threads = [threading.Thread(target=lambda i=i: [journal.append(buat_order(i)) for _ in range(25)])
+                   for i in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        journal.close()
+        self.assertEqual(journal.stats.orders, 400)
+        self.assertLess(journal.fsyncs, 400)
+
+        recovered = OrderJournal(self.dir)
+        self.assertEqual(recovered.stats, journal.stats)
+        recovered.close()
+
+    def test_ekor_rusak_dipotong(self):
+        """Tes 3: Record terakhir yang terpotong diabaikan dan journal bisa dilanjutkan."""
+        journal = OrderJournal(self.dir, group_commit=False)
+        for i in range(3):
+            journal.append(buat_order(i))
+        journal.close()
+        segment = os.path.join(self.dir, os.listdir(self.dir)[0])
+        with open(segment, "ab") as f:
+            f.write(buat_order(9).encode()[:-4])
+
+        journal = OrderJournal(self.dir, group_commit=False)
+        self.assertEqual(journal.stats.orders, 3)
+        self.assertEqual(journal.append(buat_order(3)), 4)
+        journal.close()
+        self.assertEqual(OrderJournal(self.dir).stats.orders, 4)
+
+    def test_snapshot_membatasi_replay(self):
+        """Tes 4: Setelah snapshot, segmen lama dihapus dan state tetap sama."""
+        journal = OrderJournal(self.dir, group_commit=False, snapshot_every=10)
+        for i in range(25):
+            journal.append(buat_order(i))
+        journal.close()
+        segments = [n for n in os.listdir(self.dir) if n.endswith(".wal")]
+        self.assertEqual(segments, ["orders-000000000021.wal"])
+
+        recovered = OrderJournal(self.dir)
+        self.assertEqual(recovered.stats, journal.stats)
+        self.assertEqual(recovered.stats.units_sold["P001"], 25)
+        recovered.close()
+
+    def test_checkout_pos_tercatat(self):
+        """Tes 5: Checkout PosApp yang berhasil ditulis ke journal."""
+        journal = OrderJournal(self.dir)
+        app = PosApp(ProductRepository(), CashPayment(), journal=journal)
+        app.add_item("P001")
+        app.add_item("P002", 2)
+        self.assertTrue(app.checkout())
+        journal.close()
+        stats = OrderJournal(self.dir).stats
+        self.assertEqual(stats.orders, 1)
+        self.assertEqual(stats.revenue_sen, 1_550_000_000)
+        self.assertEqual(stats.units_sold, {"P001": 1, "P002": 2})
+
+    def test_struk_gagal_tidak_tercatat(self):
+        """Tes 6: Checkout dua fase yang gagal mencetak struk tidak muncul saat recovery."""
+        ledger = WalletLedger()
+        ledger.open_account("C001", 20_000_000)
+        journal = OrderJournal(self.dir)
+        app = PosApp(ProductRepository(), EWalletPayment(ledger, "C001"), journal=journal)
+
+        def struk_gagal(priced=None):
+            raise OSError("printer macet")
+
+        app._print_receipt = struk_gagal
+        app.add_item("P001")
+        self.assertFalse(app.checkout())
+        self.assertEqual(ledger.balance("C001"), 20_000_000)
+        journal.close()
+        self.assertEqual(OrderJournal(self.dir).stats.orders, 0)
+
+    def test_journal_gagal_setelah_bayar(self):
+        """Tes 7: Journal gagal setelah pembayaran satu fase: order pending, keranjang di-reset."""
+        journal = OrderJournal(self.dir)
+        self.addCleanup(journal.close)
+        app = PosApp(ProductRepository(), CashPayment(), journal=journal)
+
+        def append_gagal(record):
+            raise OSError("disk penuh")
+
+        journal.append = append_gagal
+        app.add_item("P001")
+        self.assertTrue(app.checkout())
+        self.assertEqual(app.cart.get_items(), [])
+        self.assertEqual(len(app.pending_orders), 1)
+        self.assertEqual(app.pending_orders[0].total, 15_000_000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+# test_pos_server.py
+import asyncio
+import logging
+import threading
+import unittest
+from .repositories import ProductRepository
+from .services import CashPayment, IPaymentProcessor
+from .pos_server import PosServer
+
+
+class GatedPayment(IPaymentProcessor):
+    """Pembayaran yang tertahan sampai gate dibuka (meniru fsync/retry gateway yang lambat)."""
+    def __init__(self):
+        self.gate = threading.Event()
+        self.started = threading.Event()
+
+    def process(self, amount: float) -> bool:
+        self.started.set()
+        return self.gate.wait(5)
+
+
+class TestPosServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+
+    async def start(self, payment: IPaymentProcessor) -> PosServer:
+        pos = PosServer(ProductRepository(), payment)
+        server = await pos.serve(port=0)
+        self.addAsyncCleanup(server.wait_closed)
+        self.addCleanup(server.close)
+        self.addAsyncCleanup(self.sessions_closed, pos)  # dijalankan setelah koneksi klien ditutup
+        self.port = server.sockets[0].getsockname()[1]
+        return pos
+
+    async def sessions_closed(self, pos: PosServer):
+        for _ in range(500):
+            if not pos.active_sessions:
+                return
+            await asyncio.sleep(0.01)
+
+    async def connect(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+
+        async def close():
+            writer.close()
+            await writer.wait_closed()
+        self.addAsyncCleanup(close)
+
+        async def request(line: str) -> str:
+            writer.write(line.encode() + b"\n")
+            await writer.drain()
+            return (await asyncio.wait_for(reader.readline(), 5)).decode().rstrip("\n")
+        return request
+
+    async def test_add_scan_checkout(self):
+        """Tes 1: Satu sesi kasir: ADD, SCAN, TOTAL, CHECKOUT, dan QUIT."""
+        pos = await self.start(CashPayment())
+        request = await self.connect()
+        self.assertEqual(await request("ADD P002 2"), "OK P002 500000.00")
+        self.assertEqual(await request("scan p003:1 P002"), "OK 1550000.00")
+        self.assertEqual(await request("TOTAL"), "OK 1550000.00")
+        self.assertEqual(await request("CHECKOUT"), "OK PAID 1550000.00")
+        self.assertEqual(await request("TOTAL"), "OK 0.00")
+        self.assertEqual(pos.completed_checkouts, 1)
+        self.assertEqual(await request("QUIT"), "OK BYE")
+
+    async def test_balasan_error(self):
+        """Tes 2: Perintah salah dijawab ERR tanpa memutus sesi."""
+        await self.start(CashPayment())
+        request = await self.connect()
+        self.assertEqual(await request(""), "ERR perintah kosong")
+        self.assertEqual(await request("ADD P001 nol"), "ERR jumlah tidak valid")
+        self.assertEqual(await request("ADD P001 -1"), "ERR jumlah tidak valid")
+        self.assertEqual(await request("ADD P999"), "ERR produk P999 tidak ditemukan")
+        self.assertEqual(await request("SCAN P001:x"), "ERR jumlah tidak valid")
+        self.assertEqual(await request("SCAN P002 P998 P999:2"), "ERR produk tidak ditemukan: P998 P999")
+        self.assertEqual(await request("TOTAL"), "OK 250000.00")  # P002 tetap masuk
+        self.assertEqual(await request("HAPUS P001"), "ERR perintah tidak dikenal: HAPUS")
+        self.assertEqual(await request("CHECKOUT"), "OK PAID 250000.00")
+        self.assertEqual(await request("CHECKOUT"), "ERR checkout gagal")  # keranjang kosong
+
+    async def test_checkout_lambat_tidak_menahan_sesi_lain(self):
+        """Tes 3: Checkout yang menunggu I/O berjalan di thread; terminal lain tetap dilayani."""
+        payment = GatedPayment()
+        await self.start(payment)
+        kasir_a, kasir_b = await self.connect(), await self.connect()
+        self.assertEqual(await kasir_a("ADD P001"), "OK P001 15000000.00")
+        checkout = asyncio.create_task(kasir_a("CHECKOUT"))
+        await asyncio.to_thread(payment.started.wait, 5)
+
+        self.assertEqual(await kasir_b("ADD P002"), "OK P002 250000.00")
+        self.assertFalse(checkout.done())
+        payment.gate.set()
+        self.assertEqual(await checkout, "OK PAID 15000000.00")
+
+
+if __name__ == '__main__':
+    unittest.main()
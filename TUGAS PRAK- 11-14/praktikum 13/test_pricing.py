@@ -0,0 +1,106 @@
+# test_pricing.py
+import logging
+import random
+import unittest
+from decimal import Decimal, ROUND_HALF_UP
+from .models import CartItem, Product
+from .pricing import PricingPipeline
+from .repositories import ProductRepository
+from .services import EWalletPayment
+from .tugas_mandiri import PosApp
+from .wallet import WalletLedger
+
+
+def bulat(nilai: Decimal) -> int:
+    return int(nilai.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+class TestPricingPipeline(unittest.TestCase):
+    def setUp(self):
+        self.items = [
+            CartItem(Product("P001", "Laptop Gaming", 15000000), 1),
+            CartItem(Product("P002", "Mouse Wireless", 250000), 2),
+        ]
+
+    def test_diskon_ppn_per_baris(self):
+        """Tes 1: Diskon baris, diskon keranjang, dan PPN dihitung bertahap per baris."""
+        pipeline = PricingPipeline(line_discounts={"P001": 10}, cart_discount=5,
+                                   cart_discount_min=10_000_000)
+        priced = pipeline.price(self.items)
+        self.assertEqual(list(priced.line_discount), [150_000_000, 0])
+        self.assertEqual(list(priced.cart_discount), [67_500_000, 2_500_000])
+        self.assertEqual(list(priced.ppn), [128_250_000, 4_750_000])
+        self.assertEqual(priced.line(1).total, 52_250_000)
+        self.assertEqual(priced.rounding, 0)
+        self.assertEqual(priced.total, 14_630_000)
+
+    def test_minimal_diskon_dan_pembulatan(self):
+        """Tes 2: Diskon keranjang butuh total minimal; total dibulatkan ke satuan pembulatan."""
+        priced = PricingPipeline(cart_discount=5, cart_discount_min=100_000_000).price(self.items)
+        self.assertEqual(sum(priced.cart_discount), 0)
+        self.assertEqual(priced.total, 17_050_000)
+
+        priced = PricingPipeline(pembulatan=100).price([CartItem(Product("X1", "Kabel", 1234.56), 1)])
+        self.assertEqual(list(priced.ppn), [12_346])
+        self.assertEqual(priced.rounding, 4_198)
+        self.assertEqual(priced.total, 1_400)
+
+    def test_sama_dengan_perhitungan_decimal(self):
+        """Tes 3: Total tiap tahap sama dengan Decimal; rincian baris menjumlah tepat ke total."""
+        rng = random.Random(23)
+        for _ in range(50):
+            items = [CartItem(Product(f"S{i:03d}", "Barang", rng.randint(1, 10 ** 7) / 100), rng.randint(1, 500))
+                     for i in range(rng.randint(1, 200))]
+            discounts = {item.product.id: rng.randint(0, 100) for item in items if rng.random() < 0.3}
+            cart_pct = rng.randint(0, 20)
+            priced = PricingPipeline(discounts, cart_discount=cart_pct, pembulatan=100).price(items)
+
+            net = 0
+            for item, line in zip(items, priced):
+                gross = bulat(Decimal(repr(item.product.price)) * 100) * item.quantity
+                self.assertEqual(line.gross, gross)
+                self.assertEqual(line.line_discount, bulat(Decimal(gross * discounts.get(line.product_id, 0)) / 100))
+                net += gross - line.line_discount
+                # Bagian diskon keranjang per baris tidak melebihi harga net baris itu
+                self.assertTrue(0 <= line.cart_discount <= line.gross - line.line_discount)
+                self.assertGreaterEqual(line.total, 0)
+            cart = bulat(Decimal(net * cart_pct) / 100)
+            ppn = bulat(Decimal((net - cart) * 10) / 100)
+            self.assertEqual(sum(priced.cart_discount), cart)
+            self.assertEqual(sum(priced.ppn), ppn)
+            self.assertEqual(sum(priced.line_total), net - cart + ppn)
+            self.assertEqual(priced.total_sen % 10_000, 0)
+            self.assertLess(abs(priced.rounding), 5_001)
+
+    def test_persen_tidak_valid(self):
+        """Tes 4: Persentase di luar 0-100 dan satuan pembulatan nol ditolak."""
+        with self.assertRaises(ValueError):
+            PricingPipeline(line_discounts={"P001": 120})
+        with self.assertRaises(ValueError):
+            PricingPipeline(cart_discount=-1)
+        with self.assertRaises(ValueError):
+            PricingPipeline(pembulatan=0)
+
+    def test_checkout_pos_menagih_ppn(self):
+        """Tes 5: PosApp dengan pipeline harga menagih total setelah PPN."""
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        ledger = WalletLedger()
+        ledger.open_account("C1", 20_000_000)
+        app = PosApp(ProductRepository(), EWalletPayment(ledger, "C1"), pricing=PricingPipeline())
+        app.add_item("P001")
+        self.assertEqual(app.price_cart().total, 16_500_000)
+        self.assertTrue(app.checkout())
+        self.assertEqual(ledger.balance("C1"), 3_500_000)
+
+    def test_baris_gratis_tidak_kena_alokasi(self):
+        """Tes 6: Baris dengan diskon 100% tidak menerima sisa pembulatan diskon keranjang."""
+        items = [CartItem(Product("A", "Permen", 0.10), 1), CartItem(Product("B", "Bonus", 5000), 1)]
+        priced = PricingPipeline({"B": 100}, cart_discount=5, pembulatan=0.01).price(items)
+        self.assertEqual(list(priced.cart_discount), [1, 0])
+        self.assertEqual(list(priced.line_total), [10, 0])
+        self.assertEqual(priced.total_sen, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+# test_repositories.py
+import logging
+import unittest
+from .models import Product
+from .repositories import (CachedProductRepository, IProductRepository, ProductRepository,
+                           SqliteProductRepository)
+
+
+class TestSqliteProductRepository(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.repo = SqliteProductRepository()
+        self.addCleanup(self.repo.close)
+        self.products = [Product(f"P{i:05d}", f"Produk {i}", float(i * 100)) for i in range(2_000)]
+        self.repo.add_many(self.products)
+
+    def test_get_by_id(self):
+        """Tes 1: get_by_id mengembalikan Product baru, None jika tidak ada."""
+        self.assertEqual(self.repo.count(), 2_000)
+        self.assertEqual(self.repo.get_by_id("P00042"), Product("P00042", "Produk 42", 4200.0))
+        self.assertIsNone(self.repo.get_by_id("P99999"))
+        self.repo.add_many([Product("P00042", "Produk 42", 1.0)])
+        self.assertEqual(self.repo.get_by_id("P00042").price, 1.0)
+        self.assertEqual(self.repo.count(), 2_000)
+
+    def test_get_many_dipotong_per_max_params(self):
+        """Tes 2: get_many lebih dari MAX_PARAMS ID dipecah menjadi beberapa query IN."""
+        ids = [p.id for p in self.products[::-1]] + ["P99999", "P00001"]
+        self.assertGreater(len(ids), 2 * SqliteProductRepository.MAX_PARAMS)
+        found = self.repo.get_many(ids)
+        self.assertEqual(len(found), 2_000)
+        self.assertEqual(found, {p.id: p for p in self.products})
+
+        self.repo.MAX_PARAMS = 7  # potongan kecil, sisa tidak habis dibagi
+        found = self.repo.get_many(["P00003", "P00003", "X"] + [f"P{i:05d}" for i in range(100, 150)])
+        self.assertEqual(sorted(found), ["P00003"] + [f"P{i:05d}" for i in range(100, 150)])
+        self.assertEqual(self.repo.get_many([]), {})
+
+    def test_get_all_dan_pencarian(self):
+        """Tes 3: get_all streaming per halaman; pencarian prefix dan rentang harga."""
+        self.repo.PAGE_SIZE = 300
+        self.assertEqual(list(self.repo.get_all()), self.products)
+        self.assertEqual([p.id for p in self.repo.get_page("P01997", 10)], ["P01998", "P01999"])
+        self.assertEqual([p.name for p in self.repo.find_by_name_prefix("Produk 199", limit=3)],
+                         ["Produk 199", "Produk 1990", "Produk 1991"])
+        self.assertEqual(self.repo.find_by_name_prefix(""), [])
+        self.assertEqual([p.price for p in self.repo.find_by_price_range(500, 800)],
+                         [500.0, 600.0, 700.0, 800.0])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCachedProductRepository(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.inner = ProductRepository(Product(f"P{i}", f"Produk {i}", i * 1000) for i in range(10))
+        self.clock = FakeClock()
+
+    def test_lru_eviction(self):
+        """Tes 4: Entri yang paling lama tidak dipakai dibuang saat cache penuh."""
+        cache = CachedProductRepository(self.inner, max_size=3, clock=self.clock)
+        for product_id in ("P0", "P1", "P2"):
+            cache.get_by_id(product_id)
+        cache.get_by_id("P0")  # P1 menjadi yang paling lama
+        cache.get_many(["P3", "P0"])
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 4, "evictions": 1, "size": 3})
+        cache.get_by_id("P1")
+        self.assertEqual(cache.misses, 5)
+        self.assertIsNone(cache.get_by_id("X"))
+        self.assertEqual(cache.stats()["size"], 3)
+
+    def test_ttl(self):
+        """Tes 5: Entri kedaluwarsa setelah ttl dan diambil ulang dari repository asli."""
+        cache = CachedProductRepository(self.inner, ttl=10, clock=self.clock)
+        first = cache.get_by_id("P1")
+        self.clock.now = 9.9
+        self.assertIs(cache.get_many(["P1"])["P1"], first)
+        self.inner.reprice({"P1": 1})
+        self.assertEqual(cache.get_by_id("P1").price, 1000)
+        self.clock.now = 10.0
+        self.assertEqual(cache.get_by_id("P1").price, 1)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_invalidate(self):
+        """Tes 6: invalidate() dan invalidate_all() memaksa pengambilan ulang."""
+        cache = CachedProductRepository(self.inner, clock=self.clock)
+        cache.get_many(["P1", "P2"])
+        self.inner.reprice({"P1": 1, "P2": 2})
+        cache.invalidate("P1")
+        self.assertEqual(cache.get_by_id("P1").price, 1)
+        self.assertEqual(cache.get_by_id("P2").price, 2000)
+        cache.invalidate_all()
+        self.assertEqual(cache.get_many(["P1", "P2"]), {"P1": Product("P1", "Produk 1", 1),
+                                                        "P2": Product("P2", "Produk 2", 2)})
+
+    def test_invalidate_selama_pengambilan(self):
+        """Tes 7: Produk yang di-invalidate saat sedang diambil tidak disimpan ke cache."""
+        inner = self.inner
+
+        class Lambat(IProductRepository):
+            """Invalidasi (misalnya dari thread lain) terjadi di tengah pengambilan."""
+            def get_all(self):
+                return inner.get_all()
+
+            def get_by_id(self, product_id):
+                product = inner.get_by_id(product_id)
+                inner.reprice({product_id: 7})
+                cache.invalidate(product_id)
+                return product
+
+            def get_many(self, product_ids):
+                found = inner.get_many(product_ids)
+                cache.invalidate_all()
+                return found
+
+        cache = CachedProductRepository(Lambat(), clock=self.clock)
+        self.assertEqual(cache.get_by_id("P3").price, 3000)
+        self.assertEqual(cache.stats()["size"], 0)
+        self.assertEqual(cache.get_many(["P4", "P5"])["P4"].price, 4000)
+        self.assertEqual(cache.stats()["size"], 0)
+        self.assertEqual(cache._invalidated, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+# test_search.py
+import logging
+import random
+import unittest
+from .models import Product
+from .repositories import ProductRepository
+from .search import ORDER_PRICE, ORDER_RELEVANCE, TOP_K, ProductSearchIndex, tokenize
+from .services import CashPayment
+from .tugas_mandiri import PosApp
+
+
+class TestProductSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = ProductSearchIndex([
+            Product("P001", "Laptop Gaming", 15000000),
+            Product("P002", "Mouse Wireless", 250000),
+            Product("P003", "Keyboard Mech", 800000),
+            Product("P004", "Mouse Gaming RGB", 450000),
+            Product("P005", "Lampu Meja LED", 120000),
+        ])
+
+    def ids(self, query, **kwargs):
+        return [p.id for p in self.index.search(query, **kwargs)]
+
+    def test_awalan_dan_multi_kata(self):
+        """Tes 1: Setiap kata kueri dicocokkan sebagai awalan kata nama produk."""
+        self.assertEqual(self.ids("lap gam"), ["P001"])
+        self.assertEqual(sorted(self.ids("gaming")), ["P001", "P004"])
+        self.assertEqual(sorted(self.ids("la")), ["P001", "P005"])
+        self.assertEqual(self.ids("aming"), [])
+        self.assertEqual(self.ids("mouse xyz"), [])
+
+    def test_urutan_relevansi_dan_harga(self):
+        """Tes 2: Kata persis di depan nama lebih relevan; ORDER_PRICE termurah dulu."""
+        self.assertEqual(self.ids("mouse"), ["P002", "P004"])
+        self.assertEqual(self.ids("mouse gaming")[0], "P004")
+        self.assertEqual(self.ids("m", order_by=ORDER_PRICE), ["P005", "P002", "P004", "P003"])
+        self.assertEqual(self.ids("m", k=2, order_by=ORDER_PRICE), ["P005", "P002"])
+
+    def test_pembaruan_inkremental(self):
+        """Tes 3: add/rename/reprice/remove langsung terlihat, termasuk dari cache."""
+        self.assertEqual(self.ids("mouse", order_by=ORDER_PRICE), ["P002", "P004"])
+        self.index.reprice("P004", 100000)
+        self.assertEqual(self.ids("mouse", order_by=ORDER_PRICE), ["P004", "P002"])
+        self.index.add(Product("P002", "Trackpad Wireless", 250000))
+        self.assertEqual(self.ids("mouse"), ["P004"])
+        self.assertEqual(self.ids("wire"), ["P002"])
+        self.index.add(Product("P006", "Mouse Pad", 50000))
+        self.assertEqual(self.ids("mouse", order_by=ORDER_PRICE), ["P006", "P004"])
+        self.index.remove("P006")
+        self.assertEqual(self.ids("mouse"), ["P004"])
+        self.assertEqual(len(self.index), 5)
+
+    def test_sama_dengan_scan_linear(self):
+        """Tes 4: Hasil acak sama dengan pencarian linear pada katalog yang sama."""
+        rng = random.Random(21)
+        words = ["kopi", "kopiko", "susu", "sabun", "sampo", "teh", "telur", "roti", "rokok"]
+        products = {}
+        index = ProductSearchIndex()
+        for i in range(500):
+            p = Product(f"X{i % 300:03d}", " ".join(rng.sample(words, 3)), rng.randint(1, 100) * 1000)
+            products[p.id] = p
+            index.add(p)
+            if i % 7 == 0:
+                victim = rng.choice(list(products))
+                index.remove(victim)
+                del products[victim]
+            for query in ("ko", "s te", "kopi susu", "ro"):
+                qs = tokenize(query)
+                expected = sorted((p.price, p.id) for p in products.values()
+                                  if all(any(t.startswith(q) for t in tokenize(p.name)) for q in qs))
+                found = index.search(query, k=1000, order_by=ORDER_PRICE)
+                self.assertEqual([p.price for p in found], [price for price, _ in expected])
+                self.assertEqual(sorted(p.id for p in found), sorted(pid for _, pid in expected))
+
+    def test_awalan_pendek_tidak_terpotong(self):
+        """Tes 5: Awalan yang cocok dengan ratusan token tetap memeringkat semuanya."""
+        index = ProductSearchIndex(Product(f"K{i:03d}", f"Kopi{i:03d} Sachet", 100000 - i)
+                                   for i in range(300))
+        self.assertEqual([p.id for p in index.search("ko", k=3, order_by=ORDER_PRICE)],
+                         ["K299", "K298", "K297"])
+        self.assertEqual(len(index.search("ko", k=1000)), 300)
+        self.assertEqual(len(index.complete("kopi")), 300)
+
+    def test_top_awalan_pendek_sama_dengan_scan(self):
+        """Tes 7: Top-k tersimpan untuk awalan pendek tetap sama dengan hasil scan penuh."""
+        rng = random.Random(13)
+        words = ["kopi", "kopiko", "kola", "susu", "sabun", "sampo", "teh", "telur", "roti"]
+        index = ProductSearchIndex()
+        ids = []
+        for i in range(3000):
+            op = rng.random()
+            if ids and op < 0.2:
+                index.reprice(rng.choice(ids), rng.randint(1, 100) * 1000)
+            elif ids and op < 0.3:
+                index.remove(rng.choice(ids))
+            else:
+                pid = f"X{rng.randrange(400):03d}"
+                index.add(Product(pid, " ".join(rng.sample(words, rng.randint(1, 3))), rng.randint(1, 100) * 1000))
+                ids.append(pid)
+            if i % 50 == 0:
+                for query in ("k", "ko", "kop", "sa", "t"):
+                    for order_by in (ORDER_RELEVANCE, ORDER_PRICE):
+                        scan = index.search(query, k=TOP_K + 1, order_by=order_by)[:10]
+                        self.assertEqual(index.search(query, k=10, order_by=order_by), scan)
+
+        # Daftar yang habis karena penghapusan diisi ulang dari scan penuh
+        index = ProductSearchIndex(Product(f"K{i:03d}", f"Kopi {i}", 1000 + i) for i in range(100))
+        for i in range(TOP_K - 5):
+            index.remove(f"K{i:03d}")
+        self.assertEqual([p.id for p in index.search("kop", k=10, order_by=ORDER_PRICE)],
+                         [f"K{i:03d}" for i in range(TOP_K - 5, TOP_K + 5)])
+        self.assertEqual([p.id for p in index.search("kop", k=3, order_by=ORDER_PRICE)],
+                         [f"K{i:03d}" for i in range(TOP_K - 5, TOP_K - 2)])
+
+    def test_pos_app_search(self):
+        """Tes 6: PosApp.search memakai index yang di-inject."""
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        repo = ProductRepository()
+        app = PosApp(repo, CashPayment(), search_index=ProductSearchIndex(repo.get_all()))
+        self.assertEqual([p.id for p in app.search("keyb")], ["P003"])
+        self.assertEqual(PosApp(repo, CashPayment()).search("keyb"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+# test_services.py
+import logging
+import random
+import unittest
+from praktikum_common import metrics
+from .models import Product
+from .services import (CashPayment, EWalletPayment, InstrumentedPaymentProcessor, InstrumentedTwoPhasePayment,
+                       ShoppingCart, instrument)
+from .wallet import WalletLedger
+
+
+class TestShoppingCartTotal(unittest.TestCase):
+    def setUp(self):
+        """Menyiapkan keranjang dan beberapa produk."""
+        self.cart = ShoppingCart()
+        self.laptop = Product("P001", "Laptop Gaming", 15000000)
+        self.mouse = Product("P002", "Mouse Wireless", 250000)
+
+    def test_keranjang_kosong(self):
+        """Tes 1: Keranjang kosong bernilai 0."""
+        self.assertEqual(self.cart.total_price, 0)
+
+    def test_add_item_menambah_total(self):
+        """Tes 2: add_item memperbarui total, termasuk produk yang sama."""
+        self.cart.add_item(self.laptop)
+        self.cart.add_item(self.mouse, 2)
+        self.cart.add_item(self.mouse)
+        self.assertEqual(self.cart.total_price, 15750000)
+        self.assertEqual(self.cart.total_price, self.cart.recompute_total())
+
+    def test_remove_dan_set_quantity(self):
+        """Tes 3: remove_item dan set_quantity menjaga total tetap benar."""
+        self.cart.add_item(self.laptop)
+        self.cart.add_item(self.mouse, 2)
+        self.cart.set_quantity("P002", 5)
+        self.assertEqual(self.cart.total_price, 16250000)
+        self.cart.remove_item("P001")
+        self.assertEqual(self.cart.total_price, 1250000)
+        self.cart.set_quantity("P002", 0)
+        self.assertEqual(self.cart.total_price, 0)
+        self.assertEqual(self.cart.get_items(), [])
+
+    def test_harga_berubah_di_tengah_sesi(self):
+        """Tes 4: Perubahan harga produk disesuaikan lewat reprice()."""
+        self.cart.add_item(self.mouse, 4)
+        self.mouse.price = 200000
+        self.cart.reprice("P002")
+        self.assertEqual(self.cart.total_price, 800000)
+        self.mouse.price = 300000
+        self.cart.add_item(self.mouse)  # add_item ikut menyesuaikan harga lama
+        self.assertEqual(self.cart.total_price, self.cart.recompute_total())
+
+    def test_add_items_menggabungkan_sku(self):
+        """Tes 5: add_items menggabungkan SKU duplikat dalam satu batch."""
+        self.cart.add_item(self.mouse)
+        self.cart.add_items([(self.laptop, 1), (self.mouse, 2), (self.laptop, 2)])
+        quantities = {item.product.id: item.quantity for item in self.cart.get_items()}
+        self.assertEqual(quantities, {"P001": 3, "P002": 3})
+        self.assertEqual(self.cart.total_price, self.cart.recompute_total())
+
+    def test_objek_produk_berbeda_untuk_id_sama(self):
+        """Tes 6: Product baru dengan id sama mengganti baris lama beserta harganya."""
+        self.cart.add_item(Product("A", "Barang A", 100))
+        self.cart.add_item(Product("A", "Barang A", 150))
+        self.assertEqual(self.cart.total_price, 300)
+        self.assertEqual(self.cart.total_price, self.cart.recompute_total())
+
+        self.cart.add_items([(Product("A", "Barang A", 120), 1), (Product("B", "Barang B", 10), 1)])
+        self.cart.add_items([(Product("B", "Barang B", 20), 2), (Product("B", "Barang B", 30), 1)])
+        self.assertEqual(self.cart.total_price, 3 * 120 + 4 * 30)
+        self.assertEqual(self.cart.total_price, self.cart.recompute_total())
+
+    def test_acak_sama_dengan_hitung_ulang(self):
+        """Tes 7: Operasi acak selalu sama dengan hitung ulang penuh."""
+        rng = random.Random(13)
+        products = [Product(f"P{i:03d}", f"Produk {i}", rng.randint(1, 500) * 1000) for i in range(30)]
+        for _ in range(2000):
+            product = rng.choice(products)
+            aksi = rng.random()
+            if aksi < 0.5:
+                self.cart.add_item(product, rng.randint(1, 5))
+            elif product.id not in {item.product.id for item in self.cart.get_items()}:
+                continue
+            elif aksi < 0.7:
+                self.cart.set_quantity(product.id, rng.randint(0, 10))
+            elif aksi < 0.85:
+                self.cart.remove_item(product.id)
+            else:
+                product.price = rng.randint(1, 500) * 1000
+                self.cart.reprice(product.id)
+            self.assertEqual(self.cart.total_price, self.cart.recompute_total())
+
+
+class TestInstrumentasiPembayaran(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        self.registry = metrics.MetricsRegistry()
+        self.ledger = WalletLedger()
+        self.ledger.open_account("C001", 100000)
+
+    def hitung(self, result: str) -> int:
+        return self.registry.counter("payment_process_total", processor="EWalletPayment",
+                                     result=result).value
+
+    def test_dua_fase_tercatat(self):
+        """Tes 8: reserve/commit/release E-Wallet tercatat sebagai metrik pembayaran."""
+        self.assertIsInstance(instrument(CashPayment(), self.registry), InstrumentedPaymentProcessor)
+        wallet = instrument(EWalletPayment(self.ledger, "C001"), self.registry)
+        self.assertIsInstance(wallet, InstrumentedTwoPhasePayment)
+
+        wallet.commit(wallet.reserve(30000))
+        wallet.release(wallet.reserve(20000))
+        self.assertIsNone(wallet.reserve(500000))
+        self.assertTrue(wallet.process(10000))
+        self.assertEqual((self.hitung("success"), self.hitung("released"), self.hitung("failed")),
+                         (2, 1, 1))
+        latency = self.registry.histogram("payment_process_seconds", processor="EWalletPayment")
+        self.assertEqual(latency.count, 4)
+        self.assertEqual(self.ledger.balance("C001"), 60000)
+
+
+if __name__ == '__main__':
+    unittest.main()
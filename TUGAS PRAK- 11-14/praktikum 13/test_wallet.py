@@ -0,0 +1,131 @@
+# test_wallet.py
+import logging
+import os
+import tempfile
+import threading
+import unittest
+from .models import Product
+from .repositories import ProductRepository
+from .services import EWalletPayment
+from .tugas_mandiri import PosApp
+from .wallet import InsufficientFundsError, WalletError, WalletLedger
+
+
+class TestWalletLedger(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.journal = os.path.join(tmp.name, "wallet.journal")
+
+    def test_reserve_commit_release(self):
+        """Tes 1: reserve menahan dana, commit memotong, release mengembalikan."""
+        ledger = WalletLedger()
+        ledger.open_account("C1", 100_000)
+        rid = ledger.reserve("C1", 30_000)
+        self.assertEqual(ledger.balance("C1"), 70_000)
+        ledger.commit(rid)
+        self.assertEqual(ledger.balance("C1"), 70_000)
+        rid = ledger.reserve("C1", 50_000)
+        ledger.release(rid)
+        self.assertEqual(ledger.balance("C1"), 70_000)
+        with self.assertRaises(WalletError):
+            ledger.commit(rid)
+
+    def test_saldo_tidak_cukup(self):
+        """Tes 2: Reservasi melebihi saldo tersedia ditolak."""
+        ledger = WalletLedger()
+        ledger.open_account("C1", 10_000)
+        ledger.reserve("C1", 8_000)
+        with self.assertRaises(InsufficientFundsError):
+            ledger.reserve("C1", 5_000)
+
+    def test_debit_bersamaan_tidak_overdraw(self):
+        """Tes 3: Debit paralel dari banyak thread tidak membuat saldo negatif."""
+        ledger = WalletLedger(shards=8)
+        for c in range(4):
+            ledger.open_account(f"C{c}", 1_000)
+        approved = [0]
+        lock = threading.Lock()
+
+        def worker(customer):
+            for _ in range(200):
+                try:
+                    with ledger.reservation(customer, 7):
+                        pass
+                except InsufficientFundsError:
+                    continue
+                with lock:
+                    approved[0] += 1
+
+        threads = [threading.Thread(target=worker, args=(f"C{i % 4}",)) for i in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(approved[0], 4 * (1_000 // 7))
+        for c in range(4):
+            self.assertEqual(ledger.balance(f"C{c}"), 1_000 % 7)
+
+    def test_pemulihan_dari_journal(self):
+        """Tes 4: State dibangun ulang dari journal; reservasi menggantung dilepas."""
+        ledger = WalletLedger(journal_path=self.journal)
+        ledger.open_account("C1", 100_000)
+        ledger.deposit("C1", 25_000.50)
+        ledger.commit(ledger.reserve("C1", 40_000))
+        ledger.reserve("C1", 10_000)  # "crash" sebelum commit
+        ledger.close()
+        with open(self.journal, "a") as f:
+            f.write("COMMIT 9")  # record terakhir terpotong
+
+        recovered = WalletLedger(journal_path=self.journal)
+        self.assertEqual(recovered.balance("C1"), 85_000.50)
+        rid = recovered.reserve("C1", 1_000)
+        self.assertGreater(rid, 2)
+        recovered.close()
+
+    def test_ekor_terpotong_dibuang_sebelum_menulis(self):
+        """Tes 4b: Ekor terpotong dipotong sehingga record baru tidak menempel padanya."""
+        ledger = WalletLedger(journal_path=self.journal)
+        ledger.open_account("C1", 100_000)
+        rid = ledger.reserve("C1", 10_000)
+        ledger.close()
+        with open(self.journal, "a") as f:
+            f.write(f"COMMIT {rid}")  # crash di tengah menulis COMMIT
+
+        recovered = WalletLedger(journal_path=self.journal)  # reservasi menggantung dilepas
+        recovered.commit(recovered.reserve("C1", 30_000))
+        recovered.close()
+        with open(self.journal, encoding="utf-8") as f:
+            self.assertTrue(all(line.endswith("\n") for line in f))
+
+        again = WalletLedger(journal_path=self.journal)
+        self.assertEqual(again.balance("C1"), 70_000)
+        again.close()
+
+    def test_checkout_dua_fase_pos(self):
+        """Tes 5: Checkout PosApp memotong saldo; gagal jika saldo kurang."""
+        ledger = WalletLedger()
+        ledger.open_account("C1", 16_000_000)
+        app = PosApp(ProductRepository(), EWalletPayment(ledger, "C1"))
+        app.add_item("P001")
+        self.assertTrue(app.checkout())
+        self.assertEqual(ledger.balance("C1"), 1_000_000)
+        app.add_item("P001")
+        self.assertFalse(app.checkout())
+        self.assertEqual(ledger.balance("C1"), 1_000_000)
+
+    def test_checkout_gagal_melepas_reservasi(self):
+        """Tes 6: Jika checkout gagal di tengah jalan, dana yang ditahan dikembalikan."""
+        ledger = WalletLedger()
+        ledger.open_account("C1", 16_000_000)
+        app = PosApp(ProductRepository(), EWalletPayment(ledger, "C1"))
+        app.add_item("P001")
+        app._print_receipt = lambda priced=None: 1 / 0
+        self.assertFalse(app.checkout())
+        self.assertEqual(ledger.balance("C1"), 16_000_000)
+
+
+if __name__ == '__main__':
+    unittest.main()
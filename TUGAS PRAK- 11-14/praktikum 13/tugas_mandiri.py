@@ -1,110 +1,289 @@
 # main_app.py
+from __future__ import annotations
+
 import logging
-from repositories import ProductRepository
-from services import IPaymentProcessor, ShoppingCart, CashPayment, DebitCardPayment, EWalletPayment
-from models import Product
+import os
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Tuple
+from praktikum_common import metrics
+from praktikum_common.log_facade import get_logger, setup_logging, Rupiah
+from .repositories import IProductRepository, IVersionedRepository, ProductRepository, CachedVersionedRepository
+from .services import IPaymentProcessor, ITwoPhasePayment, instrument, ShoppingCart, CashPayment, DebitCardPayment, EWalletPayment
+from .wallet import WalletLedger
+from .order_journal import OrderJournal, OrderRecord
+from .search import ProductSearchIndex, ORDER_RELEVANCE
+from .models import Product
+
+if TYPE_CHECKING:
+    # pricing hanya di-import oleh pemanggil yang memakainya (lihat titik masuk)
+    from .pricing import PriceBreakdown, PricingPipeline
 
-LOGGER = logging.getLogger('MAIN_APP')
+LOGGER = get_logger('MAIN_APP')
 
 class PosApp:
     """Kelas Orchestrator (Aplikasi Utama). Hanya mengkoordinasi flow dan menerapkan DI."""
-    def __init__(self, repository: ProductRepository, payment_processor: IPaymentProcessor):
+    MENU_LIMIT = 50  # katalog besar: sisanya dicari lewat search()
+
+    def __init__(self, repository: IProductRepository, payment_processor: IPaymentProcessor,
+                 journal: OrderJournal | None = None, search_index: ProductSearchIndex | None = None,
+                 pricing: PricingPipeline | None = None):
         # Dependency Injection (DI)
         self.repository = repository
+        self.journal = journal
+        self.search_index = search_index
+        # Tanpa pipeline harga, yang ditagih adalah total keranjang apa adanya
+        self.pricing = pricing
+        # Order yang sudah dibayar tetapi gagal ditulis ke journal; perlu rekonsiliasi manual
+        self.pending_orders: list[OrderRecord] = []
+        if metrics.ENABLED:
+            payment_processor = instrument(payment_processor)
         self.payment_processor = payment_processor
-        self.cart = ShoppingCart()
+        # Processor dua fase dipakai langsung agar dana ditahan selama checkout
+        self._two_phase = payment_processor if isinstance(payment_processor, ITwoPhasePayment) else None
+        self._new_cart()
         LOGGER.info("PosApp Application Initialized.")
 
+    def _new_cart(self):
+        """Keranjang baru dipatok ke versi katalog terbaru (jika repository berversi).
+
+        Repricing yang dipublikasikan di tengah sesi tidak mengubah harga
+        yang dilihat keranjang ini; keranjang berikutnya memakai versi baru.
+        """
+        self.cart = ShoppingCart()
+        if isinstance(self.repository, IVersionedRepository):
+            self.catalog = self.repository.snapshot()
+        else:
+            self.catalog = self.repository
+
     def _display_menu(self):
         """Menampilkan daftar produk."""
+        if not LOGGER.isEnabledFor(logging.INFO):
+            return
         LOGGER.info("\n--- DAFTAR PRODUK ---")
-        for p in self.repository.get_all():
-            LOGGER.info(f"[{p.id}] {p.name} - Rp{p.price:,.0f}")
+        for i, p in enumerate(islice(self.catalog.get_all(), self.MENU_LIMIT + 1)):
+            if i == self.MENU_LIMIT:
+                LOGGER.info("... (gunakan menu Cari Produk untuk produk lainnya)")
+                break
+            LOGGER.info("[%s] %s - %s", p.id, p.name, Rupiah(p.price))
 
-    def _handle_add_item(self):
-        """Menangani input untuk menambahkan item ke keranjang."""
-        product_id = input("Masukkan ID Produk: ").strip().upper()
-        product = self.repository.get_by_id(product_id)
+    def search(self, query: str, k: int = 10, order_by: str = ORDER_RELEVANCE) -> list[Product]:
+        """Mencari produk berdasarkan kata/awalan kata pada nama produk."""
+        if self.search_index is None:
+            LOGGER.warning("Index pencarian tidak tersedia.")
+            return []
+        return self.search_index.search(query, k, order_by)
+
+    def _handle_search(self):
+        """Menangani input pencarian produk."""
+        query = input("Cari nama produk: ")
+        results = self.search(query)
+        if not results:
+            LOGGER.info("Tidak ada produk yang cocok dengan '%s'.", query)
+        for p in results:
+            LOGGER.info("[%s] %s - %s", p.id, p.name, Rupiah(p.price))
+
+    def add_item(self, product_id: str, quantity: int = 1) -> Product | None:
+        """Menambahkan produk ke keranjang tanpa interaksi input().
 
+        Returns:
+            Product | None: Produk yang ditambahkan, None jika ID tidak ada.
+
+        Raises:
+            ValueError: Jika jumlah bukan angka positif.
+        """
+        if quantity <= 0:
+            raise ValueError("Jumlah harus positif")
+        product = self.catalog.get_by_id(product_id.strip().upper())
         if not product:
-            LOGGER.warning(f"Produk ID '{product_id}' tidak ditemukan.")
-            return
+            LOGGER.warning("Produk ID '%s' tidak ditemukan.", product_id)
+            return None
+        self.cart.add_item(product, quantity)
+        return product
 
+    def _handle_add_item(self):
+        """Menangani input untuk menambahkan item ke keranjang."""
+        product_id = input("Masukkan ID Produk: ")
         try:
             quantity_input = input("Jumlah (default 1): ")
             quantity = int(quantity_input) if quantity_input else 1
-            if quantity <= 0:
-                raise ValueError
-            
-            self.cart.add_item(product, quantity)
+            # add_item mencari produk sekali dan memberi peringatan jika ID tidak ada
+            self.add_item(product_id, quantity)
 
         except ValueError:
             LOGGER.error("Jumlah tidak valid. Hanya angka positif yang diterima.")
         except Exception as e:
-            LOGGER.error(f"Error saat menambahkan item: {e}")
+            LOGGER.error("Error saat menambahkan item: %s", e)
+
+    def add_scanned(self, lines: Iterable[Tuple[str, int]]) -> list[str]:
+        """Menambahkan hasil batch scan (product_id, jumlah) ke keranjang.
+
+        Semua produk di-resolve dengan satu panggilan get_many.
+
+        Returns:
+            list[str]: ID produk yang tidak ditemukan.
+        """
+        lines = [(product_id.strip().upper(), quantity) for product_id, quantity in lines]
+        products = self.catalog.get_many(product_id for product_id, _ in lines)
+        missing = [product_id for product_id, _ in lines if product_id not in products]
+        if missing:
+            LOGGER.warning("Produk tidak ditemukan: %s", ", ".join(missing))
+        self.cart.add_items(
+            (products[product_id], quantity) for product_id, quantity in lines
+            if product_id in products and quantity > 0
+        )
+        return missing
 
     def _handle_checkout(self):
         """Menangani proses checkout."""
-        total = self.cart.total_price
-        
-        if total == 0:
+        self.checkout()
+
+    def price_cart(self) -> PriceBreakdown | None:
+        """Rincian diskon, PPN, dan pembulatan keranjang; None jika tanpa pipeline harga."""
+        if self.pricing is None:
+            return None
+        return self.pricing.price(self.cart.get_items())
+
+    @metrics.timed("pos_checkout_seconds")
+    def checkout(self) -> bool:
+        """Membayar isi keranjang; keranjang di-reset jika berhasil."""
+        if self.cart.total_price == 0:
             LOGGER.warning("Keranjang kosong. Tidak bisa checkout.")
-            return
+            return False
 
-        LOGGER.info(f"\nTotal Belanja: Rp{total:,.0f}")
+        priced = self.price_cart()
+        total = priced.total if priced is not None else self.cart.total_price
+        LOGGER.info("\nTotal Belanja: %s", Rupiah(total))
         
+        if self._two_phase is not None:
+            return self._checkout_two_phase(total, priced)
+
         # Delegasi ke Payment Processor yang di-inject
         success = self.payment_processor.process(total) 
 
         if success:
+            # Pelanggan sudah membayar: kegagalan journal tidak boleh membatalkan
+            # transaksi, order ditandai pending dan keranjang tetap di-reset
+            try:
+                self._record_order(total)
+            except Exception:
+                self.pending_orders.append(OrderRecord.from_cart(self.cart, total))
+                LOGGER.exception("Order sudah dibayar tetapi gagal dicatat; ditandai pending.")
             LOGGER.info("TRANSAKSI BERHASIL.")
-            self._print_receipt()
-            self.cart = ShoppingCart()  # Reset cart
-        else:
+            self._print_receipt(priced)
+            self._new_cart()  # Reset cart
+            return True
+        LOGGER.error("TRANSAKSI GAGAL.")
+        return False
+
+    def _checkout_two_phase(self, total: float, priced: PriceBreakdown | None) -> bool:
+        """Dana ditahan dulu; dipotong hanya jika struk selesai dibuat dan order tercatat.
+
+        Struk dibuat sebelum order ditulis ke journal: append yang durable
+        adalah langkah terakhir yang boleh gagal, sehingga order yang
+        dibatalkan tidak pernah muncul kembali saat recovery. Jika append
+        gagal, dana dikembalikan dan keranjang dibiarkan agar bisa dicoba lagi.
+
+        Celah yang tersisa: crash setelah append tetapi sebelum commit membuat
+        order tercatat di journal, sementara WalletLedger melepas reservasinya
+        saat restart (lihat WalletLedger._release_orphans). Order seperti itu
+        harus direkonsiliasi manual terhadap journal order.
+        """
+        token = self._two_phase.reserve(total)
+        if token is None:
             LOGGER.error("TRANSAKSI GAGAL.")
+            return False
+        try:
+            self._print_receipt(priced)
+            self._record_order(total)
+        except Exception:
+            self._two_phase.release(token)
+            LOGGER.exception("TRANSAKSI DIBATALKAN, dana dikembalikan.")
+            return False
+        self._two_phase.commit(token)
+        LOGGER.info("TRANSAKSI BERHASIL.")
+        self._new_cart()  # Reset cart
+        return True
 
-    def _print_receipt(self):
+    def _record_order(self, total: float):
+        """Menulis order ke journal (jika ada); kembali setelah order durable."""
+        if self.journal is not None:
+            self.journal.append(OrderRecord.from_cart(self.cart, total))
+
+    def _print_receipt(self, priced: PriceBreakdown | None = None):
         """Mencetak struk pembelian sederhana."""
+        if not LOGGER.isEnabledFor(logging.INFO):
+            return
         LOGGER.info("\n--- STRUK PEMBELIAN ---")
         for item in self.cart.get_items():
-            LOGGER.info(f" {item.product.name} x{item.quantity} = Rp{item.subtotal:,.0f}")
+            LOGGER.info(" %s x%d = %s", item.product.name, item.quantity, Rupiah(item.subtotal))
         LOGGER.info("---------------------------")
-        LOGGER.info(f"TOTAL AKHIR: Rp{self.cart.total_price:,.0f}")
+        if priced is not None:
+            LOGGER.info("Diskon: -%s", Rupiah((sum(priced.line_discount) + sum(priced.cart_discount)) / 100))
+            LOGGER.info("PPN %d%%: %s", self.pricing.ppn_persen, Rupiah(sum(priced.ppn) / 100))
+            LOGGER.info("Pembulatan: %s", Rupiah(priced.rounding / 100))
+        LOGGER.info("TOTAL AKHIR: %s", Rupiah(priced.total if priced is not None else self.cart.total_price))
         LOGGER.info("---------------------------")
 
 
 # --- TITIK MASUK UTAMA (Orchestration) ---
 if __name__ == "__main__":
-    logging.basicConfig(level=logging.INFO, format='%(name)s - %(levelname)s - %(message)s')
+    setup_logging(level=logging.INFO, non_blocking=True)
 
-    # 1. Lapisan Data
-    repo = ProductRepository()
+    # 1. Lapisan Data (dibungkus cache LRU untuk SKU yang sering dipindai;
+    #    cache ikut versi katalog, jadi repricing langsung terlihat)
+    catalog = ProductRepository()
+    repo = CachedVersionedRepository(catalog, max_size=1000, ttl=300)
 
     # 2. Ins- Service (Implementasi Konkret)
-    # Inovasi Praktikum 13: menggunakan E-Wallet Payment
-    payment_method = EWalletPayment()
+    # Inovasi Praktikum 13: menggunakan E-Wallet Payment dengan ledger saldo
+    ledger = WalletLedger(journal_path=os.environ.get("POS_WALLET_JOURNAL"))
+    if not ledger.has_account("PELANGGAN-01"):
+        ledger.open_account("PELANGGAN-01", initial=1_000_000)
+    payment_method = EWalletPayment(ledger, customer_id="PELANGGAN-01")
+
+    # 3. Journal order durable (opsional, aktif jika POS_ORDER_JOURNAL berisi direktori)
+    journal_dir = os.environ.get("POS_ORDER_JOURNAL")
+    journal = OrderJournal(journal_dir) if journal_dir else None
+
+    # 4. Index pencarian nama produk (diperbarui inkremental setiap katalog dipublikasikan)
+    search_index = ProductSearchIndex(repo.get_all())
+    catalog.subscribe(search_index.sync)
+
+    # 5. Pipeline harga: diskon, PPN 10%, dan pembulatan ke Rp1
+    from .pricing import PricingPipeline
+    pricing = PricingPipeline()
 
-    # 3. Inject Dependencies ke Aplikasi Utama
-    app = PosApp(repository=repo, payment_processor=payment_method)
+    # 6. Inject Dependencies ke Aplikasi Utama
+    app = PosApp(repository=repo, payment_processor=payment_method, journal=journal,
+                 search_index=search_index, pricing=pricing)
 
     # Loop CLI
     while True:
         print("\nMenu:")
         print("1. Tampilkan Produk")
-        print("2. Tambah ke Keranjang")
-        print("3. Checkout")
-        print("4. Keluar")
+        print("2. Cari Produk")
+        print("3. Tambah ke Keranjang")
+        print("4. Checkout")
+        print("5. Keluar")
         
-        choice = input("Pilih opsi (1-4): ")
+        choice = input("Pilih opsi (1-5): ")
 
         if choice == "1":
             app._display_menu()
         elif choice == "2":
-            app._handle_add_item()
+            app._handle_search()
         elif choice == "3":
-            app._handle_checkout()
+            app._handle_add_item()
         elif choice == "4":
+            app._handle_checkout()
+        elif choice == "5":
             LOGGER.info("Aplikasi dihentikan.")
+            ledger.close()
+            if journal is not None:
+                journal.close()
+            if metrics.ENABLED:
+                # POS_METRICS_FILE kosong -> snapshot ditulis ke stdout
+                metrics.REGISTRY.export(os.environ.get("POS_METRICS_FILE"))
             break
         else:
             LOGGER.warning("Pilihan tidak valid.")
@@ -0,0 +1,251 @@
+# wallet.py
+"""Buku besar (ledger) saldo E-Wallet per pelanggan.
+
+- Saldo disimpan dalam sen (int) supaya tidak ada galat pembulatan float.
+- Lock dibagi ke beberapa shard berdasarkan hash customer_id, sehingga
+  debit ke akun yang berbeda tidak antre di satu lock global.
+- Pembayaran dua fase: reserve() menahan dana, lalu commit() memotong
+  saldo atau release() mengembalikan tahanan.
+- Setiap perubahan ditulis ke journal append-only sebelum diterapkan,
+  sehingga state dapat dibangun ulang setelah proses crash.
+
+Format journal (satu record per baris):
+    OPEN <customer> <sen> | DEPOSIT <customer> <sen>
+    RESERVE <rid> <customer> <sen> | COMMIT <rid> | RELEASE <rid>
+"""
+import itertools
+import os
+import threading
+from contextlib import contextmanager
+
+from praktikum_common.log_facade import get_logger, Rupiah
+from praktikum_common.money import ke_sen
+
+LOGGER = get_logger('WALLET')
+
+
+class WalletError(Exception):
+    """Operasi ledger tidak valid (akun atau reservasi tidak dikenal)."""
+
+
+class InsufficientFundsError(WalletError):
+    """Saldo tersedia tidak cukup untuk reservasi."""
+
+
+class Account:
+    __slots__ = ("customer_id", "balance", "held")
+
+    def __init__(self, customer_id: str, balance: int = 0):
+        self.customer_id = customer_id
+        self.balance = balance  # sen
+        self.held = 0           # sen yang sedang direservasi
+
+    @property
+    def available(self) -> int:
+        return self.balance - self.held
+
+
+# --- JOURNAL APPEND-ONLY ---
+class WalletJournal:
+    """Menulis record ledger secara berurutan ke satu file.
+
+    sync=False: flush ke OS setiap record (aman terhadap crash proses).
+    sync=True : fsync setiap record (aman terhadap mati listrik, lebih lambat).
+    """
+    def __init__(self, path: str, sync: bool = False):
+        self.path = path
+        self.sync = sync
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    @staticmethod
+    def read(path: str) -> tuple[list[list[str]], int]:
+        """Membaca record yang utuh dan offset akhir record utuh terakhir;
+        baris terakhir yang terpotong (tulisan terakhir sebelum crash) diabaikan."""
+        if not os.path.exists(path):
+            return [], 0
+        with open(path, "rb") as f:
+            data = f.read()
+        records = []
+        offset = 0
+        while True:
+            end = data.find(b"\n", offset)
+            if end < 0:
+                break
+            records.append(data[offset:end].decode("utf-8").split())
+            offset = end + 1
+        if offset < len(data):
+            LOGGER.warning("Record journal terakhir terpotong, diabaikan: %r", data[offset:])
+        return records, offset
+
+    def append(self, *fields):
+        record = " ".join(map(str, fields)) + "\n"
+        with self._lock:
+            self._file.write(record)
+            self._file.flush()
+            if self.sync:
+                os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+# --- LEDGER ---
+class WalletLedger:
+    """Ledger saldo E-Wallet dengan sharded lock dan reservasi dua fase."""
+    def __init__(self, journal_path: str | None = None, shards: int = 64, sync: bool = False):
+        self._accounts: dict[str, Account] = {}
+        self._reservations: dict[int, tuple[str, int]] = {}  # rid -> (customer, sen)
+        self._shards = [threading.Lock() for _ in range(shards)]
+        self._accounts_lock = threading.Lock()  # hanya untuk membuka akun baru
+        self._ids = itertools.count(1)
+        self._journal = None
+        if journal_path:
+            valid_end = self._recover(journal_path)
+            if os.path.exists(journal_path) and valid_end < os.path.getsize(journal_path):
+                # Buang ekor terpotong agar record baru tidak menempel padanya
+                os.truncate(journal_path, valid_end)
+            self._journal = WalletJournal(journal_path, sync=sync)
+            self._release_orphans()
+
+    def _lock_for(self, customer_id: str) -> threading.Lock:
+        return self._shards[hash(customer_id) % len(self._shards)]
+
+    def _account(self, customer_id: str) -> Account:
+        try:
+            return self._accounts[customer_id]
+        except KeyError:
+            raise WalletError(f"Akun {customer_id} tidak ditemukan") from None
+
+    def _log(self, *fields):
+        if self._journal is not None:
+            self._journal.append(*fields)
+
+    # --- Pemulihan dari journal ---
+    def _recover(self, path: str) -> int:
+        """Membangun ulang state dari journal; mengembalikan offset akhir record utuh."""
+        count = 0
+        last_id = 0
+        records, valid_end = WalletJournal.read(path)
+        for record in records:
+            op = record[0]
+            if op == "OPEN":
+                self._accounts[record[1]] = Account(record[1], int(record[2]))
+            elif op == "DEPOSIT":
+                self._accounts[record[1]].balance += int(record[2])
+            elif op == "RESERVE":
+                rid, customer, sen = int(record[1]), record[2], int(record[3])
+                self._accounts[customer].held += sen
+                self._reservations[rid] = (customer, sen)
+                last_id = max(last_id, rid)
+            elif op in ("COMMIT", "RELEASE"):
+                customer, sen = self._reservations.pop(int(record[1]))
+                account = self._accounts[customer]
+                account.held -= sen
+                if op == "COMMIT":
+                    account.balance -= sen
+            count += 1
+        self._ids = itertools.count(last_id + 1)
+        if count:
+            LOGGER.info("Ledger dipulihkan dari %d record journal (%d akun).", count, len(self._accounts))
+        return valid_end
+
+    def _release_orphans(self):
+        """Reservasi yang belum selesai saat crash dilepas (checkout-nya dianggap tidak selesai).
+
+        Ledger tidak mengenal journal order: jika crash terjadi setelah order
+        ditulis ke journal tetapi sebelum COMMIT, order tersebut tetap tercatat
+        walaupun dananya dilepas di sini (lihat PosApp._checkout_two_phase).
+        """
+        for rid in list(self._reservations):
+            LOGGER.warning("Melepas reservasi menggantung #%d setelah pemulihan.", rid)
+            self.release(rid)
+
+    # --- Operasi akun ---
+    def has_account(self, customer_id: str) -> bool:
+        return customer_id in self._accounts
+
+    def open_account(self, customer_id: str, initial: float = 0):
+        if not customer_id or any(c.isspace() for c in customer_id):
+            raise WalletError(f"customer_id tidak valid: {customer_id!r}")
+        sen = ke_sen(initial)
+        with self._accounts_lock:
+            if customer_id in self._accounts:
+                raise WalletError(f"Akun {customer_id} sudah ada")
+            self._log("OPEN", customer_id, sen)
+            self._accounts[customer_id] = Account(customer_id, sen)
+
+    def deposit(self, customer_id: str, amount: float):
+        sen = ke_sen(amount)
+        if sen <= 0:
+            raise WalletError("Nominal deposit harus positif")
+        with self._lock_for(customer_id):
+            account = self._account(customer_id)
+            self._log("DEPOSIT", customer_id, sen)
+            account.balance += sen
+
+    def balance(self, customer_id: str) -> float:
+        """Saldo tersedia (saldo dikurangi dana yang sedang direservasi)."""
+        with self._lock_for(customer_id):
+            return self._account(customer_id).available / 100
+
+    # --- Pembayaran dua fase ---
+    def reserve(self, customer_id: str, amount: float) -> int:
+        """Menahan dana dan mengembalikan id reservasi.
+
+        Raises:
+            InsufficientFundsError: Jika saldo tersedia kurang dari amount.
+        """
+        sen = ke_sen(amount)
+        if sen <= 0:
+            raise WalletError("Nominal reservasi harus positif")
+        with self._lock_for(customer_id):
+            account = self._account(customer_id)
+            if account.available < sen:
+                raise InsufficientFundsError(
+                    f"Saldo {customer_id} tidak cukup untuk {Rupiah(amount)}")
+            rid = next(self._ids)
+            self._log("RESERVE", rid, customer_id, sen)
+            account.held += sen
+            self._reservations[rid] = (customer_id, sen)
+        return rid
+
+    def commit(self, rid: int):
+        """Memotong saldo sebesar dana yang direservasi."""
+        self._finish(rid, "COMMIT")
+
+    def release(self, rid: int):
+        """Membatalkan reservasi; dana kembali tersedia."""
+        self._finish(rid, "RELEASE")
+
+    def _finish(self, rid: int, op: str):
+        entry = self._reservations.get(rid)
+        if entry is None:
+            raise WalletError(f"Reservasi #{rid} tidak ditemukan")
+        customer_id, sen = entry
+        with self._lock_for(customer_id):
+            # Cek ulang di bawah lock: commit/release ganda dari thread lain
+            if self._reservations.pop(rid, None) is None:
+                raise WalletError(f"Reservasi #{rid} sudah diselesaikan")
+            self._log(op, rid)
+            account = self._accounts[customer_id]
+            account.held -= sen
+            if op == "COMMIT":
+                account.balance -= sen
+
+    @contextmanager
+    def reservation(self, customer_id: str, amount: float):
+        """Reserve di awal blok; commit jika blok selesai, release jika terjadi exception."""
+        rid = self.reserve(customer_id, amount)
+        try:
+            yield rid
+        except BaseException:
+            self.release(rid)
+            raise
+        self.commit(rid)
+
+    def close(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
@@ -0,0 +1,4 @@
+"""Praktikum 14: kalkulator diskon (float, sen integer, dan batch numpy opsional).
+
+numpy baru di-import saat `diskon_services.np` atau batch ndarray dipakai.
+"""
@@ -0,0 +1,42 @@
+# bench_diskon.py
+# Membandingkan jalur float (hitung_diskon) dengan jalur sen integer
+# (hitung_diskon_sen). Jalankan: python -m praktikum14.bench_diskon
+import random
+import timeit
+
+from .diskon_services import DiskonCalculator, ke_sen
+
+JUMLAH_DATA = 100_000
+ULANGAN = 5
+
+
+def siapkan_data(jumlah: int):
+    rng = random.Random(14)
+    harga = [rng.randint(1_000, 15_000_000) for _ in range(jumlah)]
+    persen = [rng.randint(0, 100) for _ in range(jumlah)]
+    return harga, persen
+
+
+def main():
+    calc = DiskonCalculator()
+    harga, persen = siapkan_data(JUMLAH_DATA)
+    harga_sen = [ke_sen(h) for h in harga]
+
+    hitung_float = calc.hitung_diskon
+    hitung_sen = calc.hitung_diskon_sen
+
+    def jalur_float():
+        for h, p in zip(harga, persen):
+            hitung_float(h, p)
+
+    def jalur_sen():
+        for h, p in zip(harga_sen, persen):
+            hitung_sen(h, p)
+
+    for nama, fungsi in (("float", jalur_float), ("sen", jalur_sen)):
+        terbaik = min(timeit.repeat(fungsi, number=1, repeat=ULANGAN))
+        print(f"{nama:>5}: {terbaik * 1e9 / JUMLAH_DATA:8.1f} ns/panggilan")
+
+
+if __name__ == "__main__":
+    main()
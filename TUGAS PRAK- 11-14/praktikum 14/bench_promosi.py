@@ -0,0 +1,87 @@
+# bench_promosi.py
+# Waktu mengevaluasi 1k promosi aktif terhadap keranjang 100 baris:
+# MesinPromosi (index per SKU/kategori) dibandingkan memindai semua
+# promosi untuk setiap keranjang. Pemilihan kombinasi sama untuk keduanya.
+# Jalankan: python -m praktikum14.bench_promosi [--promosi 1000] [--baris 100] [--keranjang 500]
+import argparse
+import random
+import statistics
+import time
+
+from .promosi import (BarisKeranjang, BeliXGratisY, DiskonBertingkat, DiskonKategori, DiskonSku,
+                      MesinPromosi, susun_kandidat)
+
+JUMLAH_SKU = 50_000
+JUMLAH_KATEGORI = 500
+
+
+def buat_promosi(rng: random.Random, jumlah: int, skus: list[str]) -> list:
+    # Promosi cenderung menyasar SKU laris (awal daftar) dan kategori apa pun
+    laris = skus[:2_000]
+    promos = []
+    for i in range(jumlah):
+        jenis = i % 10
+        if jenis < 5:
+            promos.append(DiskonSku(f"SKU-{i}", rng.sample(laris, rng.randint(1, 5)), rng.choice((5, 10, 20))))
+        elif jenis < 7:
+            promos.append(DiskonKategori(f"KAT-{i}", [f"K{rng.randrange(JUMLAH_KATEGORI)}"], rng.choice((5, 10))))
+        elif jenis < 9:
+            promos.append(BeliXGratisY(f"BXGY-{i}", rng.choice(laris), rng.randint(1, 3), 1))
+        else:
+            promos.append(DiskonBertingkat(f"TIER-{i}", [(5, 5), (20, 10), (50, 15)],
+                                           kategori=[f"K{rng.randrange(JUMLAH_KATEGORI)}"]))
+    return promos
+
+
+def buat_keranjang(rng: random.Random, baris: int, skus: list[str], kategori: dict):
+    pilihan = rng.sample(skus[:2_000], baris // 2) + rng.sample(skus[2_000:], baris - baris // 2)
+    return [BarisKeranjang(sku, kategori[sku], rng.randint(10, 5_000) * 100, rng.randint(1, 12))
+            for sku in pilihan]
+
+
+def pindai_semua(promos: list, keranjang, kalkulator) -> list:
+    """Pembanding: setiap promosi memeriksa setiap baris keranjang."""
+    cocok = []
+    for p in promos:
+        rows = [i for i, b in enumerate(keranjang) if p.cocok(b)]
+        if rows:
+            cocok.append((p, rows))
+    return MesinPromosi.pilih(susun_kandidat(cocok, keranjang, kalkulator))
+
+
+def ukur(func, daftar_keranjang) -> list[float]:
+    waktu = []
+    for keranjang in daftar_keranjang:
+        start = time.perf_counter()
+        func(keranjang)
+        waktu.append(time.perf_counter() - start)
+    return sorted(waktu)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--promosi", type=int, default=1_000)
+    parser.add_argument("--baris", type=int, default=100)
+    parser.add_argument("--keranjang", type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(24)
+    skus = [f"SKU{i:06d}" for i in range(JUMLAH_SKU)]
+    kategori = {sku: f"K{i % JUMLAH_KATEGORI}" for i, sku in enumerate(skus)}
+    promos = buat_promosi(rng, args.promosi, skus)
+    mesin = MesinPromosi(promos)
+    daftar_keranjang = [buat_keranjang(rng, args.baris, skus, kategori) for _ in range(args.keranjang)]
+
+    kandidat = statistics.mean(len(mesin.kandidat(k)) for k in daftar_keranjang)
+    print(f"{len(mesin):,} promosi aktif, keranjang {args.baris} baris, "
+          f"rata-rata {kandidat:.1f} kandidat penerapan per keranjang")
+    for label, func in (("index", mesin.terapkan),
+                        ("pindai semua", lambda k: pindai_semua(promos, k, mesin.kalkulator))):
+        w = ukur(func, daftar_keranjang)
+        median = statistics.median(w)
+        print(f"{label:>12}: p50 {median * 1e3:7.3f} ms, p99 {w[int(len(w) * 0.99) - 1] * 1e3:7.3f} ms, "
+              f"{1 / median:>8,.0f} keranjang/detik")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,38 @@
 # diskon_services.py
+import sys
+from array import array
+
+from praktikum_common.money import PEMBULATAN_HALF_EVEN, PEMBULATAN_HALF_UP, bagi_bulat, ke_sen
+
+
+def __getattr__(name):
+    # numpy opsional dan berat; baru di-import saat `np` diakses pertama kali,
+    # sehingga import modul ini tetap ringan. Tanpa numpy, np = None.
+    if name == "np":
+        try:
+            import numpy
+        except ImportError:  # batch tetap jalan dengan array('d')
+            numpy = None
+        globals()["np"] = numpy
+        return numpy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Strategi pembulatan untuk mode sen (integer), lihat praktikum_common.money
+PEMBULATAN_BANKER = PEMBULATAN_HALF_EVEN  # banker's rounding = half-even
+_STRATEGI_PEMBULATAN = frozenset((PEMBULATAN_HALF_UP, PEMBULATAN_HALF_EVEN))
+
+# Tabel pengali dalam basis point (1/10000) untuk persentase 0-100,
+# sehingga jalur cepat cukup perkalian dan pembagian integer.
+BASIS_POINT = 10000
+PENGALI_BP = tuple((100 - persen) * 100 for persen in range(101))
+
+
+def _cek_pembulatan(pembulatan: str) -> str:
+    if pembulatan not in _STRATEGI_PEMBULATAN:
+        raise ValueError(f"Strategi pembulatan tidak dikenal: {pembulatan}")
+    return pembulatan
+
 
 class DiskonCalculator:
     """Menghitung harga akhir setelah diberi diskon."""
@@ -24,3 +58,83 @@ class DiskonCalculator:
             harga_akhir = 0.0
 
         return round(harga_akhir, 2)
+
+    def hitung_diskon_sen(self, harga_sen: int, persentase_diskon: int,
+                          pembulatan: str = PEMBULATAN_HALF_UP) -> int:
+        """Menghitung harga akhir dalam satuan sen tanpa float.
+
+        Args:
+            harga_sen (int): Harga awal dalam sen (lihat ke_sen()).
+            persentase_diskon (int): Persentase diskon bilangan bulat.
+            pembulatan (str): PEMBULATAN_HALF_UP atau PEMBULATAN_HALF_EVEN.
+
+        Returns:
+            int: Harga akhir dalam sen, tidak pernah negatif.
+
+        Raises:
+            ValueError: Jika strategi pembulatan tidak dikenal.
+        """
+        _cek_pembulatan(pembulatan)
+        if harga_sen <= 0:
+            return 0
+
+        if persentase_diskon < 0:
+            persentase_diskon = 0
+        elif persentase_diskon > 100:
+            persentase_diskon = 100
+
+        return bagi_bulat(harga_sen * PENGALI_BP[persentase_diskon], BASIS_POINT, pembulatan)
+
+    def hitung_diskon_batch(self, daftar_harga, daftar_persentase):
+        """Menghitung diskon untuk banyak harga sekaligus.
+
+        Aturan validasi, clamping, dan pembulatan sama persis dengan
+        hitung_diskon(), sehingga hasilnya bit-identik per baris.
+
+        Hanya input numpy.ndarray yang benar-benar divektorisasi. Input
+        lain (array('d'), list) memakai jalur cadangan yang tetap memanggil
+        hitung_diskon() per baris: hasilnya sama, tetapi tidak lebih cepat
+        dari loop biasa. Pakai ndarray jika butuh kecepatan batch.
+
+        Args:
+            daftar_harga: numpy.ndarray atau array('d') berisi harga awal.
+            daftar_persentase: numpy.ndarray atau array berisi persentase diskon.
+
+        Returns:
+            numpy.ndarray (float64) jika input berupa ndarray,
+            selain itu array('d').
+        """
+        if len(daftar_harga) != len(daftar_persentase):
+            raise ValueError("Panjang daftar harga dan persentase harus sama.")
+
+        # ndarray hanya mungkin ada jika pemanggil sudah meng-import numpy
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(daftar_harga, numpy.ndarray):
+            return _hitung_diskon_numpy(daftar_harga, daftar_persentase)
+
+        # Jalur cadangan tanpa numpy: satu panggilan hitung_diskon() per baris,
+        # hanya mengemas hasilnya ke array('d'). Tidak ada percepatan di sini.
+        return array('d', map(self.hitung_diskon, daftar_harga, daftar_persentase))
+
+
+def _hitung_diskon_numpy(daftar_harga, daftar_persentase):
+    """Versi vektor dari hitung_diskon() untuk numpy.ndarray."""
+    import numpy as np
+    harga = np.asarray(daftar_harga, dtype=np.float64)
+    persen = np.clip(np.asarray(daftar_persentase, dtype=np.float64), 0, 100)
+
+    harga_akhir = harga - harga * (persen / 100)
+    harga_akhir[harga_akhir < 0] = 0.0
+    harga_akhir[harga <= 0] = 0.0
+
+    # round() bawaan Python membulatkan nilai desimal eksak, sedangkan
+    # np.round membulatkan hasil perkalian x * 100 yang sudah terpotong.
+    # Keduanya hanya bisa berbeda jika x * 100 sangat dekat ke .5 atau
+    # nilainya terlalu besar, jadi baris tersebut dihitung ulang dengan round().
+    skala = harga_akhir * 100
+    hasil = np.rint(skala) / 100
+    pecahan = skala - np.floor(skala)
+    ragu = (np.abs(pecahan - 0.5) <= np.abs(skala) * 2.0 ** -50) | ~(np.abs(skala) < 2.0 ** 52)
+    for i in np.flatnonzero(ragu):
+        hasil[i] = round(float(harga_akhir[i]), 2)
+    return hasil
@@ -0,0 +1,318 @@
+# promosi.py
+"""Mesin promosi di atas DiskonCalculator.
+
+- Promosi aktif di-index per SKU dan per kategori, sehingga satu keranjang
+  hanya mengevaluasi promosi yang menyentuh baris-barisnya, bukan seluruh
+  promosi yang sedang berjalan.
+- Jenis promosi: diskon per SKU, diskon per kategori, beli X gratis Y, dan
+  diskon bertingkat menurut jumlah unit.
+- Satu baris keranjang hanya boleh terkena satu promosi. Diskon persen
+  (SKU/kategori) bisa dipisah per baris, jadi menjadi kandidat per baris
+  dan hanya yang terbesar per baris yang disimpan. Beli X gratis Y dan
+  diskon bertingkat bergantung pada semua baris yang cocok, jadi tetap
+  satu kandidat utuh. Kandidat yang berbagi baris saling konflik;
+  kombinasi dengan potongan total terbesar dicari per kelompok konflik
+  (eksak untuk kelompok kecil, greedy untuk kelompok besar).
+- Semua nominal dalam sen (int); potongan persentase dihitung lewat
+  DiskonCalculator.hitung_diskon_sen().
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Sequence
+
+from .diskon_services import DiskonCalculator, ke_sen
+
+MAKS_EKSAK = 16  # kelompok konflik lebih besar dari ini diselesaikan secara greedy
+
+
+def _cek_persen(kode: str, persen: int) -> int:
+    if not 0 <= persen <= 100:
+        raise ValueError(f"Promosi {kode}: persen harus di antara 0 dan 100: {persen}")
+    return persen
+
+
+@dataclass(slots=True)
+class BarisKeranjang:
+    """Satu baris keranjang yang dievaluasi mesin promosi."""
+    sku: str
+    kategori: str
+    harga_sen: int
+    jumlah: int
+
+    @property
+    def subtotal_sen(self) -> int:
+        return self.harga_sen * self.jumlah
+
+
+def dari_cart_items(items: Iterable, kategori: Mapping[str, str]) -> list[BarisKeranjang]:
+    """Mengubah CartItem (item.product.id/price, item.quantity) menjadi BarisKeranjang."""
+    return [BarisKeranjang(item.product.id, kategori.get(item.product.id, ""),
+                           ke_sen(item.product.price), item.quantity) for item in items]
+
+
+# --- INTERFACE PROMOSI ---
+class Promosi(ABC):
+    """Kontrak promosi. skus/kategori menentukan baris yang bisa dikenai promosi."""
+    # True jika potongan tiap baris tidak bergantung pada baris lain, sehingga
+    # promosi boleh diterapkan ke sebagian baris yang cocok saja.
+    per_baris = False
+
+    def __init__(self, kode: str, skus: Iterable[str] = (), kategori: Iterable[str] = ()):
+        self.kode = kode
+        self.skus = frozenset(skus)
+        self.kategori = frozenset(kategori)
+        if not self.skus and not self.kategori:
+            raise ValueError(f"Promosi {kode} tidak menyasar SKU atau kategori apa pun")
+
+    def cocok(self, baris: BarisKeranjang) -> bool:
+        return baris.sku in self.skus or baris.kategori in self.kategori
+
+    @abstractmethod
+    def hitung(self, baris: Sequence[BarisKeranjang], kalkulator: DiskonCalculator) -> list[int] | None:
+        """Potongan (sen) per baris yang cocok, atau None jika syarat promosi tidak terpenuhi."""
+
+
+class _DiskonPersen(Promosi):
+    per_baris = True
+
+    def __init__(self, kode: str, persen: int, skus: Iterable[str] = (), kategori: Iterable[str] = ()):
+        super().__init__(kode, skus, kategori)
+        self.persen = _cek_persen(kode, persen)
+
+    def hitung(self, baris, kalkulator):
+        hitung = kalkulator.hitung_diskon_sen
+        persen = self.persen
+        return [b.subtotal_sen - hitung(b.subtotal_sen, persen) for b in baris]
+
+
+class DiskonSku(_DiskonPersen):
+    """Diskon persen untuk satu atau beberapa SKU."""
+    def __init__(self, kode: str, skus: Iterable[str], persen: int):
+        super().__init__(kode, persen, skus=skus)
+
+
+class DiskonKategori(_DiskonPersen):
+    """Diskon persen untuk semua SKU dalam kategori tertentu."""
+    def __init__(self, kode: str, kategori: Iterable[str], persen: int):
+        super().__init__(kode, persen, kategori=kategori)
+
+
+class BeliXGratisY(Promosi):
+    """Setiap pembelian `beli` unit SKU yang sama mendapat `gratis` unit gratis."""
+    def __init__(self, kode: str, sku: str, beli: int, gratis: int):
+        super().__init__(kode, skus=(sku,))
+        if beli <= 0 or gratis <= 0:
+            raise ValueError(f"Promosi {kode}: beli dan gratis harus positif")
+        self.beli = beli
+        self.gratis = gratis
+
+    def hitung(self, baris, kalkulator):
+        paket = self.beli + self.gratis
+        potongan = [b.jumlah // paket * self.gratis * b.harga_sen for b in baris]
+        return potongan if any(potongan) else None
+
+
+class DiskonBertingkat(Promosi):
+    """Diskon persen menurut total unit dari semua baris yang cocok.
+
+    tingkat: [(minimal_unit, persen), ...]; tingkat tertinggi yang tercapai dipakai.
+    """
+    def __init__(self, kode: str, tingkat: Iterable[tuple[int, int]], skus: Iterable[str] = (),
+                 kategori: Iterable[str] = ()):
+        super().__init__(kode, skus, kategori)
+        self.tingkat = sorted(((minimal, _cek_persen(kode, persen)) for minimal, persen in tingkat),
+                              reverse=True)
+        if not self.tingkat:
+            raise ValueError(f"Promosi {kode} tidak punya tingkat")
+
+    def hitung(self, baris, kalkulator):
+        unit = sum(b.jumlah for b in baris)
+        for minimal, persen in self.tingkat:
+            if unit >= minimal:
+                hitung = kalkulator.hitung_diskon_sen
+                return [b.subtotal_sen - hitung(b.subtotal_sen, persen) for b in baris]
+        return None
+
+
+@dataclass(slots=True)
+class Penerapan:
+    """Satu promosi yang diterapkan ke baris-baris keranjang."""
+    kode: str
+    baris: tuple  # indeks baris keranjang
+    potongan: tuple  # sen, sejajar dengan `baris`
+
+    @property
+    def total(self) -> int:
+        return sum(self.potongan)
+
+
+@dataclass(slots=True)
+class HasilPromosi:
+    """Promosi terpilih beserta potongan per baris (sen)."""
+    diterapkan: list
+    potongan_baris: list
+
+    @property
+    def total_potongan(self) -> int:
+        return sum(self.potongan_baris)
+
+
+# --- MESIN PROMOSI ---
+class MesinPromosi:
+    """Index promosi aktif per SKU/kategori dan pemilih kombinasi terbaik."""
+    def __init__(self, promosi: Iterable[Promosi] = (), kalkulator: DiskonCalculator | None = None):
+        self.kalkulator = kalkulator or DiskonCalculator()
+        self._promosi: dict[str, Promosi] = {}
+        self._per_sku: dict[str, list[Promosi]] = {}
+        self._per_kategori: dict[str, list[Promosi]] = {}
+        for p in promosi:
+            self.tambah(p)
+
+    def __len__(self) -> int:
+        return len(self._promosi)
+
+    def tambah(self, promosi: Promosi):
+        """Mengaktifkan promosi; promosi dengan kode sama diganti."""
+        if promosi.kode in self._promosi:
+            self.hapus(promosi.kode)
+        self._promosi[promosi.kode] = promosi
+        for sku in promosi.skus:
+            self._per_sku.setdefault(sku, []).append(promosi)
+        for kategori in promosi.kategori:
+            self._per_kategori.setdefault(kategori, []).append(promosi)
+
+    def hapus(self, kode: str):
+        promosi = self._promosi.pop(kode, None)
+        if promosi is None:
+            return
+        for index, kunci in ((self._per_sku, promosi.skus), (self._per_kategori, promosi.kategori)):
+            for k in kunci:
+                sisa = [p for p in index[k] if p is not promosi]
+                if sisa:
+                    index[k] = sisa
+                else:
+                    del index[k]
+
+    def kandidat(self, baris: Sequence[BarisKeranjang]) -> list[Penerapan]:
+        """Semua promosi yang berlaku untuk keranjang, hanya lewat index."""
+        cocok: dict[str, tuple[Promosi, list[int]]] = {}
+        kosong = ()
+        for i, b in enumerate(baris):
+            promos = self._per_sku.get(b.sku, kosong)
+            lain = self._per_kategori.get(b.kategori, kosong)
+            for p in (promos + lain if promos and lain else promos or lain):
+                entry = cocok.get(p.kode)
+                if entry is None:
+                    cocok[p.kode] = (p, [i])
+                elif entry[1][-1] != i:  # SKU dan kategori bisa cocok untuk baris yang sama
+                    entry[1].append(i)
+
+        return susun_kandidat(cocok.values(), baris, self.kalkulator)
+
+    @staticmethod
+    def pilih(kandidat: list[Penerapan]) -> list[Penerapan]:
+        """Kombinasi kandidat tanpa baris bersama dengan potongan total terbesar."""
+        terpilih = []
+        for kelompok in _kelompok_konflik(kandidat):
+            terpilih += _pilih_eksak(kelompok) if len(kelompok) <= MAKS_EKSAK else _pilih_greedy(kelompok)
+        return terpilih
+
+    def terapkan(self, baris: Sequence[BarisKeranjang]) -> HasilPromosi:
+        """Memilih kombinasi promosi tanpa konflik dengan potongan total terbesar."""
+        terpilih = self.pilih(self.kandidat(baris))
+        potongan_baris = [0] * len(baris)
+        for penerapan in terpilih:
+            for i, potongan in zip(penerapan.baris, penerapan.potongan):
+                potongan_baris[i] = potongan
+        return HasilPromosi(terpilih, potongan_baris)
+
+
+def susun_kandidat(cocok: Iterable[tuple[Promosi, list[int]]], baris: Sequence[BarisKeranjang],
+                   kalkulator: DiskonCalculator) -> list[Penerapan]:
+    """Menghitung kandidat Penerapan dari pasangan (promosi, indeks baris yang cocok).
+
+    Promosi per_baris dipecah menjadi kandidat satu baris; per baris cukup
+    disimpan yang potongannya terbesar, karena kandidat satu baris lain di
+    baris yang sama selalu bisa ditukar dengannya tanpa menambah konflik.
+    """
+    hasil = []
+    terbaik: dict[int, Penerapan] = {}
+    for p, rows in cocok:
+        potongan = p.hitung([baris[i] for i in rows], kalkulator)
+        if not potongan or not any(potongan):
+            continue
+        if not p.per_baris:
+            hasil.append(Penerapan(p.kode, tuple(rows), tuple(potongan)))
+            continue
+        for i, nilai in zip(rows, potongan):
+            lama = terbaik.get(i)
+            if nilai and (lama is None or nilai > lama.potongan[0]):
+                terbaik[i] = Penerapan(p.kode, (i,), (nilai,))
+    hasil += (terbaik[i] for i in sorted(terbaik))
+    return hasil
+
+
+# --- PEMILIHAN KOMBINASI ---
+def _kelompok_konflik(kandidat: list[Penerapan]) -> list[list[Penerapan]]:
+    """Memisahkan kandidat menjadi kelompok yang saling terhubung lewat baris bersama."""
+    induk = list(range(len(kandidat)))
+
+    def akar(x: int) -> int:
+        while induk[x] != x:
+            induk[x] = induk[induk[x]]
+            x = induk[x]
+        return x
+
+    pemilik: dict[int, int] = {}
+    for k, penerapan in enumerate(kandidat):
+        for i in penerapan.baris:
+            lain = pemilik.setdefault(i, k)
+            if lain != k:
+                induk[akar(k)] = akar(lain)
+    kelompok: dict[int, list[Penerapan]] = {}
+    for k, penerapan in enumerate(kandidat):
+        kelompok.setdefault(akar(k), []).append(penerapan)
+    return list(kelompok.values())
+
+
+def _masker(penerapan: Penerapan) -> int:
+    m = 0
+    for i in penerapan.baris:
+        m |= 1 << i
+    return m
+
+
+def _pilih_greedy(kelompok: list[Penerapan]) -> list[Penerapan]:
+    terpilih, terpakai = [], 0
+    for penerapan in sorted(kelompok, key=lambda p: p.total, reverse=True):
+        m = _masker(penerapan)
+        if not m & terpakai:
+            terpilih.append(penerapan)
+            terpakai |= m
+    return terpilih
+
+
+def _pilih_eksak(kelompok: list[Penerapan]) -> list[Penerapan]:
+    """Branch and bound: kandidat terbesar dulu, pangkas jika sisa tak bisa menyalip."""
+    if len(kelompok) == 1:
+        return kelompok
+    urut = sorted(kelompok, key=lambda p: p.total, reverse=True)
+    nilai = [p.total for p in urut]
+    masker = [_masker(p) for p in urut]
+    sisa = [0] * (len(urut) + 1)
+    for k in range(len(urut) - 1, -1, -1):
+        sisa[k] = sisa[k + 1] + nilai[k]
+
+    terbaik = [0, ()]
+
+    def cari(k: int, terpakai: int, total: int, dipilih: tuple):
+        if total > terbaik[0]:
+            terbaik[0], terbaik[1] = total, dipilih
+        if k == len(urut) or total + sisa[k] <= terbaik[0]:
+            return
+        if not masker[k] & terpakai:
+            cari(k + 1, terpakai | masker[k], total + nilai[k], dipilih + (k,))
+        cari(k + 1, terpakai, total, dipilih)
+
+    cari(0, 0, 0, ())
+    return [urut[k] for k in terbaik[1]]
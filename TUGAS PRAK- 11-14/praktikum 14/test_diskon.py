@@ -1,6 +1,9 @@
 # test_diskon.py
 import unittest
-from diskon_services import DiskonCalculator
+import random
+from array import array
+from .diskon_services import (DiskonCalculator, np, ke_sen,
+                             PEMBULATAN_HALF_UP, PEMBULATAN_HALF_EVEN, PEMBULATAN_BANKER)
 
 class TestDiskonCalculator(unittest.TestCase):
     def setUp(self):
@@ -53,5 +56,112 @@ class TestDiskonLanjut(unittest.TestCase):
         self.assertEqual(hasil, 900.0)
 
 
+class _BatchCalculator:
+    """Adapter agar kasus uji scalar dijalankan lewat hitung_diskon_batch()."""
+    def __init__(self):
+        self.calc = DiskonCalculator()
+
+    def hitung_diskon(self, harga_awal, persentase_diskon):
+        hasil = self.calc.hitung_diskon_batch(array('d', [harga_awal]), array('d', [persentase_diskon]))
+        return hasil[0]
+
+
+class _NumpyBatchCalculator(_BatchCalculator):
+    def hitung_diskon(self, harga_awal, persentase_diskon):
+        hasil = self.calc.hitung_diskon_batch(np.array([harga_awal], dtype=float), np.array([persentase_diskon]))
+        return float(hasil[0])
+
+
+class TestDiskonCalculatorBatch(TestDiskonCalculator):
+    def setUp(self):
+        self.calc = _BatchCalculator()
+
+
+class TestDiskonLanjutBatch(TestDiskonLanjut):
+    def setUp(self):
+        self.calc = _BatchCalculator()
+
+
+@unittest.skipIf(np is None, "numpy tidak terpasang")
+class TestDiskonCalculatorNumpy(TestDiskonCalculator):
+    def setUp(self):
+        self.calc = _NumpyBatchCalculator()
+
+
+@unittest.skipIf(np is None, "numpy tidak terpasang")
+class TestDiskonLanjutNumpy(TestDiskonLanjut):
+    def setUp(self):
+        self.calc = _NumpyBatchCalculator()
+
+
+class TestDiskonBatchIdentik(unittest.TestCase):
+    def setUp(self):
+        self.calc = DiskonCalculator()
+        rng = random.Random(14)
+        self.harga = [rng.choice([-10, 0, 0.005, 999, 15000000]) + rng.random() * 10 ** rng.randint(0, 8)
+                      for _ in range(20000)]
+        self.harga += [0.125, 1.005, 2.675, 1e17, -5.0]
+        self.persen = [rng.randint(-20, 130) for _ in self.harga]
+        self.expected = [self.calc.hitung_diskon(h, p) for h, p in zip(self.harga, self.persen)]
+
+    def test_batch_array_identik_dengan_scalar(self):
+        """Tes 9: Batch array('d') bit-identik dengan hitung_diskon()."""
+        hasil = self.calc.hitung_diskon_batch(array('d', self.harga), array('d', self.persen))
+        self.assertIsInstance(hasil, array)
+        self.assertEqual(list(hasil), self.expected)
+
+    @unittest.skipIf(np is None, "numpy tidak terpasang")
+    def test_batch_numpy_identik_dengan_scalar(self):
+        """Tes 10: Batch numpy bit-identik dengan hitung_diskon()."""
+        hasil = self.calc.hitung_diskon_batch(np.array(self.harga), np.array(self.persen))
+        self.assertEqual(hasil.tolist(), self.expected)
+
+    def test_panjang_berbeda(self):
+        """Tes 11: Panjang input berbeda ditolak."""
+        with self.assertRaises(ValueError):
+            self.calc.hitung_diskon_batch(array('d', [1000]), array('d', [10, 20]))
+
+
+class TestDiskonSen(unittest.TestCase):
+    def setUp(self):
+        self.calc = DiskonCalculator()
+
+    def test_ke_sen(self):
+        """Tes 12: Konversi harga ke sen tanpa drift float."""
+        self.assertEqual(ke_sen(15000000), 1500000000)
+        self.assertEqual(ke_sen(0.1), 10)
+        self.assertEqual(ke_sen("669.335"), 66934)
+
+    def test_sama_dengan_float_untuk_kasus_standar(self):
+        """Tes 13: Mode sen sama dengan mode float pada kasus standar."""
+        for harga, persen in [(1000, 10), (500, 0), (750, 100), (500, -5), (999, 33), (0, 50), (400, 150)]:
+            hasil = self.calc.hitung_diskon_sen(ke_sen(harga), persen)
+            self.assertEqual(hasil, ke_sen(self.calc.hitung_diskon(harga, persen)))
+
+    def test_laptop_gaming_eksak(self):
+        """Tes 14: Harga skala jutaan rupiah tetap eksak."""
+        hasil = self.calc.hitung_diskon_sen(ke_sen(15000000) * 1000, 33)
+        self.assertEqual(hasil, 1005000000000)
+
+    def test_strategi_pembulatan(self):
+        """Tes 15: Half-up vs half-even pada nilai tepat setengah sen."""
+        # 50 sen diskon 1% = 49.5 sen, 150 sen diskon 1% = 148.5 sen
+        self.assertEqual(self.calc.hitung_diskon_sen(50, 1, PEMBULATAN_HALF_UP), 50)
+        self.assertEqual(self.calc.hitung_diskon_sen(50, 1, PEMBULATAN_HALF_EVEN), 50)
+        self.assertEqual(self.calc.hitung_diskon_sen(150, 1, PEMBULATAN_HALF_UP), 149)
+        self.assertEqual(self.calc.hitung_diskon_sen(150, 1, PEMBULATAN_BANKER), 148)
+
+    def test_strategi_tidak_dikenal(self):
+        """Tes 16: Strategi pembulatan tidak dikenal ditolak."""
+        with self.assertRaises(ValueError):
+            self.calc.hitung_diskon_sen(150, 1, "ceil")
+
+    def test_strategi_tidak_dikenal_tanpa_seri(self):
+        """Tes 17: Strategi tidak dikenal ditolak meski hasilnya bukan tepat setengah sen."""
+        for harga_sen in (100000, 0, -5):
+            with self.assertRaises(ValueError):
+                self.calc.hitung_diskon_sen(harga_sen, 10, "ceil")
+
+
 if __name__ == '__main__':
     unittest.main()
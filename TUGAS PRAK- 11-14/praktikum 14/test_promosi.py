@@ -0,0 +1,145 @@
+# test_promosi.py
+import itertools
+import random
+import unittest
+from types import SimpleNamespace
+from .diskon_services import DiskonCalculator
+from .promosi import (BarisKeranjang, BeliXGratisY, DiskonBertingkat, DiskonKategori, DiskonSku,
+                      MesinPromosi, dari_cart_items)
+
+
+def baris(sku, kategori, harga_sen, jumlah):
+    return BarisKeranjang(sku, kategori, harga_sen, jumlah)
+
+
+def brute_force(promos, keranjang) -> int:
+    """Semua subset promosi utuh yang tidak konflik; baris sisanya diberi diskon persen terbaik."""
+    kalkulator = DiskonCalculator()
+    utuh, per_baris = [], [0] * len(keranjang)
+    for p in promos:
+        rows = [i for i, b in enumerate(keranjang) if p.cocok(b)]
+        potongan = p.hitung([keranjang[i] for i in rows], kalkulator) if rows else None
+        if not potongan:
+            continue
+        if isinstance(p, (DiskonSku, DiskonKategori)):
+            for i, nilai in zip(rows, potongan):
+                per_baris[i] = max(per_baris[i], nilai)
+        else:
+            utuh.append((set(rows), sum(potongan)))
+    terbaik = 0
+    for r in range(len(utuh) + 1):
+        for subset in itertools.combinations(utuh, r):
+            rows = [i for baris_promo, _ in subset for i in baris_promo]
+            if len(rows) == len(set(rows)):
+                sisa = sum(nilai for i, nilai in enumerate(per_baris) if i not in rows)
+                terbaik = max(terbaik, sum(total for _, total in subset) + sisa)
+    return terbaik
+
+
+class TestMesinPromosi(unittest.TestCase):
+    def setUp(self):
+        self.keranjang = [
+            baris("KOPI", "minuman", 10_000, 3),
+            baris("TEH", "minuman", 5_000, 4),
+            baris("ROTI", "makanan", 20_000, 1),
+        ]
+
+    def test_jenis_promosi(self):
+        """Tes 1: Potongan tiap jenis promosi dihitung benar (sen)."""
+        def potongan(promo):
+            return MesinPromosi([promo]).terapkan(self.keranjang).potongan_baris
+
+        self.assertEqual(potongan(DiskonSku("A", ["KOPI"], 10)), [3_000, 0, 0])
+        self.assertEqual(potongan(DiskonKategori("B", ["minuman"], 50)), [15_000, 10_000, 0])
+        self.assertEqual(potongan(BeliXGratisY("C", "TEH", beli=1, gratis=1)), [0, 10_000, 0])
+        self.assertEqual(potongan(BeliXGratisY("D", "KOPI", beli=3, gratis=1)), [0, 0, 0])
+        tingkat = [(5, 10), (7, 20)]
+        self.assertEqual(potongan(DiskonBertingkat("E", tingkat, kategori=["minuman"])), [6_000, 4_000, 0])
+        self.assertEqual(potongan(DiskonBertingkat("F", tingkat, skus=["TEH"])), [0, 0, 0])
+
+    def test_hanya_promosi_terindex_yang_dievaluasi(self):
+        """Tes 2: Promosi untuk SKU/kategori lain tidak pernah dihitung."""
+        dihitung = []
+
+        class Pencatat(DiskonSku):
+            def hitung(self, baris, kalkulator):
+                dihitung.append(self.kode)
+                return super().hitung(baris, kalkulator)
+
+        mesin = MesinPromosi(Pencatat(f"X{i}", [f"SKU{i}"], 10) for i in range(1000))
+        mesin.tambah(Pencatat("KOPI10", ["KOPI"], 10))
+        hasil = mesin.terapkan(self.keranjang)
+        self.assertEqual(dihitung, ["KOPI10"])
+        self.assertEqual([p.kode for p in hasil.diterapkan], ["KOPI10"])
+
+    def test_kombinasi_terbaik_tanpa_konflik(self):
+        """Tes 3: Satu baris satu promosi; kombinasi dengan potongan terbesar dipilih."""
+        mesin = MesinPromosi([
+            DiskonKategori("MINUMAN20", ["minuman"], 20),   # 6.000 + 4.000
+            DiskonSku("KOPI30", ["KOPI"], 30),              # 9.000
+            BeliXGratisY("TEH-B1G1", "TEH", 1, 1),          # 10.000
+            DiskonSku("ROTI5", ["ROTI"], 5),                # 1.000
+        ])
+        hasil = mesin.terapkan(self.keranjang)
+        self.assertEqual(sorted(p.kode for p in hasil.diterapkan), ["KOPI30", "ROTI5", "TEH-B1G1"])
+        self.assertEqual(hasil.total_potongan, 20_000)
+
+    def test_sama_dengan_brute_force(self):
+        """Tes 4: Hasil sama dengan mencoba semua subset promosi pada keranjang acak."""
+        rng = random.Random(24)
+        skus = [f"S{i}" for i in range(12)]
+        kategori = {sku: f"K{i % 3}" for i, sku in enumerate(skus)}
+        for _ in range(40):
+            promos = []
+            for i in range(rng.randint(1, 10)):
+                jenis = rng.randrange(4)
+                if jenis == 0:
+                    promos.append(DiskonSku(f"P{i}", rng.sample(skus, 2), rng.randint(5, 50)))
+                elif jenis == 1:
+                    promos.append(DiskonKategori(f"P{i}", [f"K{rng.randrange(3)}"], rng.randint(5, 30)))
+                elif jenis == 2:
+                    promos.append(BeliXGratisY(f"P{i}", rng.choice(skus), rng.randint(1, 3), 1))
+                else:
+                    promos.append(DiskonBertingkat(f"P{i}", [(3, 10), (8, 25)], kategori=[f"K{rng.randrange(3)}"]))
+            keranjang = [baris(sku, kategori[sku], rng.randint(1, 100) * 1000, rng.randint(1, 6))
+                         for sku in rng.sample(skus, 6)]
+            mesin = MesinPromosi(promos)
+            self.assertEqual(mesin.terapkan(keranjang).total_potongan, brute_force(promos, keranjang))
+
+    def test_tambah_hapus_dan_cart_items(self):
+        """Tes 5: Promosi bisa diganti/dihapus; CartItem diubah lewat dari_cart_items()."""
+        mesin = MesinPromosi([DiskonSku("A", ["KOPI"], 10)])
+        mesin.tambah(DiskonSku("A", ["TEH"], 10))
+        self.assertEqual(mesin.terapkan(self.keranjang).potongan_baris, [0, 2_000, 0])
+        mesin.hapus("A")
+        self.assertEqual(len(mesin), 0)
+        self.assertEqual(mesin.terapkan(self.keranjang).total_potongan, 0)
+
+        item = SimpleNamespace(product=SimpleNamespace(id="KOPI", price=100.5), quantity=2)
+        self.assertEqual(dari_cart_items([item], {"KOPI": "minuman"}),
+                         [baris("KOPI", "minuman", 10_050, 2)])
+
+    def test_diskon_persen_dipilih_per_baris(self):
+        """Tes 6: Diskon persen yang tumpang tindih dipilih per baris, bukan utuh."""
+        mesin = MesinPromosi([DiskonSku("KOPI30", ["KOPI"], 30),
+                              DiskonKategori("MINUMAN20", ["minuman"], 20)])
+        hasil = mesin.terapkan(self.keranjang[:2])
+        self.assertEqual(hasil.potongan_baris, [9_000, 4_000])
+        self.assertEqual(hasil.total_potongan, 13_000)
+        self.assertEqual([(p.kode, p.baris) for p in hasil.diterapkan],
+                         [("KOPI30", (0,)), ("MINUMAN20", (1,))])
+
+    def test_persen_tidak_valid(self):
+        """Tes 7: Persen di luar 0-100 ditolak, termasuk pada tingkat diskon."""
+        with self.assertRaises(ValueError):
+            DiskonSku("A", ["KOPI"], 250)
+        with self.assertRaises(ValueError):
+            DiskonKategori("B", ["minuman"], -5)
+        with self.assertRaises(ValueError):
+            DiskonBertingkat("C", [(5, 10), (10, 120)], skus=["TEH"])
+        self.assertEqual(DiskonBertingkat("D", [(5, 10), (10, 100)], skus=["TEH"]).tingkat,
+                         [(10, 100), (5, 10)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,7 @@
+"""Modul bersama praktikum 12 dan 13: facade logging dan metrik.
+
+Satu salinan dipakai oleh kedua paket (`from praktikum_common.log_facade
+import get_logger`), sehingga konfigurasi logging dan registry metrik
+tidak bercabang. Jalankan program dari folder "TUGAS PRAK- 11-14" atau
+pasang paketnya agar `praktikum_common` bisa di-import.
+"""
@@ -0,0 +1,88 @@
+# log_facade.py
+"""Facade logging bersama untuk modul checkout, registrasi, dan POS.
+
+Aturan pemakaian:
+- Gunakan argumen gaya `%` (LOGGER.info("Total %s", Rupiah(total))), bukan
+  f-string, supaya pesan hanya diformat jika level-nya aktif.
+- Untuk argumen yang mahal dihitung atau loop log, bungkus dengan
+  `if LOGGER.isEnabledFor(logging.INFO):`.
+- setup_logging(non_blocking=True) memindahkan I/O log ke thread
+  QueueListener, sehingga thread request hanya memasukkan record ke antrean.
+"""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
+DEFAULT_FORMAT = "%(name)s - %(levelname)s - %(message)s"
+
+_listener: QueueListener | None = None
+
+
+class Rupiah:
+    """Argumen log yang baru diformat sebagai 'Rp1,000' saat record ditulis."""
+    __slots__ = ("amount",)
+
+    def __init__(self, amount: float):
+        self.amount = amount
+
+    def __str__(self) -> str:
+        return f"Rp{self.amount:,.0f}"
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Mengambil logger standar; formatting tetap ditunda oleh modul logging."""
+    return logging.getLogger(name)
+
+
+def setup_logging(level: int = logging.INFO, fmt: str = DEFAULT_FORMAT,
+                  non_blocking: bool = False) -> QueueListener | None:
+    """
+    Mengonfigurasi root logger. Dipanggil dari titik masuk program,
+    bukan saat modul di-import.
+
+    Args:
+        level (int): Level minimum log.
+        fmt (str): Format pesan.
+        non_blocking (bool): Jika True, handler di root hanya QueueHandler
+            dan penulisan ke stderr dilakukan thread QueueListener.
+
+    Returns:
+        QueueListener | None: Listener aktif (jika non_blocking).
+    """
+    global _listener
+    stop_logging()
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.setLevel(level)
+
+    stream = logging.StreamHandler()
+    stream.setFormatter(logging.Formatter(fmt))
+    if not non_blocking:
+        root.addHandler(stream)
+        return None
+
+    # logging.handlers cukup berat (socket, pickle); hanya dimuat jika dipakai
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging() -> None:
+    """Menghentikan QueueListener (jika ada) setelah antrean dikosongkan."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
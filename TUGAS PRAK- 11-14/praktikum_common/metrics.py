@@ -0,0 +1,159 @@
+# metrics.py
+"""Instrumentasi ringan: counter, timer, dan histogram latensi.
+
+Aktifkan dengan environment variable POS_METRICS=1 sebelum program
+dijalankan. Jika tidak aktif, decorator timed() mengembalikan fungsi asli
+tanpa pembungkus dan komponen tidak membungkus dependency-nya, sehingga
+tidak ada biaya sama sekali pada hot path.
+
+Counter dan Histogram dijaga lock masing-masing karena dicatat dari
+thread pool (rule paralel, worker checkout).
+"""
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Dict, Tuple
+
+ENABLED = os.environ.get("POS_METRICS", "") not in ("", "0")
+
+# Batas bucket histogram (detik): 1us .. ~17s, naik kelipatan 2
+BUCKETS = tuple(1e-6 * 2 ** i for i in range(25))
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Counter:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    """Histogram bucket tetap; kuantil diperkirakan dari batas atas bucket."""
+    __slots__ = ("counts", "count", "sum", "_lock")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        bucket = bisect_left(BUCKETS, value)
+        with self._lock:
+            self.counts[bucket] += 1
+            self.count += 1
+            self.sum += value
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return BUCKETS[i] if i < len(BUCKETS) else float("inf")
+        return float("inf")
+
+
+class MetricsRegistry:
+    """Kumpulan metrik berlabel yang bisa diekspor ke format teks Prometheus."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Labels], Counter] = {}
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+
+    def counter(self, name: str, **labels: str) -> Counter:
+        key = (name, tuple(sorted(labels.items())))
+        metric = self._counters.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._counters.setdefault(key, Counter())
+        return metric
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        key = (name, tuple(sorted(labels.items())))
+        metric = self._histograms.get(key)
+        if metric is None:
+            with self._lock:
+                metric = self._histograms.setdefault(key, Histogram())
+        return metric
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def to_prometheus(self) -> str:
+        """Snapshot seluruh metrik dalam format teks Prometheus."""
+        lines = []
+        for (name, labels), metric in sorted(self._counters.items()):
+            lines.append(f"{name}{_fmt_labels(labels)} {metric.value}")
+        for (name, labels), metric in sorted(self._histograms.items()):
+            cumulative = 0
+            for bound, n in zip(BUCKETS, metric.counts):
+                cumulative += n
+                lines.append(f"{name}_bucket{_fmt_labels(labels + (('le', f'{bound:.6g}'),))} {cumulative}")
+            lines.append(f"{name}_bucket{_fmt_labels(labels + (('le', '+Inf'),))} {metric.count}")
+            lines.append(f"{name}_sum{_fmt_labels(labels)} {metric.sum:.9f}")
+            lines.append(f"{name}_count{_fmt_labels(labels)} {metric.count}")
+            for q in (0.5, 0.95, 0.99):
+                lines.append(f"{name}_quantile{_fmt_labels(labels + (('quantile', str(q)),))} "
+                             f"{metric.quantile(q):.6g}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str | None = None):
+        """Menulis snapshot ke file (atomik) atau ke stdout jika path None."""
+        text = self.to_prometheus()
+        if path is None:
+            sys.stdout.write(text)
+            return
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+
+def _fmt_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def timed(name: str, **labels: str):
+    """
+    Decorator pencatat latensi (histogram `name`) dan jumlah error
+    (counter `name`_errors_total). Tanpa biaya jika metrik tidak aktif.
+    """
+    def decorator(func):
+        if not ENABLED:
+            return func
+        histogram = REGISTRY.histogram(name, **labels)
+        errors = REGISTRY.counter(f"{name}_errors_total", **labels)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                errors.inc()
+                raise
+            finally:
+                histogram.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
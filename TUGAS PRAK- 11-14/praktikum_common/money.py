@@ -0,0 +1,43 @@
+# money.py
+"""Konversi nominal rupiah ke sen (int) dan pembagian sen yang dipakai bersama semua praktikum."""
+from decimal import Decimal, ROUND_HALF_UP
+
+# Strategi pembulatan untuk pembagian sen (integer)
+PEMBULATAN_HALF_UP = "half_up"
+PEMBULATAN_HALF_EVEN = "half_even"
+
+
+def ke_sen(harga) -> int:
+    """Mengubah harga (int, str, Decimal, atau float) ke satuan sen.
+
+    Float diubah lewat repr-nya agar 0.1 dibaca sebagai 10 sen,
+    bukan nilai biner terdekatnya. Setengah sen dibulatkan ke atas.
+    """
+    if isinstance(harga, int):
+        return harga * 100
+    if isinstance(harga, float):
+        sen = harga * 100
+        bulat = round(sen)
+        # Jauh dari setengah sen, galat float (< 1e-3 sen di bawah 1e12 sen)
+        # tidak bisa mengubah hasil: jalur Decimal yang mahal tidak perlu.
+        if abs(sen) < 1e12 and abs(abs(sen - bulat) - 0.5) > 1e-3:
+            return bulat
+        harga = repr(harga)
+    return int(Decimal(harga).scaleb(2).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def bagi_bulat(pembilang: int, penyebut: int, pembulatan: str = PEMBULATAN_HALF_UP) -> int:
+    """Pembagian integer non-negatif dengan strategi pembulatan tertentu.
+
+    Nilai `pembulatan` selain PEMBULATAN_HALF_EVEN diperlakukan sebagai
+    half-up; validasi strategi adalah tugas pemanggil.
+    """
+    hasil, sisa = divmod(pembilang, penyebut)
+    sisa2 = sisa * 2
+    if sisa2 > penyebut:
+        return hasil + 1
+    if sisa2 == penyebut:
+        if pembulatan == PEMBULATAN_HALF_EVEN:
+            return hasil + (hasil & 1)
+        return hasil + 1
+    return hasil
@@ -0,0 +1,52 @@
+# test_metrics.py
+import sys
+import threading
+import unittest
+from .metrics import BUCKETS, MetricsRegistry
+
+
+class TestMetrics(unittest.TestCase):
+    def test_counter_dan_histogram_aman_antar_thread(self):
+        """Tes 1: inc()/observe() dari banyak thread tidak kehilangan update."""
+        registry = MetricsRegistry()
+        counter = registry.counter("rule_failed_total", rule="SksLimitRule")
+        histogram = registry.histogram("rule_seconds", rule="SksLimitRule")
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # paksa pergantian thread sesering mungkin
+        self.addCleanup(sys.setswitchinterval, interval)
+
+        def kerja():
+            for _ in range(20_000):
+                counter.inc()
+                histogram.observe(3e-6)
+
+        threads = [threading.Thread(target=kerja) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(counter.value, 160_000)
+        self.assertEqual(histogram.count, 160_000)
+        self.assertEqual(sum(histogram.counts), 160_000)
+        self.assertIs(registry.counter("rule_failed_total", rule="SksLimitRule"), counter)
+
+    def test_export_prometheus(self):
+        """Tes 2: Snapshot teks Prometheus memuat counter, bucket kumulatif, dan kuantil."""
+        registry = MetricsRegistry()
+        registry.counter("payment_total", processor="Cash", result="success").inc(3)
+        histogram = registry.histogram("payment_seconds", processor="Cash")
+        for value in (1e-6, 3e-6, 3e-6, 100.0):
+            histogram.observe(value)
+        text = registry.to_prometheus()
+        self.assertIn('payment_total{processor="Cash",result="success"} 3\n', text)
+        self.assertIn('payment_seconds_bucket{processor="Cash",le="1e-06"} 1\n', text)
+        self.assertIn('payment_seconds_bucket{processor="Cash",le="4e-06"} 3\n', text)
+        self.assertIn('payment_seconds_bucket{processor="Cash",le="+Inf"} 4\n', text)
+        self.assertIn('payment_seconds_count{processor="Cash"} 4\n', text)
+        self.assertIn('payment_seconds_quantile{processor="Cash",quantile="0.5"} 4e-06\n', text)
+        self.assertEqual(histogram.quantile(0.99), float("inf"))
+        self.assertGreater(100.0, BUCKETS[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
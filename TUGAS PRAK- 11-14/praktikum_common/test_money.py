@@ -0,0 +1,26 @@
+# test_money.py
+import random
+import unittest
+from decimal import Decimal, ROUND_HALF_UP
+from .money import PEMBULATAN_HALF_EVEN, bagi_bulat, ke_sen
+
+
+class TestMoney(unittest.TestCase):
+    def test_ke_sen_sama_dengan_decimal(self):
+        """Tes 1: Jalur cepat float ke_sen() sama dengan Decimal(repr(harga)) half-up."""
+        rng = random.Random(31)
+        for _ in range(20_000):
+            harga = rng.choice((rng.randint(0, 10 ** 9) / 1000, rng.randint(0, 10 ** 12) / 100,
+                                rng.uniform(-1e10, 1e10), rng.randint(0, 10 ** 8) / 200))
+            expected = int(Decimal(repr(harga)).scaleb(2).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+            self.assertEqual(ke_sen(harga), expected)
+        self.assertEqual((ke_sen(1.005), ke_sen(0.125), ke_sen(2.675)), (101, 13, 268))
+
+    def test_bagi_bulat(self):
+        """Tes 2: Setengah dibulatkan ke atas, atau ke genap untuk PEMBULATAN_HALF_EVEN."""
+        self.assertEqual([bagi_bulat(x, 100) for x in (49, 50, 150, 151)], [0, 1, 2, 2])
+        self.assertEqual([bagi_bulat(x, 100, PEMBULATAN_HALF_EVEN) for x in (50, 150, 250)], [0, 2, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()